@@ -1,12 +1,13 @@
 # File: ytget_gui/dialogs/advanced.py
 from __future__ import annotations
 
-from typing import Optional, List, Tuple
+from typing import TYPE_CHECKING, Optional, List, Tuple
 
 from PySide6 import QtCore, QtGui, QtWidgets
 
-from ytget_gui.styles import AppStyles
-from ytget_gui.settings import AppSettings
+if TYPE_CHECKING:
+    # Only needed for annotations; avoids importing settings at module load
+    from ytget_gui.settings import AppSettings
 
 
 # ----------------------------
@@ -52,12 +53,50 @@ def _tint(color: QtGui.QColor, factor: float) -> QtGui.QColor:
 # being rebuilt (and re-parsed by the regex engine) each time the dialog is
 # opened. QRegularExpression is safe to share across QRegularExpressionValidator
 # instances since it's copy-on-write and read-only once matched.
-_TIME_PATTERN = r"^(?:\d+|(?:\d{1,3}:)?[0-5]?\d:[0-5]\d)$"
+_TIME_PATTERN = r"^(?:\d+|(?:\d{1,3}:)?[0-5]?\d:[0-5]\d)(?:\.\d+)?$"
 _TIME_RX = QtCore.QRegularExpression(_TIME_PATTERN)
 
 _PLAYLIST_PATTERN = r"^\s*\d+\s*(?:-\s*\d+\s*)?(?:\s*,\s*\d+\s*(?:-\s*\d+\s*)?)*\s*$"
 _PLAYLIST_RX = QtCore.QRegularExpression(_PLAYLIST_PATTERN)
 
+# The validator objects themselves are shared too. They are created on first
+# use (not at import) and parented to the QApplication so they outlive any
+# single dialog; QLineEdit.setValidator() does not take ownership.
+_TIME_VALIDATOR: Optional[QtGui.QRegularExpressionValidator] = None
+_PLAYLIST_VALIDATOR: Optional[QtGui.QRegularExpressionValidator] = None
+
+
+def _shared_validators() -> Tuple[QtGui.QRegularExpressionValidator, QtGui.QRegularExpressionValidator]:
+    global _TIME_VALIDATOR, _PLAYLIST_VALIDATOR
+    if _TIME_VALIDATOR is None or _PLAYLIST_VALIDATOR is None:
+        owner = QtCore.QCoreApplication.instance()
+        _TIME_VALIDATOR = QtGui.QRegularExpressionValidator(_TIME_RX, owner)
+        _PLAYLIST_VALIDATOR = QtGui.QRegularExpressionValidator(_PLAYLIST_RX, owner)
+    return _TIME_VALIDATOR, _PLAYLIST_VALIDATOR
+
+
+def _parse_playlist_items(spec: str) -> Optional[List[Tuple[int, int]]]:
+    """
+    Parse "5, 1-3, 10" into (start, end) ranges, kept in the order typed
+    (yt-dlp downloads --playlist-items in that order).
+    Returns None if any part is malformed, non-positive or descending.
+    """
+    ranges: List[Tuple[int, int]] = []
+    for part in spec.split(","):
+        a, sep, b = part.partition("-")
+        a, b = a.strip(), b.strip()
+        if not a.isdigit() or (sep and not b.isdigit()):
+            return None
+        try:
+            start = int(a)
+            end = int(b) if sep else start
+        except ValueError:  # str.isdigit() also accepts digits like "²"
+            return None
+        if start <= 0 or end < start:
+            return None
+        ranges.append((start, end))
+    return ranges
+
 
 # ----------------------------
 # Controls
@@ -102,6 +141,11 @@ class UISwitch(QtWidgets.QCheckBox):
         self.offsetChanged.emit(self._offset)
         self.update()
 
+    def sync_offset(self) -> None:
+        """Jump the thumb to the current state, for setChecked() made with signals blocked."""
+        self._anim.stop()
+        self.offset = 1.0 if self.isChecked() else 0.0
+
     def _on_toggled(self, checked: bool) -> None:
         self._anim.stop()
         self._anim.setStartValue(self._offset)
@@ -180,13 +224,16 @@ class AdvancedOptionsDialog(QtWidgets.QDialog):
     def __init__(self, parent: Optional[QtWidgets.QWidget], settings: AppSettings):
         super().__init__(parent)
         self.settings = settings
+        self._options: dict = {}
 
         # Window basics
         self.setWindowTitle("Advanced")
         self.setModal(True)
         self.setMinimumSize(560, 320)
+        # Styling comes from AppStyles.ADVANCED_DIALOG, installed once with
+        # the main window theme and scoped to this object name.
+        self.setObjectName("AdvancedOptionsDialog")
         self._build_ui()
-        self._apply_styles()  # after UI is built to target object names
 
         # Validators and live checks
         self._init_validators()
@@ -198,6 +245,9 @@ class AdvancedOptionsDialog(QtWidgets.QDialog):
         # Initial validation
         self._validate_all()
 
+        # Last used size/position (field values live in config.json)
+        self._restore_geometry()
+
     # ----------------------------
     # UI construction
     # ----------------------------
@@ -206,13 +256,7 @@ class AdvancedOptionsDialog(QtWidgets.QDialog):
         root.setContentsMargins(18, 18, 18, 18)
         root.setSpacing(16)
 
-        # Header
-        header = QtWidgets.QWidget(self)
-        header.setObjectName("header")
-        hbox = QtWidgets.QHBoxLayout(header)
-        hbox.setContentsMargins(0, 0, 0, 0)
-        hbox.setSpacing(8)
-
+        # Header (laid out directly on root; no wrapper widget needed)
         title = QtWidgets.QLabel("Advanced options")
         title.setObjectName("dlgTitle")
         title.setTextInteractionFlags(QtCore.Qt.TextSelectableByMouse)
@@ -226,27 +270,20 @@ class AdvancedOptionsDialog(QtWidgets.QDialog):
         title_box.setSpacing(2)
         title_box.addWidget(title)
         title_box.addWidget(subtitle)
-
-        hbox.addLayout(title_box, 1)
-        root.addWidget(header)
+        root.addLayout(title_box)
 
         root.addWidget(self._divider())
 
         # Content grid (labels left, controls right)
-        content = QtWidgets.QWidget(self)
-        form = QtWidgets.QGridLayout(content)
+        form = QtWidgets.QGridLayout()
         form.setContentsMargins(0, 6, 0, 6)
         form.setHorizontalSpacing(16)
         form.setVerticalSpacing(12)
 
-        # Clip section label row
-        clip_section = self._section_label("Clip extraction")
-        form.addWidget(clip_section, 0, 0, 1, 2)
-
         # Clip fields
         self.clip_start = self._line_edit(
             placeholder="HH:MM:SS or seconds",
-            tooltip="Start time. Examples: 75, 01:15, 1:02:45",
+            tooltip="Start time. Examples: 75, 01:15, 1:02:45.5",
             accessible_name="Clip start time",
         )
         self.clip_end = self._line_edit(
@@ -261,15 +298,7 @@ class AdvancedOptionsDialog(QtWidgets.QDialog):
         self.clip_start.setToolTip("Clip extraction is temporarily disabled due to a known bug.")
         self.clip_end.setToolTip("Clip extraction is temporarily disabled due to a known bug.")
 
-        form.addWidget(self._form_label("Start time"), 1, 0)
-        form.addWidget(self.clip_start, 1, 1)
-        form.addWidget(self._form_label("End time"), 2, 0)
-        form.addWidget(self.clip_end, 2, 1)
-
-        # Playlist section
-        playlist_section = self._section_label("Playlist")
-        form.addWidget(playlist_section, 3, 0, 1, 2)
-
+        # Playlist fields
         self.playlist_items = self._line_edit(
             placeholder="e.g., 1, 3-5, 10",
             tooltip="Comma-separated indices and ranges (e.g., 1, 3-5, 10).",
@@ -280,12 +309,16 @@ class AdvancedOptionsDialog(QtWidgets.QDialog):
         self.playlist_reverse.setToolTip("Download playlist items in reverse order.")
         self.playlist_reverse.setAccessibleName("Reverse playlist order switch")
 
-        form.addWidget(self._form_label("Items"), 4, 0)
-        form.addWidget(self.playlist_items, 4, 1)
-        form.addWidget(self._form_label("Order"), 5, 0)
-        form.addWidget(self.playlist_reverse, 5, 1, QtCore.Qt.AlignLeft)
+        row = self._add_form_section(form, 0, "Clip extraction", [
+            ("Start time", self.clip_start),
+            ("End time", self.clip_end),
+        ])
+        self._add_form_section(form, row, "Playlist", [
+            ("Items", self.playlist_items),
+            ("Order", self.playlist_reverse, QtCore.Qt.AlignLeft),
+        ])
 
-        root.addWidget(content)
+        root.addLayout(form)
         root.addWidget(self._divider())
 
         # Footer buttons
@@ -311,6 +344,16 @@ class AdvancedOptionsDialog(QtWidgets.QDialog):
     # ----------------------------
     # UI helpers
     # ----------------------------
+    def _add_form_section(self, form: QtWidgets.QGridLayout, row: int, title: str, rows: List[Tuple]) -> int:
+        """Add a section label plus (label, widget[, alignment]) rows; return the next free row."""
+        form.addWidget(self._section_label(title), row, 0, 1, 2)
+        row += 1
+        for label, widget, *align in rows:
+            form.addWidget(self._form_label(label), row, 0)
+            form.addWidget(widget, row, 1, *align)
+            row += 1
+        return row
+
     def _section_label(self, text: str) -> QtWidgets.QLabel:
         lbl = QtWidgets.QLabel(text)
         lbl.setObjectName("sectionLabel")
@@ -338,144 +381,16 @@ class AdvancedOptionsDialog(QtWidgets.QDialog):
         line.setObjectName("divider")
         return line
 
-    # ----------------------------
-    # Styling (dark-friendly, high-contrast)
-    # ----------------------------
-    def _apply_styles(self) -> None:
-        base = ""
-        try:
-            base = getattr(AppStyles, "DIALOG", "") or ""
-        except Exception:
-            base = ""
-
-        # Glassmorphism palette — fixed values for consistency
-        win_bg       = "#0a0e1a"
-        page_bg      = "qlineargradient(x1:0, y1:0, x2:1, y2:1, stop:0 #0a0e1a, stop:0.3 #15102e, stop:0.6 #1e1b4b, stop:1 #0c1733)"
-        strong_text  = "#F4F4F8"
-        muted_text   = "rgba(255, 255, 255, 150)"
-        section_text = "rgba(255, 255, 255, 180)"
-        border_c     = "rgba(255, 255, 255, 30)"
-        divider_c    = "rgba(255, 255, 255, 20)"
-        field_bg     = "rgba(255, 255, 255, 15)"
-        field_hover  = "rgba(255, 255, 255, 22)"
-        highlight    = "#00E5FF"
-        accent2      = "#7C4DFF"
-        error_border = "#F87171"
-        error_bg     = "rgba(248, 113, 113, 25)"
-
-        css = f"""
-        QDialog {{
-            background: {page_bg};
-        }}
-
-        #dlgTitle {{
-            font-size: 18px;
-            font-weight: 700;
-            color: {strong_text};
-            margin-bottom: 2px;
-        }}
-        #dlgSubtitle {{
-            font-size: 12px;
-            color: {muted_text};
-        }}
-
-        #sectionLabel {{
-            font-size: 11px;
-            font-weight: 700;
-            text-transform: uppercase;
-            letter-spacing: 0.6px;
-            color: {highlight};
-            padding: 4px 0 2px 0;
-        }}
-
-        #formLabel {{
-            font-size: 12px;
-            color: {muted_text};
-            padding-top: 4px;
-        }}
-
-        QLineEdit#input {{
-            background: {field_bg};
-            color: {strong_text};
-            border: 1px solid {border_c};
-            border-radius: 10px;
-            padding: 8px 12px;
-            selection-background-color: {highlight};
-            selection-color: #0a0e1a;
-            font-size: 13px;
-        }}
-        QLineEdit#input:hover {{
-            background: {field_hover};
-            border: 1px solid rgba(255, 255, 255, 50);
-        }}
-        QLineEdit#input:focus {{
-            border: 1px solid {highlight};
-            background: rgba(0, 229, 255, 10);
-            outline: none;
-        }}
-        QLineEdit#input[state="error"] {{
-            border: 1px solid {error_border};
-            background: {error_bg};
-        }}
-        QLineEdit#input:disabled {{
-            color: rgba(255, 255, 255, 80);
-            background: rgba(255, 255, 255, 8);
-            border: 1px solid rgba(255, 255, 255, 15);
-        }}
-
-        #divider {{
-            background: {divider_c};
-            min-height: 1px;
-            max-height: 1px;
-            border: none;
-        }}
-
-        QDialogButtonBox QPushButton {{
-            border-radius: 10px;
-            padding: 8px 16px;
-            font-weight: 600;
-            font-size: 13px;
-            min-width: 80px;
-        }}
-        QDialogButtonBox QPushButton:default {{
-            background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                stop:0 {highlight}, stop:1 {accent2});
-            color: #ffffff;
-            border: none;
-        }}
-        QDialogButtonBox QPushButton:default:hover {{
-            background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                stop:0 #33EEFF, stop:1 #9C6DFF);
-        }}
-        QDialogButtonBox QPushButton:!default {{
-            background: {field_bg};
-            color: {strong_text};
-            border: 1px solid {border_c};
-        }}
-        QDialogButtonBox QPushButton:!default:hover {{
-            border: 1px solid rgba(255, 255, 255, 50);
-            background: {field_hover};
-        }}
-        QDialogButtonBox QPushButton:disabled {{
-            color: rgba(255, 255, 255, 60);
-            background: rgba(255, 255, 255, 8);
-            border: 1px solid rgba(255, 255, 255, 15);
-        }}
-        """
-        self.setStyleSheet((base + "\n" + css).strip())
-
     # ----------------------------
     # Validation
     # ----------------------------
     def _init_validators(self) -> None:
-        # Time: seconds or [H:]MM:SS with MM/SS in 00-59
+        # Time: seconds or [H:]MM:SS with MM/SS in 00-59, optional fraction
         # Allow hours with 1–3 digits, minutes/seconds 00–59; also allow M:SS
         self._time_rx = _TIME_RX
-        self._time_validator = QtGui.QRegularExpressionValidator(self._time_rx, self)
-
         # Playlist items: "1, 3-5, 10"
         self._pl_rx = _PLAYLIST_RX
-        self._pl_validator = QtGui.QRegularExpressionValidator(self._pl_rx, self)
+        self._time_validator, self._pl_validator = _shared_validators()
 
         self.clip_start.setValidator(self._time_validator)
         self.clip_end.setValidator(self._time_validator)
@@ -531,7 +446,7 @@ class AdvancedOptionsDialog(QtWidgets.QDialog):
         self._set_error_state(
             self.clip_start,
             has_error=not start_ok and start_txt != "",
-            tip="Invalid format. Use seconds or [H:]MM:SS (e.g., 75, 01:15, 1:02:45).",
+            tip="Invalid format. Use seconds or [H:]MM:SS, optionally with a fraction (e.g., 75, 01:15, 1:02:45.5).",
         )
 
         end_tip = "Invalid format. Use seconds or [H:]MM:SS."
@@ -558,26 +473,8 @@ class AdvancedOptionsDialog(QtWidgets.QDialog):
             save_btn.setToolTip("Save changes" if all_valid else "Fix the highlighted fields to enable Save.")
 
     def _playlist_semantics_ok(self, text: str) -> bool:
-        txt = text.strip()
-        if not txt:
-            return True
         # Validate positive integers; for ranges, start <= end
-        try:
-            parts = [p.strip() for p in txt.split(",")]
-            for p in parts:
-                if "-" in p:
-                    a, b = [x.strip() for x in p.split("-", 1)]
-                    if not a.isdigit() or not b.isdigit():
-                        return False
-                    start, end = int(a), int(b)
-                    if start <= 0 or end <= 0 or end < start:
-                        return False
-                else:
-                    if not p.isdigit() or int(p) <= 0:
-                        return False
-            return True
-        except Exception:
-            return False
+        return not text.strip() or _parse_playlist_items(text) is not None
 
     def _set_save_enabled(self, enabled: bool) -> None:
         btn = self.buttons.button(QtWidgets.QDialogButtonBox.Save)
@@ -586,15 +483,18 @@ class AdvancedOptionsDialog(QtWidgets.QDialog):
             if enabled:
                 btn.setDefault(True)
 
-    def _to_seconds(self, value: str) -> Optional[int]:
+    def _to_seconds(self, value: str) -> Optional[float]:
         v = value.strip()
         if not v:
             return None
-        if v.isdigit():
-            try:
-                return int(v)
-            except ValueError:
+        frac = 0.0
+        if "." in v:
+            v, _, f = v.partition(".")
+            if not f.isdigit():
                 return None
+            frac = float("0." + f)
+        if v.isdigit():
+            return int(v) + frac
         parts = v.split(":")
         try:
             if len(parts) == 2:
@@ -602,13 +502,13 @@ class AdvancedOptionsDialog(QtWidgets.QDialog):
                 m, s = int(mm), int(ss)
                 if not (m >= 0 and 0 <= s <= 59):
                     return None
-                return m * 60 + s
+                return m * 60 + s + frac
             if len(parts) == 3:
                 hh, mm, ss = parts
                 h, m, s = int(hh), int(mm), int(ss)
                 if not (h >= 0 and 0 <= m <= 59 and 0 <= s <= 59):
                     return None
-                return h * 3600 + m * 60 + s
+                return h * 3600 + m * 60 + s + frac
         except ValueError:
             return None
         return None
@@ -617,10 +517,18 @@ class AdvancedOptionsDialog(QtWidgets.QDialog):
     # Data I/O
     # ----------------------------
     def get_options(self) -> dict:
+        # Snapshot taken in accept(); fall back to a live read otherwise
+        return self._options or self._collect_options()
+
+    def _collect_options(self) -> dict:
+        items = self.playlist_items.text().strip()
         return {
             "CLIP_START": self.clip_start.text().strip(),
             "CLIP_END": self.clip_end.text().strip(),
-            "PLAYLIST_ITEMS": self.playlist_items.text().strip(),
+            # Passed to yt-dlp exactly as typed, since the order matters
+            "PLAYLIST_ITEMS": items,
+            # Parsed once here for callers that want the ranges; not a setting
+            "PLAYLIST_ITEMS_PARSED": (_parse_playlist_items(items) or []) if items else [],
             "PLAYLIST_REVERSE": self.playlist_reverse.isChecked(),
         }
 
@@ -630,6 +538,28 @@ class AdvancedOptionsDialog(QtWidgets.QDialog):
         self.playlist_items.setText(self._safe_str(getattr(self.settings, "PLAYLIST_ITEMS", "")))
         self.playlist_reverse.setChecked(bool(getattr(self.settings, "PLAYLIST_REVERSE", False)))
 
+    def reload_from_settings(self, settings: AppSettings) -> None:
+        """Repopulate a cached dialog instance before it is shown again."""
+        self.settings = settings
+        self._options = {}
+        self._load_from_settings()
+        self._validate_all()
+
+    def _qsettings(self) -> QtCore.QSettings:
+        app_name = getattr(self.settings, "APP_NAME", "YTGet")
+        return QtCore.QSettings(app_name, app_name)
+
+    def _restore_geometry(self) -> None:
+        geo = self._qsettings().value("advanced/geometry")
+        if geo:
+            self.restoreGeometry(geo)
+
+    def _save_geometry(self) -> None:
+        try:
+            self._qsettings().setValue("advanced/geometry", self.saveGeometry())
+        except Exception:
+            pass
+
     def _reset_fields(self) -> None:
         self.clip_start.clear()
         self.clip_end.clear()
@@ -657,6 +587,15 @@ class AdvancedOptionsDialog(QtWidgets.QDialog):
             return
         self.accept()
 
+    def accept(self) -> None:
+        self._options = self._collect_options()
+        super().accept()
+
+    def done(self, result: int) -> None:
+        # Covers Save, Cancel, Esc and the title-bar close button alike
+        self._save_geometry()
+        super().done(result)
+
     def keyPressEvent(self, e: QtGui.QKeyEvent) -> None:
         if ((e.modifiers() & (QtCore.Qt.ControlModifier | QtCore.Qt.MetaModifier))
             and e.key() in (QtCore.Qt.Key_Return, QtCore.Qt.Key_Enter)):
@@ -5,7 +5,7 @@ from __future__ import annotations
 import datetime
 import re
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
 
 from PySide6 import QtCore, QtGui, QtWidgets
 from PySide6.QtCore import QDate
@@ -26,6 +26,14 @@ _SPONSORBLOCK_CATEGORIES = {
     "Preview/Recap": "preview",
     "Filler": "filler",
 }
+# (label, code) pairs in display order, shared by the page builder and snapshots
+_SPONSORBLOCK_ITEMS: Tuple[Tuple[str, str], ...] = tuple(_SPONSORBLOCK_CATEGORIES.items())
+# Codes in the same order, parallel to PreferencesDialog._sb_ordered_cbs
+_SPONSORBLOCK_CODES: Tuple[str, ...] = tuple(code for _, code in _SPONSORBLOCK_ITEMS)
+
+_COOKIE_BROWSERS: List[str] = ["", "chrome", "chromium", "edge", "firefox", "opera", "brave", "vivaldi", "safari", "whale"]
+
+_VIDEO_FORMATS: List[str] = [".mkv", ".mp4", ".webm"]
 
 _FILENAME_FORMAT_ITEMS: List[Tuple[str, str]] = [
     ("Default", "default"),
@@ -75,13 +83,167 @@ _TEMPLATE_ILLEGAL_LITERAL_RE = re.compile(r'[\\/:*?"<>|\x00-\x1f]')
 _RX_RATE = QtCore.QRegularExpression(r"^\s*$|^\d+(\.\d+)?\s*[KkMmGg]$")
 _RX_LANGS = QtCore.QRegularExpression(r"^\s*$|^\s*[A-Za-z]{2,3}(\s*,\s*[A-Za-z]{2,3})*\s*$")
 _RX_ITEMS = QtCore.QRegularExpression(r"^\s*$|^\s*\d+(\s*-\s*\d+)?(\s*,\s*\d+(\s*-\s*\d+)?)*\s*$")
-_RX_DATE = QtCore.QRegularExpression(r"^\s*$|^\d{8}$")
+_RX_DATE_KEYS = QtCore.QRegularExpression(r"^\d{0,8}$")  # keystroke filter; _validate_all checks the date itself
+for _rx in (_RX_RATE, _RX_LANGS, _RX_ITEMS, _RX_DATE_KEYS):
+    _rx.optimize()  # QRegularExpression compiles lazily; do it at import instead
+del _rx
+# Same patterns for _validate_all, which checks plain str values and so can
+# skip the QString conversion and QRegularExpressionMatch of the Qt objects.
+_RATE_RE, _LANGS_RE, _ITEMS_RE = (re.compile(rx.pattern()) for rx in (_RX_RATE, _RX_LANGS, _RX_ITEMS))
+_PROXY_SCHEMES = ("http://", "https://", "socks5://")
+
+
+class _PageSpec(NamedTuple):
+    """A Preferences section. Pages are only built the first time they're shown."""
+    name: str
+    icon: QtWidgets.QStyle.StandardPixmap
+    builder: str                            # method returning the page content
+    fields: Tuple[Tuple[str, str, str], ...] = ()  # (widget attribute, settings key, kind)
+    setter: Optional[str] = None            # extra loading beyond `fields` (compound values, side effects)
+    getter: Optional[str] = None            # extra reading beyond `fields`
+    tracked: Tuple[str, ...] = ()           # other widgets that mark the dialog dirty
+    groups: Tuple[Tuple[str, Tuple[str, ...]], ...] = ()  # (switch, widgets it enables)
+
+
+# How each field kind is read from / written to its widget
+_FIELD_GET = {
+    "text": lambda w: w.text().strip(),
+    "path": lambda w: Path(t) if (t := w.text().strip()) else None,  # None = empty, see get_settings
+    "checked": lambda w: w.isChecked(),
+    "combo": lambda w: w.currentText().strip(),
+    "spin": lambda w: w.value(),
+}
+_FIELD_SET = {
+    "text": lambda w, v: w.setText(v),
+    "path": lambda w, v: w.setText(str(v) if v else ""),
+    "checked": lambda w, v: w.setChecked(bool(v)),
+    "combo": lambda w, v: w.setCurrentText(v),
+    "spin": lambda w, v: w.setValue(int(v)),
+}
+
+
+_PAGES: Tuple[_PageSpec, ...] = (
+    _PageSpec(
+        "Network", QtWidgets.QStyle.SP_DriveNetIcon, "_page_network",
+        fields=(
+            ("proxy_input", "PROXY_URL", "text"),
+            ("ignore_ssl_errors", "IGNORE_SSL_ERRORS", "checked"),
+            ("custom_ca_cert_input", "CUSTOM_CA_CERT", "text"),
+            ("cookies_browser_combo", "COOKIES_FROM_BROWSER", "combo"),
+            ("cookies_path_input", "COOKIES_PATH", "path"),
+            ("cookies_auto_refresh", "COOKIES_AUTO_REFRESH", "checked"),
+            ("limit_rate_input", "LIMIT_RATE", "text"),
+            ("retries_spin", "RETRIES", "spin"),
+        ),
+        setter="_set_network", getter="_get_network", tracked=("import_cookies_combo",),
+    ),
+    _PageSpec(
+        "SponsorBlock", QtWidgets.QStyle.SP_DialogYesButton, "_page_sponsorblock",
+        setter="_set_sponsorblock", getter="_get_sponsorblock", tracked=("_sb_ordered_cbs",),
+    ),
+    _PageSpec(
+        "Chapters", QtWidgets.QStyle.SP_FileDialogDetailedView, "_page_chapters",
+        setter="_set_chapters", getter="_get_chapters",
+        tracked=("chapters_none", "chapters_embed", "chapters_split"),
+    ),
+    _PageSpec(
+        "Subtitles", QtWidgets.QStyle.SP_FileDialogInfoView, "_page_subtitles",
+        fields=(
+            ("subtitles_enabled", "WRITE_SUBS", "checked"),
+            ("languages_input", "SUB_LANGS", "text"),
+            ("auto_subs", "WRITE_AUTO_SUBS", "checked"),
+            ("convert_subs", "CONVERT_SUBS_TO_SRT", "checked"),
+        ),
+        groups=(("subtitles_enabled", ("languages_input", "auto_subs", "convert_subs")),),
+    ),
+    _PageSpec(
+        "Playlist", QtWidgets.QStyle.SP_DirIcon, "_page_playlist",
+        fields=(
+            ("enable_archive", "ENABLE_ARCHIVE", "checked"),
+            ("archive_path_input", "ARCHIVE_PATH", "path"),
+            ("playlist_reverse", "PLAYLIST_REVERSE", "checked"),
+            ("playlist_items", "PLAYLIST_ITEMS", "text"),
+        ),
+        groups=(("enable_archive", ("archive_path_input",)),),
+    ),
+    _PageSpec(
+        "Post-processing", QtWidgets.QStyle.SP_ToolBarHorizontalExtensionButton, "_page_post",
+        fields=(
+            ("audio_normalize", "AUDIO_NORMALIZE", "checked"),
+            ("add_metadata", "ADD_METADATA", "checked"),
+            ("crop_covers", "CROP_AUDIO_COVERS", "checked"),
+            ("custom_ffmpeg", "CUSTOM_FFMPEG_ARGS", "text"),
+            ("write_thumbnail", "WRITE_THUMBNAIL", "checked"),
+            ("convert_thumbnails", "CONVERT_THUMBNAILS", "checked"),
+            ("embed_thumbnail", "EMBED_THUMBNAIL", "checked"),
+            ("video_format_combo", "VIDEO_FORMAT", "combo"),
+        ),
+    ),
+    _PageSpec(
+        "Output", QtWidgets.QStyle.SP_DialogOpenButton, "_page_output",
+        fields=(
+            ("organize_uploader", "ORGANIZE_BY_UPLOADER", "checked"),
+            ("date_after", "DATEAFTER", "text"),
+            ("custom_filename_input", "CUSTOM_FILENAME_TEMPLATE", "text"),
+        ),
+        setter="_set_output", getter="_get_output", tracked=("filename_format_combo",),
+    ),
+    _PageSpec(
+        "Experimental", QtWidgets.QStyle.SP_MessageBoxInformation, "_page_experimental",
+        fields=(
+            ("live_stream", "LIVE_FROM_START", "checked"),
+            ("yt_music", "YT_MUSIC_METADATA", "checked"),
+        ),
+    ),
+    _PageSpec("Spotify", QtWidgets.QStyle.SP_MediaPlay, "_page_spotify"),
+)
+
+# Signal each tracked widget kind emits when its value changes
+_CHANGE_SIGNALS = (
+    (QtWidgets.QLineEdit, "textChanged(QString)"),
+    (QtWidgets.QComboBox, "currentTextChanged(QString)"),
+    (QtWidgets.QSpinBox, "valueChanged(int)"),
+    ((QtWidgets.QCheckBox, UISwitch, QtWidgets.QRadioButton), "toggled(bool)"),
+)
+
+# Widget attribute -> index of the page that owns it
+_FIELD_PAGE: Dict[str, int] = {
+    attr: i
+    for i, spec in enumerate(_PAGES)
+    for attr in (*(f[0] for f in spec.fields), *spec.tracked)
+}
+
+
+def _as_path(value) -> Optional[Path]:
+    """A settings path value as a Path, or None when unset; existing Paths are reused."""
+    if isinstance(value, Path):
+        return value if value.parts else None
+    return Path(t) if value and (t := str(value).strip()) else None
+
+
+def _snapshot_key(data: dict) -> tuple:
+    """Hashable, order-independent form of a get_settings() dict for cheap equality checks.
+
+    Paths are compared by their string form, which skips Path.__eq__'s
+    per-comparison normalisation.
+    """
+    return tuple(
+        (k, frozenset(v) if isinstance(v, list) else str(v) if isinstance(v, Path) else v)
+        for k, v in sorted(data.items())
+    )
 
 
 class PreferencesDialog(QtWidgets.QDialog):
 
     MIN_WIDE_LAYOUT = 900
     _FILENAME_FORMAT_ITEMS = _FILENAME_FORMAT_ITEMS
+    _ICON_CACHE: Dict[QtWidgets.QStyle.StandardPixmap, QtGui.QIcon] = {}
+    _QSS_CACHE: Dict[str, str] = {}
+    # dirty -> (footer status text, "state" property for the sheet)
+    _STATUS = {
+        False: ("●  All changes saved", "clean"),
+        True: ("●  Unsaved changes — press Ctrl+S to save", "dirty"),
+    }
 
     def __init__(self, parent: Optional[QtWidgets.QWidget], settings: AppSettings):
         super().__init__(parent)
@@ -94,16 +256,41 @@ class PreferencesDialog(QtWidgets.QDialog):
 
         # State
         self._initial_snapshot: dict = {}
+        self._initial_key: tuple = ()
+        # Edits restart this timer; dirty state and validation are evaluated
+        # once typing pauses rather than per keystroke.
+        self._change_timer = QtCore.QTimer(self)
+        self._change_timer.setSingleShot(True)
+        self._change_timer.setInterval(150)
+        self._change_timer.timeout.connect(self._flush_changes)
+        self._base_dir_str = str(self.settings.BASE_DIR)  # start folder for the file pickers
+        self._date_dialog: Optional[QtWidgets.QDialog] = None
+        self._date_cal: Optional[QtWidgets.QCalendarWidget] = None
         self._dirty = False
+        self._status_shown = False
         self._base_tips: Dict[QtWidgets.QWidget, str] = {}
-        self._filters_installed = False
         self._validation_actions: Dict[QtWidgets.QLineEdit, QtGui.QAction] = {}
+        self._pages: Dict[str, QtWidgets.QWidget] = {}
+        self._built_pages: set = set()
+        self._page_fields: Dict[int, List[Tuple[QtWidgets.QWidget, str, str]]] = {}
+        self._page_groups: Dict[int, List[Tuple[UISwitch, List[QtWidgets.QWidget]]]] = {}
+        self._page_widgets: Dict[int, List[QtWidgets.QWidget]] = {}
+        self._page_switches: Dict[int, List[UISwitch]] = {}
+        self._focus_candidates: Dict[int, List[QtWidgets.QWidget]] = {}
 
         # SponsorBlock layout helpers
         self._sb_gridw: Optional[QtWidgets.QWidget] = None
         self._sb_grid: Optional[QtWidgets.QGridLayout] = None
         self._sb_ordered_cbs: List[QtWidgets.QCheckBox] = []
 
+        # Responsive layout: resizes are coalesced, and the sidebar/combo swap
+        # only happens when the width crosses MIN_WIDE_LAYOUT.
+        self._layout_mode: Optional[str] = None
+        self._resize_timer = QtCore.QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(20)
+        self._resize_timer.timeout.connect(self._update_responsive_layout)
+
         # Global alignment helpers
         self._label_refs: List[QtWidgets.QLabel] = []
         self._label_col_width: int = 0
@@ -112,12 +299,10 @@ class PreferencesDialog(QtWidgets.QDialog):
         self._build_ui()
         self._apply_styles()
 
-        # Data and behavior
+        # Data and behavior. Pages are built lazily from this baseline, so
+        # sections the user never opens cost nothing.
+        self._set_baseline(self._snapshot_from_settings())
         self._build_pages()
-        self._finalize_label_column()
-        self._load_from_settings()
-        self._wire_validation()
-        self._wire_dirty_tracking()
         self._validate_all()
         self._set_dirty(False)
         self._update_responsive_layout()
@@ -234,8 +419,8 @@ class PreferencesDialog(QtWidgets.QDialog):
         self.buttons.accepted.connect(self._on_accept)
         self.buttons.rejected.connect(self._on_reject)
         self.reset_btn.clicked.connect(self._on_reset)
-        self.sidebar.currentRowChanged.connect(self.stack.setCurrentIndex)
-        self.section_combo.currentIndexChanged.connect(self.stack.setCurrentIndex)
+        self.sidebar.currentRowChanged.connect(self._show_page)
+        self.section_combo.currentIndexChanged.connect(self._show_page)
         self.stack.currentChanged.connect(self._sync_nav_selection)
         self.stack.currentChanged.connect(lambda _: self._focus_first_in_current_page())
 
@@ -260,58 +445,71 @@ class PreferencesDialog(QtWidgets.QDialog):
         sa.setWidget(vp)
         return sa
 
-    def _add_card_elevation(self, card: QtWidgets.QFrame) -> None:
-        eff = QtWidgets.QGraphicsDropShadowEffect(card)
-        eff.setBlurRadius(18)
-        eff.setColor(QtGui.QColor(0, 0, 0, 60))
-        eff.setOffset(0, 6)
-        card.setGraphicsEffect(eff)
-
-    def _add_page(self, name: str, icon: QtGui.QIcon, content: QtWidgets.QWidget):
-        item = QtWidgets.QListWidgetItem(icon, name)
-        item.setSizeHint(QtCore.QSize(item.sizeHint().width(), 34))
-        self.sidebar.addItem(item)
-
-        # Wrap content in a scroll area
-        sa = self._wrap_scroll(content)
-        self.stack.addWidget(sa)
-
-        # Section combo
-        self.section_combo.addItem(icon, name)
-
-        # Track for external reference if needed
-        if not hasattr(self, "_pages"):
-            self._pages = {}
-        self._pages[name] = content
-
     def _build_pages(self) -> None:
-        style = self.style()
-        self._add_page("Network", style.standardIcon(QtWidgets.QStyle.SP_DriveNetIcon), self._page_network())
-        self._add_page("SponsorBlock", style.standardIcon(QtWidgets.QStyle.SP_DialogYesButton), self._page_sponsorblock())
-        self._add_page("Chapters", style.standardIcon(QtWidgets.QStyle.SP_FileDialogDetailedView), self._page_chapters())
-        self._add_page("Subtitles", style.standardIcon(QtWidgets.QStyle.SP_FileDialogInfoView), self._page_subtitles())
-        self._add_page("Playlist", style.standardIcon(QtWidgets.QStyle.SP_DirIcon), self._page_playlist())
-        self._add_page("Post-processing", style.standardIcon(QtWidgets.QStyle.SP_ToolBarHorizontalExtensionButton), self._page_post())
-        self._add_page("Output", style.standardIcon(QtWidgets.QStyle.SP_DialogOpenButton), self._page_output())
-        self._add_page("Experimental", style.standardIcon(QtWidgets.QStyle.SP_MessageBoxInformation), self._page_experimental())
-
-        # SpotDL page
-        spotdl_content = SpotDLPreferencesTab(self.settings.SPOTDL)
-        self.spotdl_tab = spotdl_content
-        item = QtWidgets.QListWidgetItem(
-            self.style().standardIcon(QtWidgets.QStyle.SP_MediaPlay), "Spotify"
-        )
-        item.setSizeHint(QtCore.QSize(item.sizeHint().width(), 34))
-        self.sidebar.addItem(item)
-        self.stack.addWidget(spotdl_content)   
-        self.section_combo.addItem(
-            self.style().standardIcon(QtWidgets.QStyle.SP_MediaPlay), "Spotify"
-        )
-        
+        # Register every section in the navigation, but only build the first;
+        # the rest get a placeholder in the stack until they're visited.
+        for spec in _PAGES:
+            icon = self._icon(spec.icon)
+            self.sidebar.addItem(QtWidgets.QListWidgetItem(icon, spec.name))
+            self.section_combo.addItem(icon, spec.name)
+            self.stack.addWidget(QtWidgets.QWidget())
+
+        self._ensure_page(0)
+        self.stack.setCurrentIndex(0)
         self.sidebar.setCurrentRow(0)
         self.section_combo.setCurrentIndex(0)
 
+    def _ensure_page(self, index: int) -> bool:
+        """Build page `index` if it's still a placeholder. Returns True if it was built now."""
+        if index in self._built_pages or not 0 <= index < len(_PAGES):
+            return False
+        self._built_pages.add(index)
+        spec = _PAGES[index]
+
+        # The page is built and filled while still parentless and hidden, so
+        # its layouts settle in one pass when it's first shown.
+        first_label = len(self._label_refs)
+        content = getattr(self, spec.builder)()
+        self._pages[spec.name] = content
+        self._collect_tracked(index)
+        self._load_page_values(index, self._initial_snapshot)
+        self._finalize_label_column(first_label)
+        for w in self._page_widgets[index]:
+            self._watch(w)
+        for sw, deps in self._page_groups[index]:
+            sw.toggled.connect(lambda on, deps=deps: self._enable_group(deps, on))
+
+        page = content if isinstance(content, QtWidgets.QScrollArea) else self._wrap_scroll(content)
+        stub = self.stack.widget(index)
+        block = QtCore.QSignalBlocker(self.stack)
+        self.stack.setUpdatesEnabled(False)
+        try:
+            self.stack.insertWidget(index, page)
+            self.stack.removeWidget(stub)
+        finally:
+            self.stack.setUpdatesEnabled(True)
+            del block
+        stub.deleteLater()
+        return True
+
+    def _show_page(self, index: int) -> None:
+        if not 0 <= index < self.stack.count():
+            return
+        built = self._ensure_page(index)
+        self.stack.setCurrentIndex(index)
+        if built:
+            self._validate_all()
+            self._update_responsive_layout()
+
     # ---------- Layout primitives ----------
+    def _icon(self, sp: QtWidgets.QStyle.StandardPixmap) -> QtGui.QIcon:
+        # Shared across dialog instances; the validation adorners ask for the
+        # same two icons on every keystroke.
+        icon = self._ICON_CACHE.get(sp)
+        if icon is None:
+            icon = self._ICON_CACHE[sp] = self.style().standardIcon(sp)
+        return icon
+
     def _divider(self) -> QtWidgets.QFrame:
         line = QtWidgets.QFrame()
         line.setFrameShape(QtWidgets.QFrame.HLine)
@@ -332,8 +530,7 @@ class PreferencesDialog(QtWidgets.QDialog):
         v.setSpacing(7)
 
         if title:
-            head = QtWidgets.QWidget()
-            hl = QtWidgets.QVBoxLayout(head)
+            hl = QtWidgets.QVBoxLayout()
             hl.setContentsMargins(0, 0, 0, 0)
             hl.setSpacing(2)
             tl = QtWidgets.QLabel(title)
@@ -344,12 +541,11 @@ class PreferencesDialog(QtWidgets.QDialog):
                 st.setObjectName("cardSubtitle")
                 st.setWordWrap(True)
                 hl.addWidget(st)
-            v.addWidget(head)
+            v.addLayout(hl)
 
         for w in inner:
             v.addWidget(w)
 
-        self._add_card_elevation(card)
         return card
 
     def _tweak_toggle(self, w: QtWidgets.QWidget) -> None:
@@ -365,13 +561,14 @@ class PreferencesDialog(QtWidgets.QDialog):
             except Exception:
                 pass
 
-    def _form_row(self, label: str, widget: QtWidgets.QWidget, description: Optional[str] = None) -> QtWidgets.QWidget:
+    def _form_row(self, label: str, widget: Union[QtWidgets.QWidget, QtWidgets.QLayout], description: Optional[str] = None) -> QtWidgets.QWidget:
         """
         Consistent 3-column row:
         [label][description/content stretch][control]
         - Fields (line edit, combo, spin) span middle + right columns
         - UISwitch toggles align in right column; optional description sits in middle column
         - Checkboxes/radios (self-labeled) span middle + right columns; label column kept for alignment
+        - Layouts (field + button, see _inline) span middle + right columns
         """
         row = QtWidgets.QWidget()
         grid = QtWidgets.QGridLayout(row)
@@ -399,10 +596,8 @@ class PreferencesDialog(QtWidgets.QDialog):
             desc_lbl.setAlignment(QtCore.Qt.AlignVCenter | QtCore.Qt.AlignLeft)
             desc_lbl.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Preferred)
             grid.addWidget(desc_lbl, 0, 1, 1, 1)
-        else:
-            spacer = QtWidgets.QWidget()
-            spacer.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Preferred)
-            grid.addWidget(spacer, 0, 1, 1, 1)
+        # Otherwise the middle column is left empty; its stretch keeps the
+        # control column pushed right.
 
         # Right/content placement
         if is_switch:
@@ -413,7 +608,6 @@ class PreferencesDialog(QtWidgets.QDialog):
             sp.setHorizontalPolicy(QtWidgets.QSizePolicy.Expanding)
             widget.setSizePolicy(sp)
             if isinstance(widget, QtWidgets.QLineEdit):
-                widget.setMinimumHeight(36)
                 widget.setProperty("hasTrailingAdorner", True)
             grid.addWidget(widget, 0, 1, 1, 2)
         elif is_checkbox or is_radio:
@@ -422,6 +616,8 @@ class PreferencesDialog(QtWidgets.QDialog):
             sp.setHorizontalPolicy(QtWidgets.QSizePolicy.Fixed)
             widget.setSizePolicy(sp)
             grid.addWidget(widget, 0, 1, 1, 2, QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter)
+        elif isinstance(widget, QtWidgets.QLayout):
+            grid.addLayout(widget, 0, 1, 1, 2)
         else:
             # Fallback
             grid.addWidget(widget, 0, 1, 1, 2)
@@ -439,19 +635,23 @@ class PreferencesDialog(QtWidgets.QDialog):
             le.setToolTip(tip)
             self._base_tips[le] = tip
         le.setObjectName(name)
+        le.installEventFilter(self)  # Ctrl/⌘+Enter saves from any field
         return le
 
-    def _picker_row(self, le: QtWidgets.QLineEdit, button_text: str, cb) -> QtWidgets.QWidget:
-        w = QtWidgets.QWidget()
-        h = QtWidgets.QHBoxLayout(w)
+    def _inline(self, field: QtWidgets.QWidget, button: QtWidgets.QWidget) -> QtWidgets.QHBoxLayout:
+        # Bare layout rather than a wrapper widget; _form_row places it directly
+        h = QtWidgets.QHBoxLayout()
         h.setContentsMargins(0, 0, 0, 0)
         h.setSpacing(6)
+        h.addWidget(field, 1)
+        h.addWidget(button, 0)
+        return h
+
+    def _picker_row(self, le: QtWidgets.QLineEdit, button_text: str, cb) -> QtWidgets.QHBoxLayout:
         btn = QtWidgets.QPushButton(button_text)
-        btn.setMinimumHeight(36)
+        btn.setObjectName("fieldButton")
         btn.clicked.connect(cb)
-        h.addWidget(le, 1)
-        h.addWidget(btn, 0)
-        return w
+        return self._inline(le, btn)
 
     # ---------- Pages ----------
     def _page_network(self) -> QtWidgets.QWidget:
@@ -482,7 +682,7 @@ class PreferencesDialog(QtWidgets.QDialog):
 
         self.cookies_browser_combo = QtWidgets.QComboBox()
         self.cookies_browser_combo.setObjectName("combo")
-        self.cookies_browser_combo.addItems(["", "chrome", "chromium", "edge", "firefox", "opera", "brave", "vivaldi", "safari", "whale"])
+        self.cookies_browser_combo.addItems(_COOKIE_BROWSERS)
         self.cookies_browser_combo.setAccessibleName("Import cookies from browser")
         self._base_tips[self.cookies_browser_combo] = "Import cookies directly from a supported browser profile"
         pf.addWidget(self._form_row("Import from browser", self.cookies_browser_combo))
@@ -490,20 +690,14 @@ class PreferencesDialog(QtWidgets.QDialog):
         # Manual import row: browser selector + Import Now button
         self.import_cookies_combo = QtWidgets.QComboBox()
         self.import_cookies_combo.setObjectName("combo")
-        self.import_cookies_combo.addItems(["", "chrome", "chromium", "edge", "firefox", "opera", "brave", "vivaldi", "safari", "whale"])
+        self.import_cookies_combo.addItems(_COOKIE_BROWSERS)
         self.import_cookies_combo.setAccessibleName("Browser for import")
 
         self.import_cookies_btn = QtWidgets.QPushButton("Import YouTube cookies now")
-        self.import_cookies_btn.setMinimumHeight(36)
+        self.import_cookies_btn.setObjectName("fieldButton")
         self.import_cookies_btn.clicked.connect(self._on_import_cookies)
 
-        imp_row = QtWidgets.QWidget()
-        imp_h = QtWidgets.QHBoxLayout(imp_row)
-        imp_h.setContentsMargins(0, 0, 0, 0)
-        imp_h.setSpacing(6)
-        imp_h.addWidget(self.import_cookies_combo, 1)
-        imp_h.addWidget(self.import_cookies_btn, 0)
-
+        imp_row = self._inline(self.import_cookies_combo, self.import_cookies_btn)
         pf.addWidget(self._form_row("Import cookies", imp_row, "Export fresh cookies from a local browser profile"))
 
         self.cookies_auto_refresh = QtWidgets.QCheckBox("Refresh cookies before each download")
@@ -549,6 +743,7 @@ class PreferencesDialog(QtWidgets.QDialog):
             tip="Limit download speed (e.g., 5M, 500K, 1G). Leave empty for unlimited.",
         )
         self.limit_rate_input.setAccessibleName("Maximum download speed")
+        self.limit_rate_input.setValidator(QtGui.QRegularExpressionValidator(_RX_RATE, self))
         prf.addWidget(self._form_row("Max download speed", self.limit_rate_input))
 
         self.retries_spin = QtWidgets.QSpinBox()
@@ -581,18 +776,14 @@ class PreferencesDialog(QtWidgets.QDialog):
         self._sb_grid.setHorizontalSpacing(16)
         self._sb_grid.setVerticalSpacing(5)
 
-        self.category_cb: Dict[str, QtWidgets.QCheckBox] = {}
-        items = list(_SPONSORBLOCK_CATEGORIES.items())
-
         self._sb_ordered_cbs.clear()
-        for (label, code) in items:
+        for label, _ in _SPONSORBLOCK_ITEMS:
             cb = QtWidgets.QCheckBox(label)
             cb.setObjectName("check")
             sp = cb.sizePolicy()
             sp.setHorizontalPolicy(QtWidgets.QSizePolicy.Fixed)
             cb.setSizePolicy(sp)
             cb.setAccessibleName(f"SponsorBlock category: {label}")
-            self.category_cb[code] = cb
             self._sb_ordered_cbs.append(cb)
 
         # Initial layout (will be reflowed responsively)
@@ -669,6 +860,7 @@ class PreferencesDialog(QtWidgets.QDialog):
             tip="Comma-separated 2–3 letter language codes (e.g., en, es, fra)",
         )
         self.languages_input.setAccessibleName("Subtitle languages")
+        self.languages_input.setValidator(QtGui.QRegularExpressionValidator(_RX_LANGS, self))
         fl.addWidget(self._form_row("Languages", self.languages_input))
 
         self.auto_subs = QtWidgets.QCheckBox("Include auto-generated subtitles")
@@ -683,8 +875,6 @@ class PreferencesDialog(QtWidgets.QDialog):
 
         card = self._card(form, title="Subtitles", subtitle="Fetch, convert, and include subtitles in your downloads.")
         pv.addWidget(card)
-
-        self.subtitles_enabled.toggled.connect(self._on_subtitles_toggled)
         return page
 
     def _page_playlist(self) -> QtWidgets.QWidget:
@@ -720,12 +910,11 @@ class PreferencesDialog(QtWidgets.QDialog):
             tip="Comma-separated indices or ranges (e.g., 1,5-10,15)",
         )
         self.playlist_items.setAccessibleName("Playlist items selection")
+        self.playlist_items.setValidator(QtGui.QRegularExpressionValidator(_RX_ITEMS, self))
         fl.addWidget(self._form_row("Items", self.playlist_items))
 
         card = self._card(form, title="Playlist", subtitle="Control archive and ordering for multi-item downloads.")
         pv.addWidget(card)
-
-        self.enable_archive.toggled.connect(lambda en: self.archive_path_input.setEnabled(en))
         return page
 
     def _page_post(self) -> QtWidgets.QWidget:
@@ -759,7 +948,7 @@ class PreferencesDialog(QtWidgets.QDialog):
         
         self.video_format_combo = QtWidgets.QComboBox()
         self.video_format_combo.setObjectName("combo")
-        self.video_format_combo.addItems([".mkv", ".mp4", ".webm"])
+        self.video_format_combo.addItems(_VIDEO_FORMATS)
         self.video_format_combo.setAccessibleName("Preferred video format")
         fl.addWidget(self._form_row("Video Format", self.video_format_combo, "Choose Output Container"))
 
@@ -940,16 +1129,11 @@ class PreferencesDialog(QtWidgets.QDialog):
 
         self.date_after = self._line_edit(placeholder="YYYYMMDD", tip="Download only items uploaded on/after this date")
         self.date_after.setAccessibleName("Only download after date")
+        self.date_after.setValidator(QtGui.QRegularExpressionValidator(_RX_DATE_KEYS, self))
         self.btn_date_picker = QtWidgets.QPushButton("Select date…")
-        self.btn_date_picker.setMinimumHeight(36)
+        self.btn_date_picker.setObjectName("fieldButton")
         self.btn_date_picker.clicked.connect(self._pick_date)
-        dr = QtWidgets.QWidget()
-        dh = QtWidgets.QHBoxLayout(dr)
-        dh.setContentsMargins(0, 0, 0, 0)
-        dh.setSpacing(6)
-        dh.addWidget(self.date_after, 1)
-        dh.addWidget(self.btn_date_picker, 0)
-        fl.addWidget(self._form_row("Only download after", dr))
+        fl.addWidget(self._form_row("Only download after", self._inline(self.date_after, self.btn_date_picker)))
 
         card = self._card(form, title="Output", subtitle="Name your files, organize your library, and restrict by upload date.")
         pv.addWidget(card)
@@ -1025,6 +1209,10 @@ class PreferencesDialog(QtWidgets.QDialog):
         pv.addWidget(card)
         return page
 
+    def _page_spotify(self) -> QtWidgets.QWidget:
+        self.spotdl_tab = SpotDLPreferencesTab(self.settings.SPOTDL)
+        return self.spotdl_tab
+
     # ---------- Styling ----------
     def _apply_styles(self) -> None:
         base = ""
@@ -1033,6 +1221,15 @@ class PreferencesDialog(QtWidgets.QDialog):
         except Exception:
             base = ""
 
+        # The sheet only depends on the shared dialog base, so it's composed
+        # once per theme and reused by later openings of the dialog.
+        qss = self._QSS_CACHE.get(base)
+        if qss is None:
+            qss = self._QSS_CACHE[base] = self._compose_styles(base)
+        self.setStyleSheet(qss)
+
+    @staticmethod
+    def _compose_styles(base: str) -> str:
         # Glassmorphism palette
         page_bg   = "qlineargradient(x1:0, y1:0, x2:1, y2:1, stop:0 #0a0e1a, stop:0.3 #15102e, stop:0.6 #1e1b4b, stop:1 #0c1733)"
         rail_bg   = "rgba(10, 10, 25, 180)"
@@ -1080,6 +1277,34 @@ class PreferencesDialog(QtWidgets.QDialog):
             color: {muted_text};
         }}
 
+        QListWidget#multiList {{
+            background: rgba(255, 255, 255, 10);
+            border: 1px solid rgba(255, 255, 255, 20);
+            border-radius: 8px;
+            font-size: 12.5px;
+            padding: 4px;
+        }}
+        QListWidget#multiList::item {{
+            padding: 4px 6px;
+            border-radius: 6px;
+            color: rgba(255, 255, 255, 180);
+        }}
+        QListWidget#multiList::item:hover {{
+            background: rgba(255, 255, 255, 25);
+        }}
+        QListWidget#multiList::indicator {{
+            width: 16px;
+            height: 16px;
+            border-radius: 4px;
+            border: 1px solid rgba(255, 255, 255, 40);
+            background: rgba(255, 255, 255, 15);
+        }}
+        QListWidget#multiList::indicator:checked {{
+            background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+                stop:0 {highlight}, stop:1 {accent2});
+            border: 1px solid {highlight};
+        }}
+
         QListWidget#sidebar {{
             background: {rail_bg};
             border: 1px solid {border_c};
@@ -1145,10 +1370,12 @@ class PreferencesDialog(QtWidgets.QDialog):
         QFrame#card {{
             background: {card_bg};
             border: 1px solid {border_c};
+            border-bottom: 1px solid rgba(0, 0, 0, 90);
             border-radius: 16px;
         }}
         QFrame#card:hover {{
             border: 1px solid rgba(255, 255, 255, 50);
+            border-bottom: 1px solid rgba(0, 0, 0, 90);
             background: {card_hover};
         }}
         QLabel#cardTitle {{
@@ -1211,6 +1438,10 @@ class PreferencesDialog(QtWidgets.QDialog):
             background: transparent;
         }}
 
+        QPushButton#fieldButton {{
+            min-height: 28px; /* 36px outer with the dialog's button padding */
+        }}
+
         QLineEdit#input, QComboBox#combo, QSpinBox#spin {{
             background: {field_bg};
             color: {strong_text};
@@ -1317,26 +1548,18 @@ class PreferencesDialog(QtWidgets.QDialog):
             border: 1px solid rgba(255, 255, 255, 15);
         }}
         """
-        self.setStyleSheet((base + "\n" + css).strip())
+        return (base + "\n" + css).strip()
 
     # ---------- Behavior helpers ----------
     def _on_cookies_source_changed(self, browser: str) -> None:
         use_browser = bool(browser.strip())
         self.cookies_path_input.setEnabled(not use_browser)
 
-    def _on_subtitles_toggled(self, enabled: bool) -> None:
-        self.languages_input.setEnabled(enabled)
-        self.auto_subs.setEnabled(enabled)
-        self.convert_subs.setEnabled(enabled)
-
-    def _on_archive_toggled(self, enabled: bool) -> None:
-        self.archive_path_input.setEnabled(enabled)
-
     def _browse_cookies(self) -> None:
         path, _ = QtWidgets.QFileDialog.getOpenFileName(
             self,
             "Select Cookies File",
-            str(self.settings.BASE_DIR),
+            self._base_dir_str,
             "Cookies (*.txt *.json);;All Files (*)",
         )
         if path:
@@ -1346,7 +1569,7 @@ class PreferencesDialog(QtWidgets.QDialog):
         path, _ = QtWidgets.QFileDialog.getOpenFileName(
             self,
             "Select Custom CA Certificate",
-            str(self.settings.BASE_DIR),
+            self._base_dir_str,
             "Certificates (*.crt *.pem *.cer);;All Files (*)",
         )
         if path:
@@ -1358,28 +1581,28 @@ class PreferencesDialog(QtWidgets.QDialog):
             QtWidgets.QMessageBox.information(self, "Select browser", "Please choose a browser profile to import from.")
             return
 
-        out = Path(self.settings.BASE_DIR) / "cookies.txt"
+        s = self.settings
+        out = Path(self._base_dir_str) / "cookies.txt"
         ok, msg = CookieManager.export_for_browser(browser, out)   
         if ok:
             self.cookies_path_input.setText(str(out))
 
             # Use a timestamp label for last import
-            from datetime import datetime
-            ts = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S UTC")
+            ts = datetime.datetime.now(datetime.timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
             label_text = f"Last imported: {out.name} ({ts})"
             self.cookies_last_label.setText(label_text)
 
             # Update running settings and persist immediately
             try:
                 # Keep stored metadata in settings in a stable form
-                if hasattr(self.settings, "COOKIES_LAST_IMPORTED"):
+                if hasattr(s, "COOKIES_LAST_IMPORTED"):
                     # store the timestamped label (human readable)
-                    self.settings.COOKIES_LAST_IMPORTED = label_text.replace("Last imported: ", "")
-                if hasattr(self.settings, "COOKIES_PATH"):
+                    s.COOKIES_LAST_IMPORTED = label_text.replace("Last imported: ", "")
+                if hasattr(s, "COOKIES_PATH"):
                     # keep settings.COOKIES_PATH in sync with exported file
-                    self.settings.COOKIES_PATH = out
-                if hasattr(self.settings, "save_config"):
-                    self.settings.save_config()
+                    s.COOKIES_PATH = out
+                if hasattr(s, "save_config"):
+                    s.save_config()
             except Exception:
                 pass
 
@@ -1391,71 +1614,37 @@ class PreferencesDialog(QtWidgets.QDialog):
         path, _ = QtWidgets.QFileDialog.getSaveFileName(
             self,
             "Select Archive File",
-            str(self.settings.BASE_DIR),
+            self._base_dir_str,
             "Text Files (*.txt);;All Files (*)",
         )
         if path:
             self.archive_path_input.setText(path)
 
     def _pick_date(self) -> None:
-        dlg = QtWidgets.QDialog(self)
-        dlg.setWindowTitle("Select Date")
-        try:
-            dlg.setStyleSheet(getattr(AppStyles, "DIALOG", "") or "")
-        except Exception:
-            pass
-
-        v = QtWidgets.QVBoxLayout(dlg)
-        cal = QtWidgets.QCalendarWidget()
-        cal.setGridVisible(True)
-
-        try:
-            txt = self.date_after.text().strip()
-            if txt:
-                dt = datetime.datetime.strptime(txt, "%Y%m%d").date()
-                cal.setSelectedDate(QDate(dt.year, dt.month, dt.day))
-        except Exception:
-            pass
-
-        v.addWidget(cal)
-        bb = QtWidgets.QDialogButtonBox(QtWidgets.QDialogButtonBox.Ok | QtWidgets.QDialogButtonBox.Cancel)
-        v.addWidget(bb)
-        bb.accepted.connect(dlg.accept)
-        bb.rejected.connect(dlg.reject)
-
-        if dlg.exec():
-            qd = cal.selectedDate()
+        # The calendar dialog is built on first use and reused afterwards
+        if self._date_dialog is None:
+            dlg = QtWidgets.QDialog(self)
+            dlg.setWindowTitle("Select Date")
+            # No stylesheet of its own: as our child it inherits the dialog's QSS
+
+            v = QtWidgets.QVBoxLayout(dlg)
+            cal = QtWidgets.QCalendarWidget()
+            cal.setGridVisible(True)
+            v.addWidget(cal)
+            bb = QtWidgets.QDialogButtonBox(QtWidgets.QDialogButtonBox.Ok | QtWidgets.QDialogButtonBox.Cancel)
+            v.addWidget(bb)
+            bb.accepted.connect(dlg.accept)
+            bb.rejected.connect(dlg.reject)
+            self._date_dialog, self._date_cal = dlg, cal
+
+        qd = QDate.fromString(self.date_after.text().strip(), "yyyyMMdd")
+        self._date_cal.setSelectedDate(qd if qd.isValid() else QDate.currentDate())
+
+        if self._date_dialog.exec():
+            qd = self._date_cal.selectedDate()
             self.date_after.setText(qd.toString("yyyyMMdd"))
 
     # ---------- Validation ----------
-    def _wire_validation(self) -> None:
-        self._rx_rate = _RX_RATE
-        self._rx_langs = _RX_LANGS
-        self._rx_items = _RX_ITEMS
-        self._rx_date = _RX_DATE
-
-        self.limit_rate_input.setValidator(QtGui.QRegularExpressionValidator(self._rx_rate, self))
-        self.languages_input.setValidator(QtGui.QRegularExpressionValidator(self._rx_langs, self))
-        self.playlist_items.setValidator(QtGui.QRegularExpressionValidator(self._rx_items, self))
-        self.date_after.setValidator(QtGui.QRegularExpressionValidator(self._rx_date, self))
-
-        for w in (
-            self.proxy_input,
-            self.cookies_path_input,
-            self.limit_rate_input,
-            self.languages_input,
-            self.playlist_items,
-            self.date_after,
-            self.custom_filename_input,
-        ):
-            w.textChanged.connect(self._validate_all)
-
-        self.filename_format_combo.currentIndexChanged.connect(self._validate_all)
-        self.retries_spin.valueChanged.connect(self._validate_all)
-        self.cookies_browser_combo.currentTextChanged.connect(self._validate_all)
-        self.subtitles_enabled.toggled.connect(self._validate_all)
-        self.enable_archive.toggled.connect(self._validate_all)
-
     def _mark_error(self, w: QtWidgets.QWidget, has_error: bool, tip: Optional[str] = None) -> None:
         w.setProperty("state", "error" if has_error else "")
         w.style().unpolish(w)
@@ -1475,7 +1664,7 @@ class PreferencesDialog(QtWidgets.QDialog):
             act = self._validation_actions.pop(le)
             le.removeAction(act)
 
-        icon = self.style().standardIcon(
+        icon = self._icon(
             QtWidgets.QStyle.SP_DialogApplyButton if ok or not le.text().strip() else QtWidgets.QStyle.SP_MessageBoxWarning
         )
         # Only show on error or when non-empty and ok
@@ -1532,28 +1721,32 @@ class PreferencesDialog(QtWidgets.QDialog):
 
         return True, ""
 
-    def _validate_all(self) -> None:
-        proxy = self.proxy_input.text().strip()
-        proxy_ok = (proxy == "") or proxy.startswith(("http://", "https://", "socks5://"))
+    def _validate_all(self, data: Optional[dict] = None) -> None:
+        # Checks run on values rather than widgets so sections that haven't
+        # been built yet (still at their saved values) are validated too.
+        if data is None:
+            data = self.get_settings()
 
-        ca_cert_txt = self.custom_ca_cert_input.text().strip()
+        proxy = data["PROXY_URL"]
+        proxy_ok = (proxy == "") or proxy.startswith(_PROXY_SCHEMES)
+
+        ca_cert_txt = data["CUSTOM_CA_CERT"]
         ca_cert_ok = (ca_cert_txt == "") or Path(ca_cert_txt).is_file()
 
         # Cookies: ok if browser chosen; if not, file path can be empty
         cookies_ok = True
 
-        rate_ok = self._rx_rate.match(self.limit_rate_input.text()).hasMatch()
-        langs_ok = (not self.subtitles_enabled.isChecked()) or (
-            self._rx_langs.match(self.languages_input.text()).hasMatch()
-            and bool(self.languages_input.text().strip())
+        rate_ok = _RATE_RE.match(data["LIMIT_RATE"]) is not None
+        langs_ok = (not data["WRITE_SUBS"]) or (
+            bool(data["SUB_LANGS"]) and _LANGS_RE.match(data["SUB_LANGS"]) is not None
         )
-        items_ok = self._rx_items.match(self.playlist_items.text()).hasMatch()
+        items_ok = _ITEMS_RE.match(data["PLAYLIST_ITEMS"]) is not None
 
-        date_txt = self.date_after.text().strip()
-        date_ok = self._rx_date.match(date_txt).hasMatch()
+        date_txt = data["DATEAFTER"]
+        date_ok = not date_txt or (len(date_txt) == 8 and date_txt.isascii() and date_txt.isdigit())
         if date_ok and date_txt:
             try:
-                datetime.datetime.strptime(date_txt, "%Y%m%d")
+                datetime.date(int(date_txt[:4]), int(date_txt[4:6]), int(date_txt[6:]))
             except ValueError:
                 date_ok = False
 
@@ -1561,27 +1754,38 @@ class PreferencesDialog(QtWidgets.QDialog):
         archive_ok = True
 
         # Custom filename template only needs to be valid when actually selected
-        is_custom_filename = self._filename_format_index_to_value(self.filename_format_combo.currentIndex()) == "custom"
+        is_custom_filename = data["FILENAME_FORMAT"] == "custom"
         if is_custom_filename:
-            filename_ok, filename_err = self._validate_filename_template(self.custom_filename_input.text())
+            filename_ok, filename_err = self._validate_filename_template(data["CUSTOM_FILENAME_TEMPLATE"])
         else:
             filename_ok, filename_err = True, ""
 
-        self._mark_error(self.proxy_input, not proxy_ok, "Must start with http://, https://, or socks5://")
-        self._mark_error(self.custom_ca_cert_input, not ca_cert_ok, "File does not exist")
-        self._mark_error(self.limit_rate_input, not rate_ok, "Use a number with K, M, or G (e.g., 500K, 5M, 1G)")
-        self._mark_error(
-            self.languages_input,
-            not langs_ok and self.subtitles_enabled.isChecked(),
+        self._mark_field("proxy_input", not proxy_ok, "Must start with http://, https://, or socks5://")
+        self._mark_field("custom_ca_cert_input", not ca_cert_ok, "File does not exist")
+        self._mark_field("limit_rate_input", not rate_ok, "Use a number with K, M, or G (e.g., 500K, 5M, 1G)")
+        self._mark_field(
+            "languages_input",
+            not langs_ok and data["WRITE_SUBS"],
             "Provide 2–3 letter codes, e.g., en, es, fra",
         )
-        self._mark_error(self.playlist_items, not items_ok, "Use indices or ranges: 1,5-10,15")
-        self._mark_error(self.date_after, not date_ok, "Must be YYYYMMDD (e.g., 20240101)")
-        self._mark_error(self.custom_filename_input, is_custom_filename and not filename_ok, filename_err or None)
+        self._mark_field("playlist_items", not items_ok, "Use indices or ranges: 1,5-10,15")
+        self._mark_field("date_after", not date_ok, "Must be YYYYMMDD (e.g., 20240101)")
+        self._mark_field("custom_filename_input", is_custom_filename and not filename_ok, filename_err or None)
 
         all_ok = proxy_ok and ca_cert_ok and cookies_ok and rate_ok and langs_ok and items_ok and date_ok and archive_ok and filename_ok
         self._set_save_enabled(all_ok)
 
+    def _mark_field(self, attr: str, has_error: bool, tip: Optional[str] = None) -> None:
+        w = getattr(self, attr, None)
+        if w is None:
+            if not has_error:
+                return
+            # A saved value on an unvisited page is invalid: build that page so
+            # the error can be shown and focused.
+            self._ensure_page(_FIELD_PAGE[attr])
+            w = getattr(self, attr)
+        self._mark_error(w, has_error, tip)
+
     def _set_save_enabled(self, enabled: bool) -> None:
         btn = self.buttons.button(QtWidgets.QDialogButtonBox.Save)
         if btn:
@@ -1591,79 +1795,39 @@ class PreferencesDialog(QtWidgets.QDialog):
             btn.setToolTip("Save changes" if enabled else "Fix highlighted fields to enable Save")
 
     # ---------- Dirty tracking ----------
-    def _wire_dirty_tracking(self) -> None:
-        def watch(w: QtCore.QObject):
-            if isinstance(w, QtWidgets.QLineEdit):
-                w.textChanged.connect(self._on_any_changed)
-            elif isinstance(w, QtWidgets.QComboBox):
-                w.currentTextChanged.connect(self._on_any_changed)
-            elif isinstance(w, QtWidgets.QSpinBox):
-                w.valueChanged.connect(self._on_any_changed)
-            elif isinstance(w, (QtWidgets.QCheckBox, UISwitch, QtWidgets.QRadioButton)):
-                w.toggled.connect(self._on_any_changed)
-
-        for w in (
-            # Network
-            self.proxy_input,
-            self.custom_ca_cert_input,
-            self.cookies_path_input,
-            self.cookies_browser_combo,
-            self.import_cookies_combo,
-            self.cookies_auto_refresh,
-            self.cookies_last_label,
-            self.limit_rate_input,
-            self.retries_spin,
-            # SponsorBlock
-            *self.category_cb.values(),
-            # Chapters
-            self.chapters_none,
-            self.chapters_embed,
-            self.chapters_split,
-            # Subtitles
-            self.subtitles_enabled,
-            self.languages_input,
-            self.auto_subs,
-            self.convert_subs,
-            # Playlist
-            self.enable_archive,
-            self.archive_path_input,
-            self.playlist_reverse,
-            self.playlist_items,
-            # Post
-            self.audio_normalize,
-            self.add_metadata,
-            self.crop_covers,
-            self.custom_ffmpeg,
-            self.video_format_combo,
-            self.write_thumbnail,
-            self.convert_thumbnails,
-            self.embed_thumbnail,
-            # Output
-            self.organize_uploader,
-            self.date_after,
-            self.filename_format_combo,
-            self.custom_filename_input,
-            # Experimental
-            self.live_stream,
-            self.yt_music,
-        ):
-            watch(w)
+    def _watch(self, w: QtWidgets.QWidget) -> None:
+        # Change signals restart the debounce timer directly through its C++
+        # start() slot, so typing doesn't run a Python slot per keystroke.
+        # (Connecting to the bound `start` would pick start(int) for int/bool
+        # signals and turn the new value into the timer interval.)
+        for cls, signal in _CHANGE_SIGNALS:
+            if isinstance(w, cls):
+                QtCore.QObject.connect(w, QtCore.SIGNAL(signal), self._change_timer, QtCore.SLOT("start()"))
+                return
 
-        # Baseline snapshot
-        self._initial_snapshot = self.get_settings()
+    def _flush_changes(self) -> None:
+        self._change_timer.stop()
+        data = self.get_settings()
+        # Edits that return a field to its saved value leave the dialog clean.
+        self._set_dirty(_snapshot_key(data) != self._initial_key)
+        self._validate_all(data)
 
-    def _on_any_changed(self, *args) -> None:
-        self._set_dirty(True)
+    def _set_baseline(self, data: dict) -> None:
+        self._initial_snapshot = data
+        self._initial_key = _snapshot_key(data)
 
     def _set_dirty(self, dirty: bool) -> None:
+        # Most evaluations don't flip the state; only repolish the footer when it does.
+        if dirty == self._dirty and self._status_shown:
+            return
         self._dirty = dirty
         self._update_status()
 
     def _update_status(self) -> None:
-        self.status_lbl.setText(
-            "●  Unsaved changes — press Ctrl+S to save" if self._dirty else "●  All changes saved"
-        )
-        self.status_lbl.setProperty("state", "dirty" if self._dirty else "clean")
+        self._status_shown = True
+        text, state = self._STATUS[self._dirty]
+        self.status_lbl.setText(text)
+        self.status_lbl.setProperty("state", state)
         self.status_lbl.style().unpolish(self.status_lbl)
         self.status_lbl.style().polish(self.status_lbl)
         self.reset_btn.setEnabled(self._dirty)
@@ -1698,10 +1862,14 @@ class PreferencesDialog(QtWidgets.QDialog):
         page = sa.widget()
         if not page:
             return
-        # Preferred order of focusable widgets
-        candidates: List[QtWidgets.QWidget] = []
-        for t in (QtWidgets.QLineEdit, QtWidgets.QComboBox, QtWidgets.QSpinBox, UISwitch, QtWidgets.QCheckBox, QtWidgets.QRadioButton):
-            candidates.extend(page.findChildren(t))
+        # Preferred order of focusable widgets; a page's children don't change
+        # once built, so the tree is only walked on its first visit.
+        candidates = self._focus_candidates.get(self.stack.currentIndex())
+        if candidates is None:
+            candidates = []
+            for t in (QtWidgets.QLineEdit, QtWidgets.QComboBox, QtWidgets.QSpinBox, UISwitch, QtWidgets.QCheckBox, QtWidgets.QRadioButton):
+                candidates.extend(page.findChildren(t))
+            self._focus_candidates[self.stack.currentIndex()] = candidates
         for w in candidates:
             if w.isVisible() and w.isEnabled() and w.focusPolicy() != QtCore.Qt.NoFocus:
                 w.setFocus(QtCore.Qt.OtherFocusReason)
@@ -1758,6 +1926,8 @@ class PreferencesDialog(QtWidgets.QDialog):
 
     # ---------- Accept / Reject ----------
     def _on_accept(self) -> None:
+        if self._change_timer.isActive():
+            self._flush_changes()
         btn = self.buttons.button(QtWidgets.QDialogButtonBox.Save)
         if btn and not btn.isEnabled():
             err = self._first_error_widget()
@@ -1768,11 +1938,13 @@ class PreferencesDialog(QtWidgets.QDialog):
             return
 
         self.apply()
-        self._initial_snapshot = self.get_settings()
+        self._set_baseline(self.get_settings())
         self._set_dirty(False)
         self.accept()
 
     def _on_reject(self) -> None:
+        if self._change_timer.isActive():
+            self._flush_changes()
         if self._dirty:
             resp = QtWidgets.QMessageBox.question(
                 self,
@@ -1786,97 +1958,113 @@ class PreferencesDialog(QtWidgets.QDialog):
         self.reject()
 
     # ---------- Data I/O ----------
-    def _load_from_settings(self) -> None:
-        # Network
-        self.proxy_input.setText(getattr(self.settings, "PROXY_URL", "") or "")
-        self.cookies_path_input.setText(str(getattr(self.settings, "COOKIES_PATH", "") or ""))
-        self.cookies_browser_combo.setCurrentText(getattr(self.settings, "COOKIES_FROM_BROWSER", "") or "")
-        self.cookies_auto_refresh.setChecked(bool(getattr(self.settings, "COOKIES_AUTO_REFRESH", False)))
-        self.ignore_ssl_errors.setChecked(self.settings.IGNORE_SSL_ERRORS)
-        self.custom_ca_cert_input.setText(getattr(self.settings, "CUSTOM_CA_CERT", "") or "")
-        last = getattr(self.settings, "COOKIES_LAST_IMPORTED", "")
-        self.cookies_last_label.setText(f"Last imported: {last}" if last else "")        
-        self.retries_spin.setValue(int(getattr(self.settings, "RETRIES", 3)))
-        self.limit_rate_input.setText(getattr(self.settings, "LIMIT_RATE", "") or "")
-
-        # SponsorBlock
-        selected = set(getattr(self.settings, "SPONSORBLOCK_CATEGORIES", []) or [])
-        for code, cb in self.category_cb.items():
-            cb.setChecked(code in selected)
-
-        # Chapters
-        mode = getattr(self.settings, "CHAPTERS_MODE", "none")
-        if mode == "embed":
-            self.chapters_embed.setChecked(True)
-        elif mode == "split":
-            self.chapters_split.setChecked(True)
-        else:
-            self.chapters_none.setChecked(True)
-
-        # Subtitles
-        self.subtitles_enabled.setChecked(bool(getattr(self.settings, "WRITE_SUBS", False)))
-        self.languages_input.setText(getattr(self.settings, "SUB_LANGS", "") or "")
-        self.auto_subs.setChecked(bool(getattr(self.settings, "WRITE_AUTO_SUBS", False)))
-        self.convert_subs.setChecked(bool(getattr(self.settings, "CONVERT_SUBS_TO_SRT", False)))
-        self._on_subtitles_toggled(self.subtitles_enabled.isChecked())
-
-        # Playlist
-        self.enable_archive.setChecked(bool(getattr(self.settings, "ENABLE_ARCHIVE", False)))
-        self.archive_path_input.setText(str(getattr(self.settings, "ARCHIVE_PATH", "") or ""))
-        self._on_archive_toggled(self.enable_archive.isChecked())
-        self.playlist_reverse.setChecked(bool(getattr(self.settings, "PLAYLIST_REVERSE", False)))
-        self.playlist_items.setText(getattr(self.settings, "PLAYLIST_ITEMS", "") or "")
-
-        # Post-processing
-        self.audio_normalize.setChecked(bool(getattr(self.settings, "AUDIO_NORMALIZE", False)))
-        self.add_metadata.setChecked(bool(getattr(self.settings, "ADD_METADATA", False)))
-        self.crop_covers.setChecked(bool(getattr(self.settings, "CROP_AUDIO_COVERS", False)))
-        self.custom_ffmpeg.setText(getattr(self.settings, "CUSTOM_FFMPEG_ARGS", "") or "")
-        vf = getattr(self.settings, "VIDEO_FORMAT", ".mkv") or ".mkv"
-        if vf not in (".mkv", ".mp4", ".webm"):
-            vf = ".mkv"
-        
-        # ─────────── Thumbnail state ───────────
-        self.write_thumbnail.setChecked(bool(getattr(self.settings, "WRITE_THUMBNAIL", False)))
-        self.convert_thumbnails.setChecked(bool(getattr(self.settings, "CONVERT_THUMBNAILS", True)))
-        self.embed_thumbnail.setChecked(bool(getattr(self.settings, "EMBED_THUMBNAIL", True)))
-        # ─────────────────────────────────────────
-       
-        self.video_format_combo.setCurrentText(vf)
-
-        # Output
-        self.organize_uploader.setChecked(bool(getattr(self.settings, "ORGANIZE_BY_UPLOADER", False)))
-        self.date_after.setText(getattr(self.settings, "DATEAFTER", "") or "")
-        fmt = getattr(self.settings, "FILENAME_FORMAT", "default") or "default"
-        block = QtCore.QSignalBlocker(self.filename_format_combo)
-        self.filename_format_combo.setCurrentIndex(self._filename_format_value_to_index(fmt))
-        del block
-        self.custom_filename_input.setText(getattr(self.settings, "CUSTOM_FILENAME_TEMPLATE", "") or "")
-        self._on_filename_format_changed(self.filename_format_combo.currentIndex())
-
-        # Experimental
-        self.live_stream.setChecked(bool(getattr(self.settings, "LIVE_FROM_START", False)))
-        self.yt_music.setChecked(bool(getattr(self.settings, "YT_MUSIC_METADATA", False)))
+    def _snapshot_from_settings(self) -> dict:
+        """Settings as get_settings() would report them from freshly loaded widgets."""
+        s = self.settings
+        browser = (getattr(s, "COOKIES_FROM_BROWSER", "") or "").strip()
+        selected = frozenset(getattr(s, "SPONSORBLOCK_CATEGORIES", []) or [])
+        mode = getattr(s, "CHAPTERS_MODE", "none")
+        vf = getattr(s, "VIDEO_FORMAT", ".mkv") or ".mkv"
+        fmt = getattr(s, "FILENAME_FORMAT", "default") or "default"
+        return self._with_default_paths({
+            "PROXY_URL": (getattr(s, "PROXY_URL", "") or "").strip(),
+            "IGNORE_SSL_ERRORS": bool(getattr(s, "IGNORE_SSL_ERRORS", False)),
+            "CUSTOM_CA_CERT": (getattr(s, "CUSTOM_CA_CERT", "") or "").strip(),
+            "COOKIES_PATH": _as_path(getattr(s, "COOKIES_PATH", None)),
+            "COOKIES_FROM_BROWSER": browser if browser in _COOKIE_BROWSERS else "",
+            "COOKIES_AUTO_REFRESH": bool(getattr(s, "COOKIES_AUTO_REFRESH", False)),
+            "COOKIES_LAST_IMPORTED": getattr(s, "COOKIES_LAST_IMPORTED", "") or "",
+            "SPONSORBLOCK_CATEGORIES": [code for code in _SPONSORBLOCK_CODES if code in selected],
+            "CHAPTERS_MODE": mode if mode in ("embed", "split") else "none",
+            "WRITE_SUBS": bool(getattr(s, "WRITE_SUBS", False)),
+            "SUB_LANGS": (getattr(s, "SUB_LANGS", "") or "").strip(),
+            "WRITE_AUTO_SUBS": bool(getattr(s, "WRITE_AUTO_SUBS", False)),
+            "CONVERT_SUBS_TO_SRT": bool(getattr(s, "CONVERT_SUBS_TO_SRT", False)),
+            "ENABLE_ARCHIVE": bool(getattr(s, "ENABLE_ARCHIVE", False)),
+            "ARCHIVE_PATH": _as_path(getattr(s, "ARCHIVE_PATH", None)),
+            "PLAYLIST_REVERSE": bool(getattr(s, "PLAYLIST_REVERSE", False)),
+            "PLAYLIST_ITEMS": (getattr(s, "PLAYLIST_ITEMS", "") or "").strip(),
+            "AUDIO_NORMALIZE": bool(getattr(s, "AUDIO_NORMALIZE", False)),
+            "ADD_METADATA": bool(getattr(s, "ADD_METADATA", False)),
+            "CROP_AUDIO_COVERS": bool(getattr(s, "CROP_AUDIO_COVERS", False)),
+            "CUSTOM_FFMPEG_ARGS": (getattr(s, "CUSTOM_FFMPEG_ARGS", "") or "").strip(),
+            "WRITE_THUMBNAIL": bool(getattr(s, "WRITE_THUMBNAIL", False)),
+            "CONVERT_THUMBNAILS": bool(getattr(s, "CONVERT_THUMBNAILS", True)),
+            "EMBED_THUMBNAIL": bool(getattr(s, "EMBED_THUMBNAIL", True)),
+            "VIDEO_FORMAT": vf if vf in _VIDEO_FORMATS else ".mkv",
+            "ORGANIZE_BY_UPLOADER": bool(getattr(s, "ORGANIZE_BY_UPLOADER", False)),
+            "FILENAME_FORMAT": self._filename_format_index_to_value(self._filename_format_value_to_index(fmt)),
+            "CUSTOM_FILENAME_TEMPLATE": (getattr(s, "CUSTOM_FILENAME_TEMPLATE", "") or "").strip(),
+            "DATEAFTER": (getattr(s, "DATEAFTER", "") or "").strip(),
+            "LIVE_FROM_START": bool(getattr(s, "LIVE_FROM_START", False)),
+            "YT_MUSIC_METADATA": bool(getattr(s, "YT_MUSIC_METADATA", False)),
+            "LIMIT_RATE": (getattr(s, "LIMIT_RATE", "") or "").strip(),
+            "RETRIES": min(100, max(1, int(getattr(s, "RETRIES", 3)))),
+        })
 
     def _apply_snapshot(self, data: dict) -> None:
-        # Network
-        self.proxy_input.setText(data.get("PROXY_URL", ""))
-        self.ignore_ssl_errors.setChecked(bool(data.get("IGNORE_SSL_ERRORS", False)))
-        self.custom_ca_cert_input.setText(data.get("CUSTOM_CA_CERT", ""))
-        self.cookies_browser_combo.setCurrentText(data.get("COOKIES_FROM_BROWSER", ""))
-        self.cookies_path_input.setText(str(data.get("COOKIES_PATH", "") or ""))
-        self.cookies_auto_refresh.setChecked(bool(data.get("COOKIES_AUTO_REFRESH", False)))
+        # Pages that were never built still show `data` once they are: they're
+        # populated from the snapshot, which only changes on save.
+        for index in sorted(self._built_pages):
+            self._load_page_values(index, data)
+
+    def _collect_tracked(self, index: int) -> None:
+        # Resolved once per page; loads, resets and reads reuse these lists.
+        spec = _PAGES[index]
+        fields = [(getattr(self, attr), key, kind) for attr, key, kind in spec.fields]
+        widgets: List[QtWidgets.QWidget] = [w for w, _, _ in fields]
+        for attr in spec.tracked:
+            w = getattr(self, attr)
+            widgets.extend(w if isinstance(w, list) else (w,))
+        self._page_fields[index] = fields
+        self._page_groups[index] = [
+            (getattr(self, sw), [getattr(self, a) for a in deps]) for sw, deps in spec.groups
+        ]
+        self._page_widgets[index] = widgets
+        self._page_switches[index] = [w for w in widgets if isinstance(w, UISwitch)]
+
+    def _load_page_values(self, index: int, data: dict) -> None:
+        # Fill a page with its change signals blocked, so a load or reset doesn't
+        # dispatch one dirty/validation slot per widget; groups and setters
+        # re-run the enable/disable side effects themselves.
+        setter = _PAGES[index].setter
+        blockers = [QtCore.QSignalBlocker(w) for w in self._page_widgets[index]]
+        try:
+            for w, key, kind in self._page_fields[index]:
+                _FIELD_SET[kind](w, data[key])
+            for sw, deps in self._page_groups[index]:
+                self._enable_group(deps, sw.isChecked())
+            if setter:
+                getattr(self, setter)(data)
+        finally:
+            del blockers
+        for sw in self._page_switches[index]:
+            sw.sync_offset()
+
+    @staticmethod
+    def _enable_group(widgets: List[QtWidgets.QWidget], enabled: bool) -> None:
+        for w in widgets:
+            w.setEnabled(enabled)
+
+    def _set_network(self, data: dict) -> None:
+        self._on_cookies_source_changed(self.cookies_browser_combo.currentText())
         last = data.get("COOKIES_LAST_IMPORTED", "")
         self.cookies_last_label.setText(f"Last imported: {last}" if last else "")
-        self.limit_rate_input.setText(data.get("LIMIT_RATE", ""))
-        self.retries_spin.setValue(int(data.get("RETRIES", self.retries_spin.value())))
 
-        # SponsorBlock
-        sel = set(data.get("SPONSORBLOCK_CATEGORIES", []))
-        for code, cb in self.category_cb.items():
+    def _get_network(self) -> dict:
+        return {
+            "COOKIES_LAST_IMPORTED": last.replace("Last imported: ", "") if (last := self.cookies_last_label.text()) else "",
+        }
+
+    def _set_sponsorblock(self, data: dict) -> None:
+        sel = frozenset(data.get("SPONSORBLOCK_CATEGORIES", []))
+        for code, cb in zip(_SPONSORBLOCK_CODES, self._sb_ordered_cbs):
             cb.setChecked(code in sel)
 
-        # Chapters
+    def _get_sponsorblock(self) -> dict:
+        return {"SPONSORBLOCK_CATEGORIES": [code for code, cb in zip(_SPONSORBLOCK_CODES, self._sb_ordered_cbs) if cb.isChecked()]}
+
+    def _set_chapters(self, data: dict) -> None:
         ch = data.get("CHAPTERS_MODE", "none")
         if ch == "embed":
             self.chapters_embed.setChecked(True)
@@ -1885,99 +2073,47 @@ class PreferencesDialog(QtWidgets.QDialog):
         else:
             self.chapters_none.setChecked(True)
 
-        # Subtitles
-        self.subtitles_enabled.setChecked(bool(data.get("WRITE_SUBS", False)))
-        self.languages_input.setText(data.get("SUB_LANGS", ""))
-        self.auto_subs.setChecked(bool(data.get("WRITE_AUTO_SUBS", False)))
-        self.convert_subs.setChecked(bool(data.get("CONVERT_SUBS_TO_SRT", False)))
-        self._on_subtitles_toggled(self.subtitles_enabled.isChecked())
-
-        # Playlist
-        self.enable_archive.setChecked(bool(data.get("ENABLE_ARCHIVE", False)))
-        self.archive_path_input.setText(str(data.get("ARCHIVE_PATH", "") or ""))
-        self._on_archive_toggled(self.enable_archive.isChecked())
-        self.playlist_reverse.setChecked(bool(data.get("PLAYLIST_REVERSE", False)))
-        self.playlist_items.setText(data.get("PLAYLIST_ITEMS", ""))
-
-        # Post-processing
-        self.audio_normalize.setChecked(bool(data.get("AUDIO_NORMALIZE", False)))
-        self.add_metadata.setChecked(bool(data.get("ADD_METADATA", False)))
-        self.crop_covers.setChecked(bool(data.get("CROP_AUDIO_COVERS", False)))
-        self.custom_ffmpeg.setText(data.get("CUSTOM_FFMPEG_ARGS", ""))
-        vf = data.get("VIDEO_FORMAT", ".mkv") or ".mkv"
-        if vf not in (".mkv", ".mp4", ".webm"):
-            vf = ".mkv"
-
-        # Thumbnail flags
-        self.write_thumbnail.setChecked(bool(data.get("WRITE_THUMBNAIL", False)))
-        self.convert_thumbnails.setChecked(bool(data.get("CONVERT_THUMBNAILS", True)))
-        self.embed_thumbnail.setChecked(bool(data.get("EMBED_THUMBNAIL", True)))
-
-        self.video_format_combo.setCurrentText(vf)
-
-        # Output
-        self.organize_uploader.setChecked(bool(data.get("ORGANIZE_BY_UPLOADER", False)))
-        self.date_after.setText(data.get("DATEAFTER", ""))
-        fmt = data.get("FILENAME_FORMAT", "default") or "default"
-        block = QtCore.QSignalBlocker(self.filename_format_combo)
-        self.filename_format_combo.setCurrentIndex(self._filename_format_value_to_index(fmt))
-        del block
-        self.custom_filename_input.setText(data.get("CUSTOM_FILENAME_TEMPLATE", ""))
-        self._on_filename_format_changed(self.filename_format_combo.currentIndex())
-
-        # Experimental
-        self.live_stream.setChecked(bool(data.get("LIVE_FROM_START", False)))
-        self.yt_music.setChecked(bool(data.get("YT_MUSIC_METADATA", False)))
-
-    def get_settings(self) -> dict:
-        # Chapters mode
+    def _get_chapters(self) -> dict:
         if self.chapters_embed.isChecked():
             ch_mode = "embed"
         elif self.chapters_split.isChecked():
             ch_mode = "split"
         else:
             ch_mode = "none"
+        return {"CHAPTERS_MODE": ch_mode}
 
-        sb = [code for code, cb in self.category_cb.items() if cb.isChecked()]
+    def _set_output(self, data: dict) -> None:
+        fmt = data.get("FILENAME_FORMAT", "default") or "default"
+        self.filename_format_combo.setCurrentIndex(self._filename_format_value_to_index(fmt))
+        self._on_filename_format_changed(self.filename_format_combo.currentIndex())
 
+    def _get_output(self) -> dict:
         return {
-            "PROXY_URL": self.proxy_input.text().strip(),
-            "IGNORE_SSL_ERRORS": self.ignore_ssl_errors.isChecked(),
-            "CUSTOM_CA_CERT": self.custom_ca_cert_input.text().strip(),
-            "COOKIES_PATH": Path(self.cookies_path_input.text().strip()) if self.cookies_path_input.text().strip() else Path(""),
-            "COOKIES_FROM_BROWSER": self.cookies_browser_combo.currentText().strip(),
-            "COOKIES_AUTO_REFRESH": self.cookies_auto_refresh.isChecked(),
-            "COOKIES_LAST_IMPORTED": self.cookies_last_label.text().replace("Last imported: ", "") if self.cookies_last_label.text() else "",
-            "SPONSORBLOCK_CATEGORIES": sb,
-            "CHAPTERS_MODE": ch_mode,
-            "WRITE_SUBS": self.subtitles_enabled.isChecked(),
-            "SUB_LANGS": self.languages_input.text().strip(),
-            "WRITE_AUTO_SUBS": self.auto_subs.isChecked(),
-            "CONVERT_SUBS_TO_SRT": self.convert_subs.isChecked(),
-            "ENABLE_ARCHIVE": self.enable_archive.isChecked(),
-            "ARCHIVE_PATH": Path(self.archive_path_input.text().strip()) if self.archive_path_input.text().strip() else Path(""),
-            "PLAYLIST_REVERSE": self.playlist_reverse.isChecked(),
-            "PLAYLIST_ITEMS": self.playlist_items.text().strip(),
-            "AUDIO_NORMALIZE": self.audio_normalize.isChecked(),
-            "ADD_METADATA": self.add_metadata.isChecked(),
-            "CROP_AUDIO_COVERS": self.crop_covers.isChecked(),
-            "CUSTOM_FFMPEG_ARGS": self.custom_ffmpeg.text().strip(),
-            # ─────────── Thumbnail flags ───────────
-            "WRITE_THUMBNAIL":    self.write_thumbnail.isChecked(),
-            "CONVERT_THUMBNAILS": self.convert_thumbnails.isChecked(),
-            "EMBED_THUMBNAIL":    self.embed_thumbnail.isChecked(),
-            # ─────────────────────────────────────────
-            "VIDEO_FORMAT": self.video_format_combo.currentText(),
-            "ORGANIZE_BY_UPLOADER": self.organize_uploader.isChecked(),
             "FILENAME_FORMAT": self._filename_format_index_to_value(self.filename_format_combo.currentIndex()),
-            "CUSTOM_FILENAME_TEMPLATE": self.custom_filename_input.text().strip(),
-            "DATEAFTER": self.date_after.text().strip(),
-            "LIVE_FROM_START": self.live_stream.isChecked(),
-            "YT_MUSIC_METADATA": self.yt_music.isChecked(),
-            "LIMIT_RATE": self.limit_rate_input.text().strip(),
-            "RETRIES": self.retries_spin.value(),
         }
 
+    def get_settings(self) -> dict:
+        # Unvisited pages can't have changed, so they report the baseline.
+        data = dict(self._initial_snapshot)
+        for index in sorted(self._built_pages):
+            for w, key, kind in self._page_fields[index]:
+                data[key] = _FIELD_GET[kind](w)
+            getter = _PAGES[index].getter
+            if getter:
+                data.update(getattr(self, getter)())
+        return self._with_default_paths(data)
+
+    def _with_default_paths(self, data: dict) -> dict:
+        """Fill an unset cookies/archive path with its default file, in place.
+
+        An emptied field falls back to the default file, as on a fresh install;
+        workers expect a Path there, never None.
+        """
+        for key, default_name in (("COOKIES_PATH", "cookies.txt"), ("ARCHIVE_PATH", "archive.txt")):
+            if data.get(key) is None:
+                data[key] = (Path(self.settings.BASE_DIR) / default_name).resolve()
+        return data
+
     def apply(self) -> None:
         """
         Applies current form values to self.settings (preferred integration point for MainWindow).
@@ -2015,15 +2151,13 @@ class PreferencesDialog(QtWidgets.QDialog):
     # ---------- Events ----------
     def showEvent(self, event: QtGui.QShowEvent) -> None:
         super().showEvent(event)
-        if not self._filters_installed:
-            self._filters_installed = True
-            for le in self._line_edits_for_filters():
-                le.installEventFilter(self)
         self._update_responsive_layout()
 
     def resizeEvent(self, event: QtGui.QResizeEvent) -> None:
         super().resizeEvent(event)
-        self._update_responsive_layout()
+        # The layout mode and SponsorBlock columns depend only on width
+        if event.size().width() != event.oldSize().width():
+            self._resize_timer.start()
 
     def eventFilter(self, obj: QtCore.QObject, event: QtCore.QEvent) -> bool:
         # Intercept Enter/Return in any QLineEdit to trigger Save via Ctrl+Enter or ⌘+Enter
@@ -2034,6 +2168,8 @@ class PreferencesDialog(QtWidgets.QDialog):
             if (mods & (QtCore.Qt.ControlModifier | QtCore.Qt.MetaModifier)) and \
                ke.key() in (QtCore.Qt.Key_Return, QtCore.Qt.Key_Enter):
 
+                if self._change_timer.isActive():
+                    self._flush_changes()
                 save_btn = self.buttons.button(QtWidgets.QDialogButtonBox.Save)
                 # If Save is disabled, focus first invalid field and show tooltip
                 if save_btn and not save_btn.isEnabled():
@@ -2054,36 +2190,22 @@ class PreferencesDialog(QtWidgets.QDialog):
         return super().eventFilter(obj, event)
 
     # ---------- Utilities ----------
-    def _line_edits_for_filters(self) -> List[QtWidgets.QLineEdit]:
-        fields: List[QtWidgets.QLineEdit] = []
-        for w in (
-            getattr(self, "proxy_input", None),
-            getattr(self, "custom_ca_cert_input", None),
-            getattr(self, "cookies_path_input", None),
-            getattr(self, "limit_rate_input", None),
-            getattr(self, "languages_input", None),
-            getattr(self, "playlist_items", None),
-            getattr(self, "date_after", None),
-            getattr(self, "custom_ffmpeg", None),
-            getattr(self, "archive_path_input", None),
-            getattr(self, "custom_filename_input", None),
-        ):
-            if isinstance(w, QtWidgets.QLineEdit):
-                fields.append(w)
-        return fields
-
     def _first_error_widget(self) -> Optional[QtWidgets.QWidget]:
-        for w in (self.proxy_input, self.custom_ca_cert_input, self.limit_rate_input, self.languages_input, self.playlist_items, self.date_after, self.custom_filename_input):
-            if (w.property("state") or "") == "error":
+        for attr in ("proxy_input", "custom_ca_cert_input", "limit_rate_input", "languages_input", "playlist_items", "date_after", "custom_filename_input"):
+            w = getattr(self, attr, None)
+            if w is not None and (w.property("state") or "") == "error":
                 return w
         return None
 
     # ---------- Responsive helpers ----------
     def _update_responsive_layout(self) -> None:
         is_narrow = self.width() < self.MIN_WIDE_LAYOUT
+        mode = "narrow" if is_narrow else "wide"
         # Toggle sidebar and top section combo for narrow widths
-        self.sidebar.setVisible(not is_narrow)
-        self.section_combo.setVisible(is_narrow)
+        if mode != self._layout_mode:
+            self._layout_mode = mode
+            self.sidebar.setVisible(not is_narrow)
+            self.section_combo.setVisible(is_narrow)
 
         # Keep selections in sync when toggling views
         idx = self.stack.currentIndex()
@@ -2122,14 +2244,18 @@ class PreferencesDialog(QtWidgets.QDialog):
                 self.section_combo.setCurrentIndex(index)
 
     # ---------- Label alignment pass ----------
-    def _finalize_label_column(self) -> None:
+    def _finalize_label_column(self, first: int = 0) -> None:
         """
         Measure widest label and set a uniform minimum width, so every form row
         aligns perfectly across all pages. Keeps toggles snapped to the right.
+        Runs again as each page is built, measuring labels from `first` on; the
+        column only ever widens, and built pages are only touched when it does.
         """
-        max_w = 0
+        max_w = self._label_col_width
         fm = self.fontMetrics()
-        for lbl in self._label_refs:
+        for lbl in self._label_refs[first:]:
             max_w = max(max_w, fm.horizontalAdvance(lbl.text()) + 8)
-        for lbl in self._label_refs:
+        grew = max_w != self._label_col_width
+        self._label_col_width = max_w
+        for lbl in (self._label_refs if grew else self._label_refs[first:]):
             lbl.setMinimumWidth(max_w)
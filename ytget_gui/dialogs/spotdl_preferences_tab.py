@@ -29,7 +29,7 @@ from __future__ import annotations
 
 from typing import List
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QEvent, Qt
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -45,9 +45,7 @@ from PySide6.QtWidgets import (
     QFrame,
     QScrollArea,
     QSizePolicy,
-    QGraphicsDropShadowEffect,
 )
-from PySide6.QtGui import QColor
 
 from ytget_gui.spotdl_settings import (
     SpotDLSettings,
@@ -140,12 +138,6 @@ def _card(title: str, subtitle: str = "") -> tuple[QFrame, QVBoxLayout]:
         head.addWidget(st)
     v.addLayout(head)
 
-    eff = QGraphicsDropShadowEffect(card)
-    eff.setBlurRadius(20)
-    eff.setColor(QColor(0, 0, 0, 80))
-    eff.setOffset(0, 6)
-    card.setGraphicsEffect(eff)
-
     return card, v
 
 
@@ -169,37 +161,15 @@ class _MultiSelectList(QListWidget):
             item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
             item.setCheckState(Qt.Checked if c in selected else Qt.Unchecked)
             self.addItem(item)
-        self.setStyleSheet("""
-            QListWidget#multiList {
-                background: rgba(255, 255, 255, 10);
-                border: 1px solid rgba(255, 255, 255, 20);
-                border-radius: 8px;
-                font-size: 12.5px;
-                padding: 4px;
-            }
-            QListWidget#multiList::item {
-                padding: 4px 6px;
-                border-radius: 6px;
-                color: rgba(255, 255, 255, 180);
-            }
-            QListWidget#multiList::item:hover {
-                background: rgba(255, 255, 255, 25);
-            }
-            QListWidget#multiList::indicator {
-                width: 16px;
-                height: 16px;
-                border-radius: 4px;
-                border: 1px solid rgba(255, 255, 255, 40);
-                background: rgba(255, 255, 255, 15);
-            }
-            QListWidget#multiList::indicator:checked {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #00E5FF, stop:1 #7C4DFF);
-                border: 1px solid #00E5FF;
-            }
-        """)
         self._fit_to_contents()
 
+    def changeEvent(self, event: QEvent) -> None:
+        # Styled by the Preferences dialog sheet, which only reaches us once
+        # we're parented into it; item padding changes the row height.
+        super().changeEvent(event)
+        if event.type() == QEvent.StyleChange:
+            self._fit_to_contents()
+
     def _fit_to_contents(self) -> None:
         """Grow the widget's fixed height to show every row with no scrollbar."""
         rows = self.count()
@@ -30,7 +30,11 @@ import stat
 import subprocess
 import sys
 import tempfile
+import threading
+import time
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
@@ -47,6 +51,7 @@ from PySide6.QtWidgets import (
 
 # ── helpers imported from the app ──────────────────────────────────────────
 from ytget_gui.utils.paths import is_windows, executable_name
+from ytget_gui.utils.http import get_session
 from ytget_gui.settings import AppSettings
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -89,7 +94,26 @@ TOOLS: Dict[str, Dict[str, Any]] = {
     },
 }
 
-REQUEST_TIMEOUT = 15   # seconds
+# (connect, read) seconds: an unreachable host fails within a few seconds
+# instead of holding a check for the full read allowance.
+REQUEST_TIMEOUT  = (3.05, 15)
+DOWNLOAD_TIMEOUT = (3.05, 60)
+DOWNLOAD_CHUNK  = 1 << 20   # bytes per read/write while streaming an update
+DOWNLOAD_ATTEMPTS = 3       # connections tried per download, resuming via Range
+
+# Release/package JSON by URL -> (fetched at, ETag, parsed body). Process-wide
+# because every "Re-check All" builds a fresh UpdateChecker; entries younger
+# than _RELEASE_TTL are reused outright, older ones are revalidated with
+# If-None-Match so an unchanged release costs a bodyless 304.
+_RELEASE_TTL = 300   # seconds
+_release_cache: Dict[str, Tuple[float, str, Any]] = {}
+_release_cache_lock = threading.Lock()
+
+# ETags and their extracted fields also outlive the process, in
+# BASE_DIR/update_cache.json, so the first check of a session is a 304 too
+# (which GitHub doesn't count against the unauthenticated rate limit).
+_RELEASE_CACHE_FILE = "update_cache.json"
+_release_cache_loaded = False
 
 # Prevent a console/terminal window from flashing up when we spawn helper
 # processes (yt-dlp --version, deno --version, pip, etc.) on Windows.
@@ -105,9 +129,11 @@ if sys.platform == "win32":
 #  PLATFORM HELPERS
 # ═══════════════════════════════════════════════════════════════════════════
 
+@lru_cache(maxsize=None)
 def _system() -> str:
     return platform.system().lower()
 
+@lru_cache(maxsize=None)
 def _machine() -> str:
     m = platform.machine().lower()
     if m in ("amd64", "x86_64"):
@@ -116,6 +142,24 @@ def _machine() -> str:
         return "aarch64"
     return m
 
+# (executable, mtime_ns, size) -> version it reported. Replacing the binary
+# (e.g. via UpdateInstaller) changes its stat, so stale entries are never hit.
+_version_cache: Dict[Tuple[str, int, int], str] = {}
+
+
+def _cached_version(exe, probe: Callable[[], str]) -> str:
+    """Run `probe` once per version of the executable at `exe`."""
+    try:
+        st = os.stat(exe)
+    except (OSError, TypeError, ValueError):
+        return probe()   # e.g. a bare name resolved via PATH: nothing to key on
+    key = (str(exe), st.st_mtime_ns, st.st_size)
+    version = _version_cache.get(key)
+    if version is None:
+        version = _version_cache[key] = probe()
+    return version
+
+
 def _current_version(tool_key: str, settings: AppSettings) -> str:
     """Try to read the installed version for a tool."""
     try:
@@ -123,12 +167,14 @@ def _current_version(tool_key: str, settings: AppSettings) -> str:
             return settings.VERSION
 
         if tool_key == "yt-dlp":
-            result = subprocess.run(
-                [str(settings.YT_DLP_PATH), "--version"],
-                capture_output=True, text=True, timeout=8,
-                **_POPEN_KWARGS,
-            )
-            return result.stdout.strip()
+            def probe() -> str:
+                result = subprocess.run(
+                    [str(settings.YT_DLP_PATH), "--version"],
+                    stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, timeout=8,
+                    **_POPEN_KWARGS,
+                )
+                return result.stdout.decode("ascii", "ignore").strip()
+            return _cached_version(settings.YT_DLP_PATH, probe)
 
         if tool_key == "spotdl":
             # Resolve the same way workers/spotdl_worker.py does: a bundled
@@ -140,30 +186,36 @@ def _current_version(tool_key: str, settings: AppSettings) -> str:
             spotdl_path = _find_spotdl(settings)
             if spotdl_path is None:
                 return "not found"
-            result = subprocess.run(
-                [str(spotdl_path), "--version"],
-                capture_output=True, text=True, timeout=10,
-                **_POPEN_KWARGS,
-            )
-            out = (result.stdout.strip() or result.stderr.strip())
-            m = re.search(r"(\d+\.\d+\.\d+)", out)
-            return m.group(1) if m else (out or "unknown")
+
+            def probe() -> str:
+                result = subprocess.run(
+                    [str(spotdl_path), "--version"],
+                    capture_output=True, text=True, timeout=10,
+                    **_POPEN_KWARGS,
+                )
+                out = (result.stdout.strip() or result.stderr.strip())
+                m = re.search(r"(\d+\.\d+\.\d+)", out)
+                return m.group(1) if m else (out or "unknown")
+            return _cached_version(spotdl_path, probe)
 
         if tool_key == "deno":
-            result = subprocess.run(
-                [str(settings.DENO_PATH), "--version"],
-                capture_output=True, text=True, timeout=8,
-                **_POPEN_KWARGS,
-            )
-            # "deno 2.x.y\n..."
-            m = re.search(r"deno\s+([\d.]+)", result.stdout)
-            return m.group(1) if m else "unknown"
+            def probe() -> str:
+                result = subprocess.run(
+                    [str(settings.DENO_PATH), "--version"],
+                    stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, timeout=8,
+                    **_POPEN_KWARGS,
+                )
+                # "deno 2.x.y\n..."
+                m = re.search(r"deno\s+([\d.]+)", result.stdout.decode("ascii", "ignore"))
+                return m.group(1) if m else "unknown"
+            return _cached_version(settings.DENO_PATH, probe)
 
     except Exception:
         pass
     return "not found"
 
 
+@lru_cache(maxsize=None)
 def _asset_name_for_ytdlp() -> str:
     """Return the correct yt-dlp binary asset name for this platform."""
     if is_windows():
@@ -177,6 +229,7 @@ def _asset_name_for_ytdlp() -> str:
     return "yt-dlp"
 
 
+@lru_cache(maxsize=None)
 def _asset_name_for_deno(tag: str) -> str:
     """Return the correct Deno asset name for this platform."""
     sys_ = _system()
@@ -191,6 +244,32 @@ def _asset_name_for_deno(tag: str) -> str:
     return f"deno-{arch}-unknown-linux-gnu.zip"
 
 
+def _describe_error(exc: Exception) -> str:
+    """Message for a failed check; connection failures get a plain explanation."""
+    if isinstance(exc, requests.ConnectTimeout):
+        return "Network unreachable: timed out connecting to the update server."
+    if isinstance(exc, requests.ConnectionError):
+        return "Network unreachable: couldn't connect to the update server."
+    return str(exc)
+
+
+@lru_cache(maxsize=None)
+def _repo_url(tool_key: str) -> str:
+    meta = TOOLS[tool_key]
+    return f"https://github.com/{meta['owner']}/{meta['repo']}"
+
+
+@lru_cache(maxsize=None)
+def _latest_release_api(tool_key: str) -> str:
+    meta = TOOLS[tool_key]
+    return GITHUB_API.format(owner=meta["owner"], repo=meta["repo"])
+
+
+def _asset_url(assets: List[dict], name: str) -> str:
+    """Download URL of the release asset called `name`, or "" if absent."""
+    return next((a["browser_download_url"] for a in assets if a.get("name") == name), "")
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 #  UPDATE CHECKER
 # ═══════════════════════════════════════════════════════════════════════════
@@ -207,25 +286,60 @@ class UpdateChecker(QThread):
     def __init__(self, settings: AppSettings, parent=None):
         super().__init__(parent)
         self._settings = settings
-        self._session  = requests.Session()
-        self._session.headers["User-Agent"] = f"YTGet/{settings.VERSION}"
+        self._session  = get_session()
 
     # ── internal helpers ───────────────────────────────────────────────────
 
-    def _gh_latest(self, owner: str, repo: str) -> Tuple[str, List[dict]]:
+    def _get_json(
+        self,
+        url: str,
+        extract: Callable[[Any], Any],
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Any:
+        """GET a JSON document through the shared release cache.
+
+        Only `extract(document)` is cached and returned, so the full payload
+        (PyPI's lists every release ever published) is dropped right after
+        parsing instead of being held for the life of the process.
+        """
+        with _release_cache_lock:
+            cached = _release_cache.get(url)
+        if cached and time.monotonic() - cached[0] < _RELEASE_TTL:
+            return cached[2]
+
+        headers = dict(headers or {})
+        if cached and cached[1]:
+            headers["If-None-Match"] = cached[1]
+        resp = self._session.get(url, timeout=REQUEST_TIMEOUT, headers=headers)
+        if resp.status_code == 304 and cached:
+            data, etag = cached[2], cached[1]
+        else:
+            resp.raise_for_status()
+            # json.loads detects UTF-8 on the raw bytes itself; resp.json()
+            # would decode the whole body to str first.
+            data, etag = extract(json.loads(resp.content)), resp.headers.get("ETag", "")
+        with _release_cache_lock:
+            _release_cache[url] = (time.monotonic(), etag, data)
+        return data
+
+    @staticmethod
+    def _release_fields(data: dict) -> Tuple[str, List[dict]]:
+        assets = [
+            {"name": a.get("name", ""), "browser_download_url": a.get("browser_download_url", "")}
+            for a in data.get("assets", [])
+        ]
+        return data.get("tag_name", "").lstrip("v"), assets
+
+    def _gh_latest(self, tool_key: str) -> Tuple[str, List[dict]]:
         """Fetch the single latest release (may include pre-releases/nightlies)."""
-        url  = GITHUB_API.format(owner=owner, repo=repo)
-        resp = self._session.get(url, timeout=REQUEST_TIMEOUT)
-        resp.raise_for_status()
-        data = resp.json()
-        tag  = data.get("tag_name", "").lstrip("v")
-        return tag, data.get("assets", [])
+        return self._get_json(
+            _latest_release_api(tool_key),
+            self._release_fields,
+            headers={"Accept": "application/vnd.github+json"},
+        )
 
     def _pip_latest(self, package: str) -> str:
-        url  = PYPI_API.format(package=package)
-        resp = self._session.get(url, timeout=REQUEST_TIMEOUT)
-        resp.raise_for_status()
-        return resp.json()["info"]["version"]
+        return self._get_json(PYPI_API.format(package=package), lambda d: d["info"]["version"])
 
     # ── per-tool check methods ─────────────────────────────────────────────
 
@@ -233,26 +347,22 @@ class UpdateChecker(QThread):
         key = "ytget"
         installed = _current_version(key, self._settings)
         try:
-            latest, _assets = self._gh_latest("ErfanNamira", "ytget-gui")
+            latest, _assets = self._gh_latest(key)
             # find the release page URL (no direct binary; user visits GitHub)
-            dl_url = f"https://github.com/ErfanNamira/ytget-gui/releases/tag/{latest}"
+            dl_url = f"{_repo_url(key)}/releases/tag/{latest}"
             self.result_ready.emit(key, installed, latest, dl_url)
         except Exception as e:
-            self.error.emit(key, str(e))
+            self.error.emit(key, _describe_error(e))
 
     def _check_ytdlp(self):
         key = "yt-dlp"
         installed = _current_version(key, self._settings)
         try:
-            latest, assets = self._gh_latest("yt-dlp", "yt-dlp")
-            asset_name = _asset_name_for_ytdlp()
-            dl_url = next(
-                (a["browser_download_url"] for a in assets if a["name"] == asset_name),
-                "",
-            )
+            latest, assets = self._gh_latest(key)
+            dl_url = _asset_url(assets, _asset_name_for_ytdlp())
             self.result_ready.emit(key, installed, latest, dl_url)
         except Exception as e:
-            self.error.emit(key, str(e))
+            self.error.emit(key, _describe_error(e))
 
     def _check_spotdl(self):
         key = "spotdl"
@@ -263,7 +373,7 @@ class UpdateChecker(QThread):
                 # (see release.yml / workers/spotdl_worker.py), not the
                 # pip package. Asset name is version-stamped, e.g.
                 # "spotdl-4.5.0-win32.exe", so match by prefix/suffix.
-                latest, assets = self._gh_latest("spotDL", "spotify-downloader")
+                latest, assets = self._gh_latest(key)
                 dl_url = next(
                     (
                         a["browser_download_url"] for a in assets
@@ -278,43 +388,44 @@ class UpdateChecker(QThread):
                 latest = self._pip_latest("spotdl")
                 self.result_ready.emit(key, installed, latest, "pip")
         except Exception as e:
-            self.error.emit(key, str(e))
+            self.error.emit(key, _describe_error(e))
 
     def _check_deno(self):
         key = "deno"
         installed = _current_version(key, self._settings)
         try:
-            latest, assets = self._gh_latest("denoland", "deno")
-            asset_name = _asset_name_for_deno(latest)
-            dl_url = next(
-                (a["browser_download_url"] for a in assets if a["name"] == asset_name),
-                "",
-            )
+            latest, assets = self._gh_latest(key)
+            dl_url = _asset_url(assets, _asset_name_for_deno(latest))
             self.result_ready.emit(key, installed, latest, dl_url)
         except Exception as e:
-            self.error.emit(key, str(e))
+            self.error.emit(key, _describe_error(e))
 
-    def run(self):
+    def _run_check(self, fn: Callable[[], None]):
+        if self.isInterruptionRequested():
+            return
         try:
-            for fn in (
-                self._check_ytget,
-                self._check_ytdlp,
-                self._check_spotdl,
-                self._check_deno,
-            ):
-                if self.isInterruptionRequested():
-                    break
-                try:
-                    fn()
-                except Exception:
-                    pass   # individual errors already emitted inside each method
-        finally:
-            # Each "Re-check All" click spins up a brand new UpdateChecker
-            # (and Session); without closing it, the underlying connection
-            # pool's sockets are only reclaimed by GC, which leaks file
-            # descriptors/memory over a long-running session with many
-            # manual re-checks.
-            self._session.close()
+            fn()
+        except Exception:
+            pass   # individual errors already emitted inside each method
+
+    def run(self):
+        cache_path = Path(self._settings.BASE_DIR) / _RELEASE_CACHE_FILE
+        _load_release_cache(cache_path)
+        checks = (
+            self._check_ytget,
+            self._check_ytdlp,
+            self._check_spotdl,
+            self._check_deno,
+        )
+        # The checks are independent and each one is mostly waiting on a
+        # --version subprocess and a GitHub/PyPI round-trip, so run them
+        # side by side: a full pass takes about as long as the slowest
+        # check instead of the sum of all four. Results still reach the
+        # UI through the queued result_ready/error signals.
+        with ThreadPoolExecutor(max_workers=len(checks)) as pool:
+            for fn in checks:
+                pool.submit(self._run_check, fn)
+        _save_release_cache(cache_path)
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -359,24 +470,49 @@ class UpdateInstaller(QThread):
         self.log_line.emit(self._key, msg)
 
     def _download(self, url: str, dest: Path) -> bool:
-        """Stream-download url to dest, emitting progress signals."""
-        try:
-            resp = requests.get(url, stream=True, timeout=60)
-            resp.raise_for_status()
-            total = int(resp.headers.get("content-length", 0))
-            done  = 0
-            with open(dest, "wb") as fh:
-                for chunk in resp.iter_content(chunk_size=65536):
-                    if self._cancelled:
-                        return False
-                    fh.write(chunk)
-                    done += len(chunk)
-                    if total:
-                        self.progress.emit(self._key, int(done * 100 / total))
-            return True
-        except Exception as exc:
-            self._log(f"Download failed: {exc}")
-            return False
+        """Stream-download url to dest, emitting progress signals.
+
+        If the connection drops mid-transfer, the download picks up where it
+        stopped with a Range request (GitHub's asset CDN honours them) rather
+        than starting the multi-MB binary over; a server that ignores Range
+        and answers 200 simply restarts the file.
+        """
+        done  = 0
+        total = 0
+        last_pct = -1
+        with open(dest, "wb") as fh:
+            for attempt in range(DOWNLOAD_ATTEMPTS):
+                headers = {"Range": f"bytes={done}-"} if done else None
+                try:
+                    with get_session().get(url, stream=True, timeout=DOWNLOAD_TIMEOUT, headers=headers) as resp:
+                        resp.raise_for_status()
+                        if resp.status_code != 206:
+                            done = 0
+                            fh.seek(0)
+                            fh.truncate()
+                        total = done + int(resp.headers.get("content-length", 0))
+                        # Chunks larger than the file buffer are written through in
+                        # one call; progress is only signalled when the percentage moves.
+                        for chunk in resp.iter_content(chunk_size=DOWNLOAD_CHUNK):
+                            if self._cancelled:
+                                return False
+                            fh.write(chunk)
+                            done += len(chunk)
+                            if total and (pct := done * 100 // total) != last_pct:
+                                last_pct = pct
+                                self.progress.emit(self._key, pct)
+                    return True
+                except (requests.ConnectionError, requests.Timeout,
+                        requests.exceptions.ChunkedEncodingError) as exc:
+                    if attempt + 1 < DOWNLOAD_ATTEMPTS and not self._cancelled:
+                        self._log(f"Connection lost at {done} bytes, resuming …")
+                        continue
+                    self._log(f"Download failed: {exc}")
+                    return False
+                except Exception as exc:
+                    self._log(f"Download failed: {exc}")
+                    return False
+        return False
 
     def _make_executable(self, path: Path):
         if not is_windows():
@@ -420,18 +556,29 @@ class UpdateInstaller(QThread):
         # tempfile.mktemp only *reserves* a name; another process (or a
         # concurrent installer thread) can grab it before we open it. Using
         # mkstemp atomically creates and opens the file, closing the classic
-        # race, and doubles as a guarantee the parent temp dir is writable
+        # race, and doubles as a guarantee the parent dir is writable
         # before we start streaming a potentially large download into it.
-        fd, tmp_name = tempfile.mkstemp(suffix=dest.suffix)
+        # It's created next to dest so installing is a single atomic rename
+        # rather than a copy across filesystems; the system temp dir is only
+        # used when dest's directory isn't writable.
+        try:
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(suffix=dest.suffix, dir=dest.parent)
+        except OSError:
+            fd, tmp_name = tempfile.mkstemp(suffix=dest.suffix)
         os.close(fd)
         tmp = Path(tmp_name)
         if not self._download(asset_url, tmp):
+            tmp.unlink(missing_ok=True)
             self.finished_err.emit(tool_key, "Download cancelled or failed.")
             return
         self._log("Installing …")
         try:
-            shutil.move(str(tmp), str(dest))
-            self._make_executable(dest)
+            self._make_executable(tmp)
+            if tmp.parent == dest.parent:
+                os.replace(tmp, dest)
+            else:
+                shutil.move(str(tmp), str(dest))
             self._log("✅ Done.")
             self.finished_ok.emit(tool_key)
         except Exception as exc:
@@ -702,11 +849,16 @@ class UpdateManager(QDialog):
         # per-tool widget references
         self._rows: Dict[str, Dict[str, Any]] = {}
 
+        # Start checking before the dialog is built and styled, so the DNS
+        # lookups and TLS handshakes overlap with that work. Results arrive
+        # as queued signals, i.e. only once exec() runs the event loop.
+        self._launch_checker()
+
         self.setWindowTitle("Update Manager — YTGet")
         self.setMinimumSize(680, 560)
         self.setStyleSheet(_QSS)
         self._build_ui()
-        self._start_check()
+        self._reset_check_ui()
 
     # ── UI construction ────────────────────────────────────────────────────
 
@@ -867,7 +1019,10 @@ class UpdateManager(QDialog):
     # ── check flow ─────────────────────────────────────────────────────────
 
     def _start_check(self):
-        # Reset UI
+        self._reset_check_ui()
+        self._launch_checker()
+
+    def _reset_check_ui(self):
         for key, row in self._rows.items():
             self._set_badge(row["badge"], "checking")
             row["btn"].setEnabled(False)
@@ -878,6 +1033,7 @@ class UpdateManager(QDialog):
         self._log.clear()
         self._log_line("", "Checking for updates…", "#71717A")
 
+    def _launch_checker(self):
         if self._checker and self._checker.isRunning():
             self._checker.requestInterruption()
             self._checker.wait(3000)
@@ -1012,6 +1168,35 @@ class UpdateManager(QDialog):
 #  UTILITY
 # ═══════════════════════════════════════════════════════════════════════════
 
+def _load_release_cache(path: Path) -> None:
+    """Seed _release_cache from disk once per process; entries load as stale."""
+    global _release_cache_loaded
+    with _release_cache_lock:
+        if _release_cache_loaded:
+            return
+        _release_cache_loaded = True
+        try:
+            saved = json.loads(path.read_text(encoding="utf-8"))
+        except Exception:
+            return
+        if not isinstance(saved, dict):
+            return
+        for url, entry in saved.items():
+            if isinstance(entry, list) and len(entry) == 2 and entry[0] and url not in _release_cache:
+                _release_cache[url] = (float("-inf"), entry[0], entry[1])
+
+
+def _save_release_cache(path: Path) -> None:
+    with _release_cache_lock:
+        saved = {url: [etag, data] for url, (_t, etag, data) in _release_cache.items() if etag}
+    tmp = path.with_suffix(".json.tmp")
+    try:
+        tmp.write_text(json.dumps(saved), encoding="utf-8")
+        os.replace(tmp, path)
+    except Exception:
+        pass
+
+
 def _versions_equal(a: str, b: str) -> bool:
     """
     Loose version comparison: strip leading 'v'/'n', compare normalised segments.
@@ -7,6 +7,10 @@ from platform import system
 
 __version__ = "2.7.7"
 
+# Icon files next to this module, in order of preference for this platform
+_ICON_DIR = Path(__file__).resolve().parent
+_ICON_FILES = ("icon.icns", "icon.ico") if system() == "Darwin" else ("icon.ico",)
+
 # --- Windows taskbar icon: set AppUserModelID before QApplication is created ---
 if system() == "Windows":
     import ctypes
@@ -78,20 +82,11 @@ def main():
     app.setOrganizationName("YTGet")
     app.setOrganizationDomain("ytget_gui.local")
 
-    # 4) Load the appropriate icon for each platform
-    icon_dir = Path(__file__).parent
-    if system() == "Darwin":
-        icns = icon_dir / "icon.icns"
-        if icns.exists():
-            app.setWindowIcon(QIcon(str(icns)))
-        else:
-            ico = icon_dir / "icon.ico"
-            if ico.exists():
-                app.setWindowIcon(QIcon(str(ico)))
-    else:
-        ico = icon_dir / "icon.ico"
-        if ico.exists():
-            app.setWindowIcon(QIcon(str(ico)))
+    # 4) Load the appropriate icon for each platform. It's decoded once here;
+    #    MainWindow reuses the application icon rather than loading its own.
+    icon_path = next((p for name in _ICON_FILES if (p := _ICON_DIR / name).is_file()), None)
+    if icon_path is not None:
+        app.setWindowIcon(QIcon(str(icon_path)))
 
     # 5) Instantiate and show the main window
     w = MainWindow()
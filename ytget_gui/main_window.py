@@ -10,13 +10,14 @@ import hashlib
 import webbrowser
 import platform
 import subprocess
+import threading
 from collections import deque
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from shutil import which
 
-import requests
-from PySide6.QtCore import Qt, QThread, QTimer, QSettings, QSize, Signal, Slot
+from PySide6.QtCore import Qt, QEvent, QObject, QPoint, QThread, QTimer, QSettings, QSize, Signal, Slot
+import shiboken6
 from PySide6.QtGui import (
     QAction,
     QActionGroup,
@@ -24,6 +25,7 @@ from PySide6.QtGui import (
     QPalette,
     QGuiApplication,
     QTextCursor,
+    QTextCharFormat,
     QColor,
     QFont,
     QPixmap,
@@ -54,7 +56,6 @@ from ytget_gui.styles import AppStyles
 from ytget_gui.utils.validators import is_supported_url, is_youtube_url
 from ytget_gui.dialogs.preferences import PreferencesDialog
 from ytget_gui.dialogs.advanced import AdvancedOptionsDialog
-from ytget_gui.dialogs.update_manager import UpdateManager
 from ytget_gui.dialogs.about_dialog import AboutDialog
 from ytget_gui.workers.download_worker import DownloadWorker
 from ytget_gui.workers.cover_crop_worker import CoverCropWorker
@@ -747,6 +748,8 @@ class MainWindow(QMainWindow):
     enqueue_title = Signal(str)
     enqueue_titles = Signal(list)
     post_queue_action_signal = Signal(str)
+    queue_file_saved = Signal(str, object)
+    queue_file_loaded = Signal(str, object)
 
     # ════════════════════════════════════════════════════════════════════════
     def __init__(self):
@@ -755,6 +758,8 @@ class MainWindow(QMainWindow):
         self.styles = AppStyles()
 
         self.post_queue_action_signal.connect(self._perform_post_queue_action, Qt.QueuedConnection)
+        self.queue_file_saved.connect(self._on_queue_file_saved, Qt.QueuedConnection)
+        self.queue_file_loaded.connect(self._on_queue_file_loaded, Qt.QueuedConnection)
 
         # Thumbnail cache
         self.thumb_cache_dir: Path = self.settings.BASE_DIR / "cache" / "thumbs"
@@ -785,9 +790,27 @@ class MainWindow(QMainWindow):
         self.title_queue_thread: Optional[QThread] = None
         self.title_queue: Optional[TitleFetchQueue] = None
 
-        self._log_entries: List[Tuple[str, str, str]] = []
+        self._log_entries: "deque[Tuple[str, str, str]]" = deque(maxlen=max(1, getattr(self.settings, "MAX_LOG_LINES", MAX_LOG_LINES)))
+        self._log_formats: Dict[str, QTextCharFormat] = {}
+        self._log_cursor: Optional[QTextCursor] = None
+        # Console lines queued within one event-loop pass are inserted together
+        self._console_pending: List[Tuple[str, str]] = []
+        self._console_flush_timer = QTimer(self)
+        self._console_flush_timer.setSingleShot(True)
+        self._console_flush_timer.setInterval(0)
+        self._console_flush_timer.timeout.connect(self._flush_console)
+        self._log_scroll_timer = QTimer(self)
+        self._log_scroll_timer.setSingleShot(True)
+        self._log_scroll_timer.setInterval(33)   # scroll the console at most ~30x/s
+        self._log_scroll_timer.timeout.connect(self._scroll_log_to_end)
 
         self.queue_file_path: Path = self.settings.BASE_DIR / "queue.json"
+        # Window geometry/state store, opened once and shared by restore and save
+        self._qsettings = QSettings(self.settings.APP_NAME, self.settings.APP_NAME)
+        self._queue_save_timer = QTimer(self)
+        self._queue_save_timer.setSingleShot(True)
+        self._queue_save_timer.setInterval(300)
+        self._queue_save_timer.timeout.connect(self._flush_queue_save)
 
         # UI refs
         self.queue_list: QListWidget
@@ -813,6 +836,7 @@ class MainWindow(QMainWindow):
         self.bulk_label: QLabel
 
         self._app_icon: Optional[QIcon] = None
+        self._advanced_dlg: Optional[AdvancedOptionsDialog] = None
 
         self._setup_ui()
         self.btn_skip.hide()
@@ -855,12 +879,10 @@ class MainWindow(QMainWindow):
             _level_norm = str(level).strip().capitalize() if level else "Info"
             _level_map = {"Success": "Info", "Process": "Info", "Warn": "Warning"}
             final_level = _level_map.get(_level_norm, _level_norm)
-            if not hasattr(self, "_log_entries"):
-                self._log_entries = []
+            max_lines = max(1, getattr(self.settings, "MAX_LOG_LINES", MAX_LOG_LINES))
+            if self._log_entries.maxlen != max_lines:
+                self._log_entries = deque(self._log_entries, maxlen=max_lines)
             self._log_entries.append((final_text, final_color, final_level))
-            max_lines = getattr(self.settings, "MAX_LOG_LINES", MAX_LOG_LINES)
-            if len(self._log_entries) > max_lines:
-                self._log_entries = self._log_entries[-max_lines:]
             filt_text = self.filter_combo.currentText() if hasattr(self, "filter_combo") else "All"
             if filt_text == "All" or filt_text == final_level:
                 self._append_to_console(final_text, final_color)
@@ -872,44 +894,89 @@ class MainWindow(QMainWindow):
             filt_text = self.filter_combo.currentText() if hasattr(self, "filter_combo") else "All"
             self.log_output.blockSignals(True)
             self.log_output.clear()
-            for text, color, level in self._log_entries:
-                if filt_text != "All" and level != filt_text:
-                    continue
-                self._append_to_console(text, color)
+            self._console_pending = [
+                (text, color) for text, color, level in self._log_entries
+                if filt_text == "All" or level == filt_text
+            ]
+            self._flush_console()
             self.log_output.blockSignals(False)
             self.log_output.moveCursor(QTextCursor.End)
         except Exception:
             pass
 
+    def _console_cursor(self) -> QTextCursor:
+        # A cursor of our own at the end of the document: appending through
+        # it leaves the user's selection in the console alone.
+        if self._log_cursor is None:
+            self._log_cursor = QTextCursor(self.log_output.document())
+        return self._log_cursor
+
     def _append_to_console(self, text: str, color: str = AppStyles.INFO_COLOR):
+        self._console_pending.append((text, color))
+        if not self._console_flush_timer.isActive():
+            self._console_flush_timer.start()
+
+    def _flush_console(self):
+        pending, self._console_pending = self._console_pending, []
         try:
-            if not self.log_output:
+            if not pending or not self.log_output:
                 return
-            self.log_output.moveCursor(QTextCursor.End)
-            self.log_output.setTextColor(QColor(color))
-            self.log_output.append(text)
-            self.log_output.setTextColor(QColor(AppStyles.INFO_COLOR))
-            self.log_output.ensureCursorVisible()
+            # Lines past the document's block limit would be trimmed right away
+            pending = pending[-self.log_output.document().maximumBlockCount():]
+            cursor = self._console_cursor()
+            cursor.movePosition(QTextCursor.End)
+            # One edit block so the document lays out once per flush
+            cursor.beginEditBlock()
+            sep = "" if self.log_output.document().isEmpty() else "\n"
+            i = 0
+            while i < len(pending):
+                # Consecutive lines of one colour go in as a single insert;
+                # a newline starts each entry's own paragraph, as append() did
+                color = pending[i][1]
+                j = i
+                while j < len(pending) and pending[j][1] == color:
+                    j += 1
+                fmt = self._log_formats.get(color)
+                if fmt is None:
+                    fmt = QTextCharFormat()
+                    fmt.setForeground(QColor(color))
+                    self._log_formats[color] = fmt
+                cursor.insertText(sep + "\n".join(t for t, _c in pending[i:j]), fmt)
+                sep = "\n"
+                i = j
+            cursor.endEditBlock()
+            if not self._log_scroll_timer.isActive():
+                self._log_scroll_timer.start()
         except Exception:
             pass
 
+    def _scroll_log_to_end(self):
+        sb = self.log_output.verticalScrollBar()
+        sb.setValue(sb.maximum())
+
     # ════════════════════════════════════════════════════════════════════════
     #  UI SCAFFOLD
     # ════════════════════════════════════════════════════════════════════════
 
     def _setup_ui(self):
         self.setWindowTitle(f"{self.settings.APP_NAME}  ·  {self.settings.VERSION}")
-        icon_candidates = [
-            self.settings.BASE_DIR / "icon.ico",
-            self.settings.INTERNAL_DIR / "icon.ico",
-            self.settings.BASE_DIR / "icon.png",
-            self.settings.INTERNAL_DIR / "icon.png",
-        ]
-        for p in icon_candidates:
-            if p.exists():
-                self._app_icon = QIcon(str(p))
-                self.setWindowIcon(self._app_icon)
-                break
+        app_icon = QGuiApplication.windowIcon()
+        if not app_icon.isNull():
+            # main() already loaded it and windows inherit it; just keep a
+            # handle for the Help button and About dialog.
+            self._app_icon = app_icon
+        else:
+            icon_candidates = [
+                self.settings.BASE_DIR / "icon.ico",
+                self.settings.INTERNAL_DIR / "icon.ico",
+                self.settings.BASE_DIR / "icon.png",
+                self.settings.INTERNAL_DIR / "icon.png",
+            ]
+            for p in icon_candidates:
+                if p.exists():
+                    self._app_icon = QIcon(str(p))
+                    self.setWindowIcon(self._app_icon)
+                    break
 
         self.resize(1280, 820)
         self.setMinimumSize(900, 600)
@@ -917,7 +984,9 @@ class MainWindow(QMainWindow):
         # Font — modern sans-serif for glassmorphism
         f = QFont("Inter", 10)
         self.setFont(f)
-        self.setStyleSheet(QSS_THEME)
+        # Dialog-specific rules (scoped by object name) ride along with the
+        # window theme so child dialogs never re-parse QSS when opened.
+        self.setStyleSheet(QSS_THEME + AppStyles.ADVANCED_DIALOG)
 
         central = QWidget()
         central.setObjectName("CentralWidget")
@@ -1166,6 +1235,21 @@ class MainWindow(QMainWindow):
         b_lay.addWidget(btn_clear_done)
         lay.addWidget(self.bulk_bar)
 
+        # Cards are created for visible rows only (see _materialize_queue_cards)
+        self._queue_size_probes: Dict[bool, QueueCard] = {}
+        # Items that currently hold a QueueCard (keyed by id(), items aren't
+        # hashable), so releasing far-off cards doesn't walk the whole list
+        self._queue_card_items: Dict[int, QListWidgetItem] = {}
+        self._queue_cards_timer = QTimer(self)
+        self._queue_cards_timer.setSingleShot(True)
+        self._queue_cards_timer.setInterval(0)
+        self._queue_cards_timer.timeout.connect(self._materialize_queue_cards)
+        self.queue_list.verticalScrollBar().valueChanged.connect(self._schedule_queue_cards)
+        self.queue_list.verticalScrollBar().rangeChanged.connect(self._schedule_queue_cards)
+        self.queue_list.model().rowsRemoved.connect(self._schedule_queue_cards)
+        self.queue_list.model().rowsMoved.connect(self._schedule_queue_cards)
+        self.queue_list.viewport().installEventFilter(self)
+
         # Wire
         self.queue_list.model().rowsMoved.connect(self._on_rows_moved)
         self.queue_list.itemSelectionChanged.connect(self._on_selection_changed)
@@ -1401,6 +1485,10 @@ class MainWindow(QMainWindow):
                 pass
             for i in range(self.queue_list.count()):
                 item = self.queue_list.item(i)
+                data = item.data(Qt.UserRole)
+                if path and isinstance(data, dict) and data.get("url") == url:
+                    data["thumb_path"] = path
+                    item.setData(Qt.UserRole, data)
                 widget = self.queue_list.itemWidget(item)
                 if not widget:
                     continue
@@ -1428,9 +1516,128 @@ class MainWindow(QMainWindow):
     #  QUEUE CARD HELPERS
     # ════════════════════════════════════════════════════════════════════════
 
-    def _add_queue_card_to_list(self, url: str, title: str = "", video_id: Optional[str] = None, show_thumbnail: bool = True, status: str = "Pending"):
+    def _add_queue_card_to_list(self, url: str, title: str = "", video_id: Optional[str] = None, show_thumbnail: bool = True, status: str = "Pending", row: Optional[int] = None):
+        # Only the row is created here; its QueueCard is built by
+        # _materialize_queue_cards once the row is scrolled into view, so a
+        # long queue doesn't hold a full widget tree per off-screen entry.
         try:
-            card = QueueCard(title=title or short(url, 80), url=url, status=status, progress=0, show_thumbnail=show_thumbnail)
+            title = title or url
+            item = QListWidgetItem()
+            item.setSizeHint(self._queue_row_size_hint(title, show_thumbnail))
+            item.setData(Qt.UserRole, {
+                "url": url,
+                "title": title,
+                "status": status,
+                "video_id": video_id or "",
+                "show_thumbnail": show_thumbnail,
+            })
+            if row is None:
+                self.queue_list.addItem(item)
+            else:
+                self.queue_list.insertItem(row, item)
+
+            if not self._find_cached_thumb(url, video_id) and url not in self._pending_thumb_urls:
+                try:
+                    self._pending_thumb_urls.add(url)
+                    self.thumb_manager.enqueue(url)
+                except Exception:
+                    try:
+                        self._pending_thumb_urls.discard(url)
+                    except Exception:
+                        pass
+            self._schedule_queue_cards()
+        except Exception:
+            pass
+
+    def _queue_row_size_hint(self, title: str, show_thumbnail: bool) -> QSize:
+        # Measure the row on one hidden probe card per thumbnail mode instead
+        # of a real card per row.
+        probe = self._queue_size_probes.get(show_thumbnail)
+        if probe is None:
+            probe = QueueCard(title="", url="", status="Pending", progress=0, show_thumbnail=show_thumbnail)
+            probe.ensurePolished()
+            self._queue_size_probes[show_thumbnail] = probe
+        probe.set_title(title)
+        probe.layout().invalidate()
+        probe.layout().activate()
+        return probe.sizeHint()
+
+    def _find_cached_thumb(self, url: str, video_id: Optional[str]) -> Optional[str]:
+        base_name = video_id or hashlib.sha1(url.encode("utf-8")).hexdigest()
+        safe = self._thumb_safe_name(base_name)
+        for ext in (".jpg", ".jpeg", ".png", ".webp", ".gif", ".avif"):
+            p = self.thumb_cache_dir / f"{safe}{ext}"
+            try:
+                if p.exists() and p.stat().st_size > 0:
+                    return str(p)
+            except Exception:
+                continue
+        return None
+
+    def _schedule_queue_cards(self, *_args):
+        self._queue_cards_timer.start()
+
+    def _materialize_queue_cards(self):
+        # Build cards for the rows in (and one page around) the viewport and
+        # drop the ones that have scrolled further away than that.
+        ql = self.queue_list
+        count = ql.count()
+        vp = ql.viewport().rect()
+        margin = vp.height()
+        lo, hi = vp.top() - margin, vp.bottom() + margin
+
+        def is_near(item: QListWidgetItem) -> bool:
+            rect = ql.visualItemRect(item)
+            return not item.isHidden() and rect.bottom() >= lo and rect.top() <= hi
+
+        for key, item in list(self._queue_card_items.items()):
+            if not shiboken6.isValid(item) or ql.row(item) < 0:
+                del self._queue_card_items[key]  # row was removed
+            elif not is_near(item):
+                ql.removeItemWidget(item)
+                del self._queue_card_items[key]
+        if not count:
+            return
+
+        # Only the rows spanning lo..hi are looked at. A point that lands in
+        # the spacing between rows hits nothing, so retry one gap further in;
+        # past either end of the list, fall back to the first/last row.
+        gap = 2 * ql.spacing() + 1
+        x = ql.spacing() + 1
+
+        def row_at(y: int, step: int, default: int) -> int:
+            for probe in (y, y + step):
+                idx = ql.indexAt(QPoint(x, probe))
+                if idx.isValid():
+                    return idx.row()
+            return default
+
+        first = row_at(lo, gap, 0)
+        last = row_at(hi, -gap, count - 1)
+        for row in range(first, last + 1):
+            item = ql.item(row)
+            if id(item) not in self._queue_card_items and is_near(item):
+                if ql.itemWidget(item) is None:
+                    self._build_queue_card(item)
+                if ql.itemWidget(item) is not None:
+                    self._queue_card_items[id(item)] = item
+
+    def eventFilter(self, obj, event):
+        if obj is self.queue_list.viewport() and event.type() == QEvent.Resize:
+            self._schedule_queue_cards()
+        return super().eventFilter(obj, event)
+
+    def _build_queue_card(self, item: QListWidgetItem):
+        data = item.data(Qt.UserRole) or {}
+        url = data.get("url", "")
+        try:
+            card = QueueCard(
+                title=data.get("title") or url,
+                url=url,
+                status=data.get("status", "Pending"),
+                progress=0,
+                show_thumbnail=data.get("show_thumbnail", True),
+            )
             try:
                 setattr(card, "url", url)
             except Exception:
@@ -1446,9 +1653,9 @@ class MainWindow(QMainWindow):
                 QGuiApplication.clipboard().setText(url)
 
             def _remove_item():
-                for item in self.queue:
-                    if item.get("url") == url:
-                        self._remove_item_by_id(item)
+                for it in self.queue:
+                    if it.get("url") == url:
+                        self._remove_item_by_id(it)
                         break
 
             card.set_context_actions([
@@ -1456,41 +1663,14 @@ class MainWindow(QMainWindow):
                 ("Copy URL", _copy_url),
                 ("Remove", _remove_item),
             ])
-
-            item = QListWidgetItem()
-            item.setSizeHint(card.sizeHint())
-            item.setData(Qt.UserRole, {"url": url, "title": title or short(url, 80), "status": status})
-            self.queue_list.addItem(item)
             self.queue_list.setItemWidget(item, card)
 
-            base_name = video_id or hashlib.sha1(url.encode("utf-8")).hexdigest()
-            safe = self._thumb_safe_name(base_name)
-
-            found_path = None
-            for ext in (".jpg", ".jpeg", ".png", ".webp", ".gif", ".avif"):
-                p = self.thumb_cache_dir / f"{safe}{ext}"
-                try:
-                    if p.exists() and p.stat().st_size > 0:
-                        found_path = str(p)
-                        break
-                except Exception:
-                    continue
-
+            found_path = data.get("thumb_path") or self._find_cached_thumb(url, data.get("video_id"))
             if found_path:
                 try:
                     card.set_thumbnail_path(found_path)
                 except Exception:
                     pass
-            else:
-                if url not in self._pending_thumb_urls:
-                    try:
-                        self._pending_thumb_urls.add(url)
-                        self.thumb_manager.enqueue(url)
-                    except Exception:
-                        try:
-                            self._pending_thumb_urls.discard(url)
-                        except Exception:
-                            pass
         except Exception:
             pass
 
@@ -1672,39 +1852,36 @@ class MainWindow(QMainWindow):
     #  DRAG & DROP
     # ════════════════════════════════════════════════════════════════════════
 
+    def _set_drop_active(self, active: bool):
+        self.queue_pane.setProperty("dropActive", active)
+        self.queue_pane.style().unpolish(self.queue_pane)
+        self.queue_pane.style().polish(self.queue_pane)
+
+    @staticmethod
+    def _iter_drop_urls(md) -> Iterator[str]:
+        # Prefer the URL list Qt already parsed; the plain-text split is only
+        # a fallback for drops that carry bare text.
+        if md.hasUrls():
+            return (u.toString() for u in md.urls())
+        if md.hasText():
+            return iter(md.text().split())
+        return iter(())
+
     def dragEnterEvent(self, event):
-        if event.mimeData().hasUrls() or event.mimeData().hasText():
-            text = ""
-            if event.mimeData().hasUrls():
-                urls = [u.toString() for u in event.mimeData().urls()]
-                text = " ".join(urls)
-            else:
-                text = event.mimeData().text()
-            tokens = text.split()
-            if any(is_supported_url(t) for t in tokens):
-                event.acceptProposedAction()
-                self.queue_pane.setProperty("dropActive", True)
-                self.queue_pane.style().unpolish(self.queue_pane)
-                self.queue_pane.style().polish(self.queue_pane)
-                return
+        # Stops at the first usable URL rather than scanning the whole drop
+        if any(is_supported_url(t) for t in self._iter_drop_urls(event.mimeData())):
+            event.acceptProposedAction()
+            self._set_drop_active(True)
+            return
         super().dragEnterEvent(event)
 
     def dragLeaveEvent(self, event):
-        self.queue_pane.setProperty("dropActive", False)
-        self.queue_pane.style().unpolish(self.queue_pane)
-        self.queue_pane.style().polish(self.queue_pane)
+        self._set_drop_active(False)
         super().dragLeaveEvent(event)
 
     def dropEvent(self, event):
-        self.queue_pane.setProperty("dropActive", False)
-        self.queue_pane.style().unpolish(self.queue_pane)
-        self.queue_pane.style().polish(self.queue_pane)
-        urls: List[str] = []
-        if event.mimeData().hasUrls():
-            urls = [u.toString() for u in event.mimeData().urls()]
-        elif event.mimeData().hasText():
-            urls = [t for t in event.mimeData().text().split()]
-        valid = [u for u in urls if is_supported_url(u)]
+        self._set_drop_active(False)
+        valid = [u for u in self._iter_drop_urls(event.mimeData()) if is_supported_url(u)]
         if valid:
             for u in valid:
                 self.log(f"🧾 Queued for fetch: {u[:60]}...\n", AppStyles.INFO_COLOR, "Info")
@@ -1734,7 +1911,7 @@ class MainWindow(QMainWindow):
             return
         self.url_input.clear()
         self.btn_add_inline.setEnabled(False)
-        self._add_queue_card_to_list(url=url, title=short(url, 80), show_thumbnail=True)
+        self._add_queue_card_to_list(url=url, title=url, show_thumbnail=True)
         if self.title_queue:
             self.enqueue_title.emit(url)
 
@@ -1838,17 +2015,11 @@ class MainWindow(QMainWindow):
         self._save_queue_permanent()
         self._refresh_queue_list()
         self._update_button_states()
-        try:
-            if self.download_thread and self.download_thread.isRunning():
-                self.download_thread.quit()
-                self.download_thread.wait()
-        except RuntimeError:
-            pass
+        self._stop_thread("download_thread", wait_ms=None)
 
         url = self.current_download_item.get("url", "")
         is_spotify = "open.spotify.com" in url
 
-        self.download_thread = QThread()
         if is_spotify:
             self.download_worker = SpotDLWorker(
                 self.current_download_item,
@@ -1858,8 +2029,6 @@ class MainWindow(QMainWindow):
         else:
             self.download_worker = DownloadWorker(self.current_download_item, self.settings)
 
-        self.download_worker.moveToThread(self.download_thread)
-        self.download_thread.started.connect(self.download_worker.run)
         self.download_worker.log.connect(self.log, Qt.QueuedConnection)
         self.download_worker.error.connect(lambda m: self.log(f"❌ {m}\n", AppStyles.ERROR_COLOR, "Error"))
         if hasattr(self.download_worker, "status"):
@@ -1868,10 +2037,61 @@ class MainWindow(QMainWindow):
             except Exception:
                 pass
         self.download_worker.finished.connect(self._on_download_finished)
-        self.download_worker.finished.connect(self.download_thread.quit)
-        self.download_thread.finished.connect(self.download_worker.deleteLater)
-        self.download_thread.finished.connect(self.download_thread.deleteLater)
-        self.download_thread.start()
+        self.download_thread = self._start_worker_thread(self.download_worker)
+
+    def _stop_thread(self, thread_attr: str, wait_ms: Optional[int] = 2000) -> None:
+        """
+        Quit the QThread held in self.<thread_attr> and wait for it (without a
+        time limit if wait_ms is None), then drop the reference. Threads from
+        _start_worker_thread delete themselves when done, so check the C++
+        object is still alive instead of catching RuntimeError.
+        """
+        thread = getattr(self, thread_attr, None)
+        setattr(self, thread_attr, None)
+        if thread is None or not shiboken6.isValid(thread) or not thread.isRunning():
+            return
+        thread.quit()
+        if wait_ms is None:
+            thread.wait()
+        else:
+            thread.wait(wait_ms)
+
+    @staticmethod
+    def _start_worker_thread(worker: QObject, on_thread_finished=None) -> QThread:
+        """
+        Run worker.run() on a fresh QThread that quits when the worker emits
+        finished and then deletes both. Connect the worker's own signals
+        before calling this so none are missed once it starts;
+        on_thread_finished is queued to the GUI thread after the thread ends.
+        """
+        thread = QThread()
+        worker.moveToThread(thread)
+        thread.started.connect(worker.run)
+        worker.finished.connect(thread.quit)
+        thread.finished.connect(worker.deleteLater)
+        thread.finished.connect(thread.deleteLater)
+        if on_thread_finished is not None:
+            thread.finished.connect(on_thread_finished, Qt.QueuedConnection)
+        thread.start()
+        return thread
+
+    @staticmethod
+    def _disconnect_worker(worker: Optional[QObject], *signal_names: str) -> None:
+        """
+        Drop the GUI-side slots (including capturing lambdas) from a finished
+        worker's signals now rather than whenever its wrapper is collected.
+        Only pass signals that were actually connected.
+        """
+        if worker is None or not shiboken6.isValid(worker):
+            return
+        for name in signal_names:
+            sig = getattr(worker, name, None)
+            if sig is None:
+                continue
+            try:
+                sig.disconnect()
+            except (RuntimeError, TypeError):
+                pass
 
     def _on_download_status(self, status: str):
         if self.current_download_item is None:
@@ -1891,6 +2111,8 @@ class MainWindow(QMainWindow):
                 break
 
     def _on_download_finished(self, exit_code: int):
+        self._disconnect_worker(self.download_worker, "log", "error", "status")
+        self.download_worker = None
         self.is_downloading = False
         if self.current_download_item is not None:
             self.current_download_item["status"] = "Completed" if exit_code == 0 else "Error"
@@ -1950,21 +2172,15 @@ class MainWindow(QMainWindow):
             self.action_crop_covers.setEnabled(False)
 
         self.log("🖼️ Cropping audio covers to 1:1. This may take a moment...\n", AppStyles.INFO_COLOR, "Info")
-        self.cover_thread = QThread()
-        self.cover_worker = CoverCropWorker(self.settings.DOWNLOADS_DIR)
-        self.cover_worker.moveToThread(self.cover_thread)
-        self.cover_thread.started.connect(self.cover_worker.run)
+        self.cover_worker = CoverCropWorker(self.settings.DOWNLOADS_DIR, self.settings.BASE_DIR)
         self.cover_worker.log.connect(self.log, Qt.QueuedConnection)
-        self.cover_worker.finished.connect(self.cover_thread.quit)
         if on_finished is not None:
             self.cover_worker.finished.connect(on_finished, Qt.QueuedConnection)
-        self.cover_thread.finished.connect(self.cover_worker.deleteLater)
-        self.cover_thread.finished.connect(self.cover_thread.deleteLater)
-        self.cover_thread.finished.connect(self._on_cover_crop_thread_finished, Qt.QueuedConnection)
-        self.cover_thread.start()
+        self.cover_thread = self._start_worker_thread(self.cover_worker, self._on_cover_crop_thread_finished)
         return True
 
     def _on_cover_crop_thread_finished(self):
+        self._disconnect_worker(self.cover_worker, "log")
         self.cover_thread = None
         self.cover_worker = None
         self._cover_crop_running = False
@@ -1984,21 +2200,31 @@ class MainWindow(QMainWindow):
             plat = "mac"
         else:
             plat = "linux"
+        if action == "Sleep" and plat == "win":
+            # The call System.Windows.Forms' SetSuspendState('Suspend', ...)
+            # ends up making, without starting PowerShell and loading WinForms.
+            try:
+                import ctypes
+                if not ctypes.windll.powrprof.SetSuspendState(False, False, False):
+                    raise ctypes.WinError()
+            except Exception as exc:
+                self.log(f"❌ Failed to {action.lower()}: {exc}\n", AppStyles.ERROR_COLOR, "Error")
+            return
+        systemctl = which("systemctl") if plat == "linux" else None
         ACTION_COMMANDS: dict[str, dict[str, list[str]]] = {
             "Shutdown": {
                 "win": ["shutdown", "/s", "/t", "60"],
                 "mac": ["osascript", "-e", 'tell app "System Events" to shut down'],
-                "linux": [which("systemctl") or "shutdown", which("systemctl") and "poweroff" or "now"],
+                "linux": [systemctl or "shutdown", systemctl and "poweroff" or "now"],
             },
             "Sleep": {
-                "win": ["powershell", "-Command", "Add-Type -AssemblyName System.Windows.Forms; [System.Windows.Forms.Application]::SetSuspendState('Suspend', $false, $false)"],
                 "mac": ["pmset", "sleepnow"],
-                "linux": [which("systemctl") or "pm-suspend", which("systemctl") and "suspend" or ""],
+                "linux": [systemctl or "pm-suspend", systemctl and "suspend" or ""],
             },
             "Restart": {
                 "win": ["shutdown", "/r", "/t", "60"],
                 "mac": ["osascript", "-e", 'tell app "System Events" to restart'],
-                "linux": [which("systemctl") or "shutdown", which("systemctl") and "reboot" or "now"],
+                "linux": [systemctl or "shutdown", systemctl and "reboot" or "now"],
             },
         }
         cmds_for_action = ACTION_COMMANDS.get(action)
@@ -2095,22 +2321,64 @@ class MainWindow(QMainWindow):
             if t:
                 visible = (t in title) or (t in meta)
             lw_item.setHidden(not visible)
+        self._schedule_queue_cards()
 
     def _refresh_queue_list(self):
-        self.queue_list.clear()
+        # Bring the list in line with self.queue by rebuilding only the span
+        # of rows that changed. Rows in the unchanged prefix/suffix keep their
+        # cards (and loaded thumbnails), so adding, removing or finishing one
+        # item costs one card instead of re-creating all of them.
         count = len(self.queue)
         self.count_chip.setText(str(count))
         self.queue_empty_state.setVisible(count == 0)
-        for it in self.queue:
+
+        want = [it.get("url", "") for it in self.queue]
+        have = []
+        for i in range(self.queue_list.count()):
+            data = self.queue_list.item(i).data(Qt.UserRole)
+            have.append(data.get("url", "") if isinstance(data, dict) else None)
+
+        n = min(len(want), len(have))
+        pre = 0
+        while pre < n and want[pre] == have[pre]:
+            pre += 1
+        suf = 0
+        while suf < n - pre and want[-1 - suf] == have[-1 - suf]:
+            suf += 1
+
+        for row in range(len(have) - suf - 1, pre - 1, -1):
+            self.queue_list.takeItem(row)
+        for row in range(pre, count - suf):
+            it = self.queue[row]
             self._add_queue_card_to_list(
                 url=it.get("url", ""),
                 title=it.get("title", "(title pending)"),
                 video_id=it.get("video_id"),
                 show_thumbnail=True,
                 status=it.get("status", "Pending"),
+                row=row,
             )
+        for row in list(range(pre)) + list(range(count - suf, count)):
+            self._sync_queue_row(row, self.queue[row])
         self._apply_queue_filter(self.search_box.text())
 
+    def _sync_queue_row(self, row: int, it: Dict[str, Any]):
+        lw_item = self.queue_list.item(row)
+        data = lw_item.data(Qt.UserRole) or {}
+        title = it.get("title", "(title pending)") or it.get("url", "")
+        status = it.get("status", "Pending")
+        if data.get("title") == title and data.get("status") == status:
+            return
+        w = self.queue_list.itemWidget(lw_item)
+        if isinstance(w, QueueCard):
+            if data.get("status") != status:
+                w.set_status(status)
+            if data.get("title") != title:
+                w.set_title(title)
+        data["title"] = title
+        data["status"] = status
+        lw_item.setData(Qt.UserRole, data)
+
     def _make_queue_card_widget(self, item: Dict[str, Any]) -> QWidget:
         try:
             card = QueueCard(
@@ -2318,6 +2586,9 @@ class MainWindow(QMainWindow):
     # ════════════════════════════════════════════════════════════════════════
 
     def _show_update_manager(self):
+        # Imported on first use: it pulls in requests/urllib3, which nothing
+        # else needs until a network fetch actually happens.
+        from ytget_gui.dialogs.update_manager import UpdateManager
         dlg = UpdateManager(self.settings, self)
         dlg.exec()
 
@@ -2383,7 +2654,13 @@ class MainWindow(QMainWindow):
 
     def _show_advanced_options(self):
         try:
-            dlg = AdvancedOptionsDialog(self, self.settings)
+            # Built once and reused: reopening only refreshes field values
+            # instead of rebuilding, restyling and re-laying out the dialog.
+            dlg = self._advanced_dlg
+            if dlg is None:
+                dlg = self._advanced_dlg = AdvancedOptionsDialog(self, self.settings)
+            else:
+                dlg.reload_from_settings(self.settings)
             if dlg.exec():
                 if hasattr(dlg, "apply") and callable(getattr(dlg, "apply")):
                     try:
@@ -2447,10 +2724,20 @@ class MainWindow(QMainWindow):
     # ════════════════════════════════════════════════════════════════════════
 
     def _save_queue_permanent(self):
+        # Queue mutations tend to come in bursts (status change, pop, refresh),
+        # so coalesce them into one write shortly after the last one.
+        self._queue_save_timer.start()
+
+    def _flush_queue_save(self):
+        self._queue_save_timer.stop()
         try:
             self.queue_file_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.queue_file_path, "w", encoding="utf-8") as f:
-                json.dump(self.queue, f, indent=2, ensure_ascii=False)
+            # Serialise in one go and swap the file in, so a crash mid-write
+            # can't leave a truncated queue.json behind.
+            payload = json.dumps(self.queue, indent=2, ensure_ascii=False)
+            tmp = self.queue_file_path.with_suffix(".json.tmp")
+            tmp.write_text(payload, encoding="utf-8")
+            os.replace(tmp, self.queue_file_path)
         except Exception as e:
             self.log(f"❌ Failed to save queue.json: {e}\n", AppStyles.ERROR_COLOR, "Error")
 
@@ -2509,37 +2796,63 @@ class MainWindow(QMainWindow):
         file, _ = QFileDialog.getSaveFileName(self, "Save Queue As", str(self.queue_file_path), "JSON (*.json)")
         if not file:
             return
-        try:
-            with open(file, "w", encoding="utf-8") as f:
-                json.dump(self.queue, f, indent=2, ensure_ascii=False)
+        # Snapshot the queue here, then leave the (possibly slow) disk write to
+        # a background thread so the window keeps repainting meanwhile.
+        payload = json.dumps(self.queue, indent=2, ensure_ascii=False)
+
+        def write():
+            try:
+                Path(file).write_text(payload, encoding="utf-8")
+                self.queue_file_saved.emit(file, None)
+            except Exception as e:
+                self.queue_file_saved.emit(file, e)
+
+        threading.Thread(target=write, name="QueueSave", daemon=True).start()
+
+    @Slot(str, object)
+    def _on_queue_file_saved(self, file: str, error: Optional[Exception]):
+        if error is None:
             self.log(f"💾 Queue saved to {file}\n", AppStyles.SUCCESS_COLOR, "Info")
-        except Exception as e:
-            self.log(f"❌ Couldn't save queue: {e}\n", AppStyles.ERROR_COLOR, "Error")
+        else:
+            self.log(f"❌ Couldn't save queue: {error}\n", AppStyles.ERROR_COLOR, "Error")
 
     def _load_queue_from_disk(self):
         file, _ = QFileDialog.getOpenFileName(self, "Load Queue", str(self.queue_file_path.parent), "JSON (*.json)")
         if not file:
             return
-        try:
-            with open(file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                if isinstance(data, list):
-                    self.queue = data
-                    self._save_queue_permanent()
-                    self._refresh_queue_list()
-                    for it in self.queue:
-                        url = it.get("url", "")
-                        if url and url not in self._pending_thumb_urls:
-                            try:
-                                self._pending_thumb_urls.add(url)
-                                self.thumb_manager.enqueue(url)
-                            except Exception:
-                                pass
-                    self._update_button_states()
-                    self._update_global_progress_bar()
-                    self.log(f"📥 Queue loaded from {file}\n", AppStyles.SUCCESS_COLOR, "Info")
-                else:
+
+        def read():
+            try:
+                with open(file, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                if not isinstance(data, list):
                     raise ValueError("Invalid queue file format.")
+                self.queue_file_loaded.emit(file, data)
+            except Exception as e:
+                self.queue_file_loaded.emit(file, e)
+
+        threading.Thread(target=read, name="QueueLoad", daemon=True).start()
+
+    @Slot(str, object)
+    def _on_queue_file_loaded(self, file: str, result: Any):
+        if isinstance(result, Exception):
+            self.log(f"❌ Couldn't load queue: {result}\n", AppStyles.ERROR_COLOR, "Error")
+            return
+        try:
+            self.queue = result
+            self._save_queue_permanent()
+            self._refresh_queue_list()
+            for it in self.queue:
+                url = it.get("url", "")
+                if url and url not in self._pending_thumb_urls:
+                    try:
+                        self._pending_thumb_urls.add(url)
+                        self.thumb_manager.enqueue(url)
+                    except Exception:
+                        pass
+            self._update_button_states()
+            self._update_global_progress_bar()
+            self.log(f"📥 Queue loaded from {file}\n", AppStyles.SUCCESS_COLOR, "Info")
         except Exception as e:
             self.log(f"❌ Couldn't load queue: {e}\n", AppStyles.ERROR_COLOR, "Error")
 
@@ -2548,7 +2861,7 @@ class MainWindow(QMainWindow):
     # ════════════════════════════════════════════════════════════════════════
 
     def _restore_window(self):
-        settings = QSettings(self.settings.APP_NAME, self.settings.APP_NAME)
+        settings = self._qsettings
         geo = settings.value("main/geometry")
         state = settings.value("main/windowState")
         if geo:
@@ -2574,7 +2887,7 @@ class MainWindow(QMainWindow):
                     self._pending_thumb_urls.clear()
             except Exception:
                 pass
-            settings = QSettings(self.settings.APP_NAME, self.settings.APP_NAME)
+            settings = self._qsettings
             settings.setValue("main/geometry", self.saveGeometry())
             settings.setValue("main/windowState", self.saveState())
             settings.setValue("main/splitSizes", self.main_split.sizes())
@@ -2582,7 +2895,7 @@ class MainWindow(QMainWindow):
                 settings.sync()
             except Exception:
                 pass
-            self._save_queue_permanent()
+            self._flush_queue_save()
             try:
                 if self.download_worker:
                     self.download_worker.cancel()
@@ -2596,17 +2909,10 @@ class MainWindow(QMainWindow):
             try:
                 if self.title_queue:
                     self.title_queue.stop()
-                if self.title_queue_thread:
-                    self.title_queue_thread.quit()
-                    self.title_queue_thread.wait(2000)
-            except Exception:
-                pass
-            try:
-                if self.cover_thread and self.cover_thread.isRunning():
-                    self.cover_thread.quit()
-                    self.cover_thread.wait(2000)
             except Exception:
                 pass
+            for thread_attr in ("download_thread", "title_queue_thread", "cover_thread"):
+                self._stop_thread(thread_attr)
         except Exception:
             pass
         super().closeEvent(event)
@@ -167,16 +167,133 @@ class AppStyles:
             }}
         """
 
+    @classmethod
+    def advanced_dialog(cls) -> str:
+        """
+        Rules for AdvancedOptionsDialog, scoped by its object name so they
+        can live in the main window's stylesheet (parsed once at startup)
+        instead of being re-applied on the dialog itself.
+        """
+        scope = "QDialog#AdvancedOptionsDialog"
+        muted_text = "rgba(255, 255, 255, 150)"
+        border_c = "rgba(255, 255, 255, 30)"
+        field_bg = "rgba(255, 255, 255, 15)"
+        field_hover = "rgba(255, 255, 255, 22)"
+        accent2 = "#7C4DFF"
+        return f"""
+            {scope} {{
+                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+                    stop:0 #0a0e1a, stop:0.3 #15102e,
+                    stop:0.6 #1e1b4b, stop:1 #0c1733);
+                color: {cls.TEXT_COLOR};
+            }}
+
+            {scope} #dlgTitle {{
+                font-size: 18px;
+                font-weight: 700;
+                color: {cls.TEXT_COLOR};
+                margin-bottom: 2px;
+            }}
+            {scope} #dlgSubtitle {{
+                font-size: 12px;
+                color: {muted_text};
+            }}
+
+            {scope} #sectionLabel {{
+                font-size: 11px;
+                font-weight: 700;
+                text-transform: uppercase;
+                letter-spacing: 0.6px;
+                color: {cls.PRIMARY_ACCENT};
+                padding: 4px 0 2px 0;
+            }}
+
+            {scope} #formLabel {{
+                font-size: 12px;
+                color: {muted_text};
+                padding-top: 4px;
+            }}
+
+            {scope} QLineEdit#input {{
+                background: {field_bg};
+                color: {cls.TEXT_COLOR};
+                border: 1px solid {border_c};
+                border-radius: 10px;
+                padding: 8px 12px;
+                selection-background-color: {cls.PRIMARY_ACCENT};
+                selection-color: #0a0e1a;
+                font-size: 13px;
+            }}
+            {scope} QLineEdit#input:hover {{
+                background: {field_hover};
+                border: 1px solid rgba(255, 255, 255, 50);
+            }}
+            {scope} QLineEdit#input:focus {{
+                border: 1px solid {cls.PRIMARY_ACCENT};
+                background: rgba(0, 229, 255, 10);
+                outline: none;
+            }}
+            {scope} QLineEdit#input[state="error"] {{
+                border: 1px solid {cls.ERROR_COLOR};
+                background: rgba(248, 113, 113, 25);
+            }}
+            {scope} QLineEdit#input:disabled {{
+                color: rgba(255, 255, 255, 80);
+                background: rgba(255, 255, 255, 8);
+                border: 1px solid rgba(255, 255, 255, 15);
+            }}
+
+            {scope} #divider {{
+                background: rgba(255, 255, 255, 20);
+                min-height: 1px;
+                max-height: 1px;
+                border: none;
+            }}
+
+            {scope} QDialogButtonBox QPushButton {{
+                border-radius: 10px;
+                padding: 8px 16px;
+                font-weight: 600;
+                font-size: 13px;
+                min-width: 80px;
+            }}
+            {scope} QDialogButtonBox QPushButton:default {{
+                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                    stop:0 {cls.PRIMARY_ACCENT}, stop:1 {accent2});
+                color: #ffffff;
+                border: none;
+            }}
+            {scope} QDialogButtonBox QPushButton:default:hover {{
+                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                    stop:0 #33EEFF, stop:1 #9C6DFF);
+            }}
+            {scope} QDialogButtonBox QPushButton:!default {{
+                background: {field_bg};
+                color: {cls.TEXT_COLOR};
+                border: 1px solid {border_c};
+            }}
+            {scope} QDialogButtonBox QPushButton:!default:hover {{
+                border: 1px solid rgba(255, 255, 255, 50);
+                background: {field_hover};
+            }}
+            {scope} QDialogButtonBox QPushButton:disabled {{
+                color: rgba(255, 255, 255, 60);
+                background: rgba(255, 255, 255, 8);
+                border: 1px solid rgba(255, 255, 255, 15);
+            }}
+        """
+
     # Backward-compatible class attributes
     BUTTON = ""
     QUEUE = ""
     LOG = ""
     DIALOG = ""
+    ADVANCED_DIALOG = ""
 
 
 def refresh_styles() -> None:
     """
-    Recompute AppStyles.BUTTON / QUEUE / LOG / DIALOG using the *current*
+    Recompute AppStyles.BUTTON / QUEUE / LOG / DIALOG / ADVANCED_DIALOG using the *current*
     DPI scale. Call this once, after the QApplication (and its primary
     screen) exist.
     """
@@ -184,6 +301,7 @@ def refresh_styles() -> None:
     AppStyles.QUEUE = AppStyles.queue()
     AppStyles.LOG = AppStyles.log()
     AppStyles.DIALOG = AppStyles.dialog()
+    AppStyles.ADVANCED_DIALOG = AppStyles.advanced_dialog()
 
 
 # Populate with a best-effort value immediately
@@ -0,0 +1,45 @@
+# File: ytget_gui/utils/http.py
+
+from __future__ import annotations
+
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from ytget_gui.settings import AppSettings
+
+# Transient gateway errors are retried with a short backoff instead of failing
+# the whole request; GETs only. Connect errors fail fast, an unreachable host
+# shouldn't stall the caller through every retry's timeout.
+_RETRY = Retry(
+    total=3,
+    connect=0,
+    backoff_factor=0.3,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=frozenset({"GET"}),
+)
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """
+    Return the app-wide requests session, creating it on first use.
+    Sharing one session keeps TLS connections to GitHub/PyPI alive across
+    update checks and downloads instead of handshaking again for each new
+    checker, and its single pool is never left for the GC to close.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            s = requests.Session()
+            s.headers["User-Agent"] = f"YTGet/{AppSettings.VERSION}"
+            # A few hosts (api.github.com, pypi.org, github.com and its asset
+            # CDN), with up to four concurrent connections to each.
+            s.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=_RETRY))
+            _session = s
+        return _session
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 import re
+from typing import Optional
 
 # Accept any HTTP or HTTPS URL
 _ANY_HTTP_URL_RE = re.compile(
@@ -37,3 +38,21 @@ def is_youtube_url(text: str) -> bool:
         return False
     candidate = text.strip().rstrip("/")
     return bool(_YOUTUBE_URL_RE.match(candidate))
+
+# Single-video YouTube URLs and the 11-char id they carry
+_YOUTUBE_VIDEO_ID_RE = re.compile(
+    r'(?:youtube(?:-nocookie)?\.com/(?:watch\?(?:[^#\s]*&)?v=|embed/|shorts/|live/|v/)'
+    r'|youtu\.be/)'
+    r'([A-Za-z0-9_-]{11})(?![A-Za-z0-9_-])',
+    re.IGNORECASE
+)
+
+def video_id_from_url(text: str) -> Optional[str]:
+    """
+    Return the video id of a single-video YouTube URL, or None for anything
+    else (other sites, no id, or a URL that also names a playlist).
+    """
+    if not text or "list=" in text:
+        return None
+    m = _YOUTUBE_VIDEO_ID_RE.search(text.strip())
+    return m.group(1) if m else None
@@ -84,7 +84,10 @@ class QueueCard(QFrame):
 
         self._context_actions: List[Tuple[str, Callable[[], None]]] = []
         self._last_meta_width: int = -1
+        self._full_title: str = title or ""
+        self._last_title_width: int = -1
         self._last_progress_value: int = -1
+        self._last_chip_style: Optional[str] = None
         self._last_thumb_path: Optional[str] = None
         self._last_thumb_pixmap_key: Optional[int] = None
 
@@ -118,9 +121,15 @@ class QueueCard(QFrame):
         title_row = QHBoxLayout()
         title_row.setSpacing(6)
 
-        self.title_lbl = QLabel(_clamp(title, 90))
+        # Single line, elided to the label's own pixel width whenever it is
+        # resized (see eventFilter): the status chip beside it changes width
+        # as its text does, even when the card doesn't. The Ignored policy
+        # keeps a long title from widening the card.
+        self.title_lbl = QLabel(self._full_title)
         self.title_lbl.setObjectName("CardTitle")
-        self.title_lbl.setWordWrap(True)
+        self.title_lbl.setSizePolicy(QSizePolicy.Ignored, QSizePolicy.Preferred)
+        self.title_lbl.setToolTip(self._full_title)
+        self.title_lbl.installEventFilter(self)
         title_row.addWidget(self.title_lbl, 1)
 
         self.status_chip = QLabel(status)
@@ -224,11 +233,12 @@ class QueueCard(QFrame):
         self._apply_status_style(status)
 
     def set_title(self, title: str) -> None:
-        text = _clamp(title or "", 90)
-        if self.title_lbl.text() == text:
+        title = title or ""
+        if title == self._full_title:
             return
-        self.title_lbl.setText(text)
-        self.title_lbl.setToolTip(title or "")
+        self._full_title = title
+        self.title_lbl.setToolTip(title)
+        self._set_elided_title(self.title_lbl.width(), force=True)
 
     def set_progress(self, value: int) -> None:
         v = max(0, min(100, int(value)))
@@ -277,6 +287,11 @@ class QueueCard(QFrame):
     def _apply_status_style(self, status: str) -> None:
         self.status_chip.setText(status)
         chip_style = STATUS_CHIP_STYLES.get(status, _DEFAULT_CHIP_STYLE)
+        # Progress text ("42% ETA 00:10") changes often but keeps the same
+        # chip style; only re-apply and re-polish when the style changes.
+        if chip_style == self._last_chip_style:
+            return
+        self._last_chip_style = chip_style
         self.status_chip.setStyleSheet(chip_style)
         self._repolish()
 
@@ -312,11 +327,25 @@ class QueueCard(QFrame):
             self.meta_lbl.setText(_clamp(self._full_meta_text, 64))
             self.meta_lbl.setToolTip(self._full_meta_text)
 
+    def _set_elided_title(self, max_width: int, force: bool = False) -> None:
+        if not force and max_width == self._last_title_width:
+            return
+        self._last_title_width = max_width
+        if max_width <= 0:
+            # Not laid out yet; the label's Resize event elides once it is.
+            self.title_lbl.setText(self._full_title)
+            return
+        fm = self.title_lbl.fontMetrics()
+        self.title_lbl.setText(fm.elidedText(self._full_title, Qt.ElideRight, max_width))
+
     # ----- Hover/elevation -----
 
     def eventFilter(self, obj, event):
         et = event.type()
-        if et == QEvent.Enter:
+        if obj is self.title_lbl:
+            if et == QEvent.Resize:
+                self._set_elided_title(event.size().width())
+        elif et == QEvent.Enter:
             self.setProperty("elevated", True)
             self._repolish()
         elif et == QEvent.Leave:
@@ -3,8 +3,11 @@ from __future__ import annotations
 
 import base64
 import io
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Union
+from typing import Dict, List, Optional, Tuple, Union
 from PIL import Image
 from mutagen.id3 import ID3, ID3NoHeaderError
 from mutagen.flac import FLAC, Picture
@@ -13,14 +16,20 @@ from PySide6.QtCore import QObject, Signal
 
 from ytget_gui.styles import AppStyles
 
+# Files a previous sweep left alone (no cover, already square, or just
+# cropped), keyed by path with their [mtime_ns, size] at that time.
+COVER_CACHE_FILE = "cover_cache.json"
+
 class CoverCropWorker(QObject):
     """Scans MP3 and FLAC files and crops embedded covers to 1:1 centered."""
     log = Signal(str, str)
     finished = Signal()
 
-    def __init__(self, downloads_dir: Path):
+    def __init__(self, downloads_dir: Path, cache_dir: Optional[Path] = None):
         super().__init__()
         self.downloads_dir = downloads_dir
+        self._cache_path = Path(cache_dir) / COVER_CACHE_FILE if cache_dir else None
+        self._known: Dict[str, List[int]] = {}
 
     @staticmethod
     def _is_temp_artifact(p: Path) -> bool:
@@ -46,21 +55,66 @@ class CoverCropWorker(QObject):
             self.finished.emit()
             return
 
+        self._known = self._load_cache()
+        seen: Dict[str, List[int]] = {}
         processed = 0
         changed = 0
-        for file_path in audio_files:
-            try:
-                did_change = self._process_audio(file_path)
+        # Files are independent and Pillow releases the GIL while decoding and
+        # encoding, so crop them in parallel; results come back in file order.
+        workers = min(len(audio_files), os.cpu_count() or 4)
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            for file_path, did_change, error in ex.map(self._crop_one, audio_files):
+                if error is not None:
+                    self.log.emit(f"⚠️ Skipped {file_path.name}: {error}\n", AppStyles.WARNING_COLOR)
+                    continue
                 processed += 1
+                try:
+                    seen[str(file_path)] = self._stat_key(file_path)
+                except OSError:
+                    pass
                 if did_change:
                     changed += 1
                     self.log.emit(f"🖼️ Cropped Cover to 1:1: {file_path.name}\n", AppStyles.SUCCESS_COLOR)
-            except Exception as e:
-                self.log.emit(f"⚠️ Skipped {file_path.name}: {e}\n", AppStyles.WARNING_COLOR)
 
+        # Rebuilt from this sweep only, so deleted files drop out
+        if seen != self._known:
+            self._save_cache(seen)
         self.log.emit(f"✅ Cover Cropping Complete. Processed {processed}, Updated {changed} Files.\n", AppStyles.SUCCESS_COLOR)
         self.finished.emit()
 
+    @staticmethod
+    def _stat_key(file: Path) -> List[int]:
+        st = file.stat()
+        return [st.st_mtime_ns, st.st_size]
+
+    def _load_cache(self) -> Dict[str, List[int]]:
+        if self._cache_path is None:
+            return {}
+        try:
+            data = json.loads(self._cache_path.read_text(encoding="utf-8"))
+        except Exception:
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _save_cache(self, entries: Dict[str, List[int]]) -> None:
+        if self._cache_path is None:
+            return
+        tmp = self._cache_path.with_suffix(".json.tmp")
+        try:
+            tmp.write_text(json.dumps(entries), encoding="utf-8")
+            os.replace(tmp, self._cache_path)
+        except Exception:
+            pass
+
+    def _crop_one(self, file: Path) -> Tuple[Path, bool, Optional[Exception]]:
+        try:
+            # Untouched since a previous sweep checked it: skip opening the tags
+            if self._known.get(str(file)) == self._stat_key(file):
+                return file, False, None
+            return file, self._process_audio(file), None
+        except Exception as e:
+            return file, False, e
+
     def _process_audio(self, file: Path) -> bool:
         if file.suffix.lower() == ".mp3":
             return self._crop_mp3_cover(file)
@@ -70,7 +124,23 @@ class CoverCropWorker(QObject):
             return self._crop_opus_cover(file)
         return False
 
+    @staticmethod
+    def _has_id3_picture(file: Path) -> bool:
+        """Cheap pre-check: read just the ID3v2 tag bytes and look for a
+        picture frame id, so files without a cover skip mutagen's full parse."""
+        with open(file, "rb") as f:
+            hdr = f.read(10)
+            if len(hdr) < 10 or hdr[:3] != b"ID3":
+                return False
+            # Tag size is a 28-bit syncsafe integer (7 bits per byte)
+            size = (hdr[6] << 21) | (hdr[7] << 14) | (hdr[8] << 7) | hdr[9]
+            body = f.read(size)
+        # ID3v2.2 uses three-letter frame ids ("PIC"), which mutagen upgrades
+        return (b"PIC" if hdr[3] == 2 else b"APIC") in body
+
     def _crop_mp3_cover(self, file: Path) -> bool:
+        if not self._has_id3_picture(file):
+            return False
         try:
             tags = ID3(file)
         except ID3NoHeaderError:
@@ -89,13 +159,8 @@ class CoverCropWorker(QObject):
 
             if img.width == img.height:
                 continue
-            img = self._ensure_rgb(img)
-            cropped = self._crop_image_to_square(img)
-            buf = io.BytesIO()
-            cropped.save(buf, format="JPEG", quality=95, optimize=True)
-
             apic.mime = "image/jpeg"
-            apic.data = buf.getvalue()
+            apic.data, _ = self._encode_square_jpeg(img)
             updated = True
 
         if updated:
@@ -117,18 +182,11 @@ class CoverCropWorker(QObject):
 
         if img.width == img.height:
             return False
-        img = self._ensure_rgb(img)
-        cropped = self._crop_image_to_square(img)
-
-        buf = io.BytesIO()
-        cropped.save(buf, format="JPEG", quality=95, optimize=True)
-
         new_pic = Picture()
-        new_pic.data = buf.getvalue()
+        new_pic.data, (new_pic.width, new_pic.height) = self._encode_square_jpeg(img)
         new_pic.type = pic.type
         new_pic.mime = "image/jpeg"
         new_pic.desc = pic.desc or "Cover"
-        new_pic.width, new_pic.height = cropped.size
         new_pic.depth = 24
 
         audio.clear_pictures()
@@ -153,18 +211,11 @@ class CoverCropWorker(QObject):
 
         if img.width == img.height:
             return False
-        img = self._ensure_rgb(img)
-        cropped = self._crop_image_to_square(img)
-
-        buf = io.BytesIO()
-        cropped.save(buf, format="JPEG", quality=95, optimize=True)
-
         new_pic = Picture()
-        new_pic.data = buf.getvalue()
+        new_pic.data, (new_pic.width, new_pic.height) = self._encode_square_jpeg(img)
         new_pic.type = pic.type
         new_pic.mime = "image/jpeg"
         new_pic.desc = pic.desc or "Cover"
-        new_pic.width, new_pic.height = cropped.size
         new_pic.depth = 24
 
         audio["metadata_block_picture"] = [
@@ -173,6 +224,16 @@ class CoverCropWorker(QObject):
         audio.save()
         return True
 
+    def _encode_square_jpeg(self, img: Image.Image) -> Tuple[bytes, Tuple[int, int]]:
+        # Crop before converting so the colour conversion only touches the
+        # pixels that are kept.
+        cropped = self._ensure_rgb(self._crop_image_to_square(img))
+        buf = io.BytesIO()
+        # No optimize pass: the extra Huffman sweep saves little on a cover
+        # this size. 4:2:0 matches how cover art is usually encoded.
+        cropped.save(buf, format="JPEG", quality=90, subsampling=2, progressive=False)
+        return buf.getvalue(), cropped.size
+
     def _crop_image_to_square(self, img: Image.Image) -> Image.Image:
         side = min(img.width, img.height)
         left = (img.width - side) // 2
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 from pathlib import Path
 from PySide6.QtCore import QObject, Signal, QTimer
 import os
@@ -19,6 +19,46 @@ from ytget_gui.settings import AppSettings, FILENAME_FORMAT_PRESETS
 from ytget_gui.workers import cookies as CookieManager
 from ytget_gui.workers import ssl_utils
 
+# Suffixes stripped from audio filenames after a download (compiled once)
+_MUSIC_VIDEO_TAGS = [
+    "(music video)", "(official video)", "(official visualizer)", "(video oficial)",
+    "[official video]", "(drone)", "(video)", "(visualiser)", "(lyric video)", "(lyrics)",
+    "(audio)", "(official track)", "(original mix)", "(hq)", "(hd)", "(high quality)",
+    "(full song)", "(snippet)", "(reaction)", "(review)", "(trailer)", "(teaser)",
+    "(fan edit)", "(studio version)", "(youtube)", "(vevo)", "(tiktok)",
+    "(drone shot)", "(pov video)", "(official music video)", "(visualizer)",
+    "(official lyric video)",
+]
+_MUSIC_VIDEO_TAG_RE = re.compile(
+    r"\s*(?:" + "|".join(re.escape(t) for t in _MUSIC_VIDEO_TAGS) + r")", re.IGNORECASE
+)
+# Every tag opens with one of these, so names without any skip the regex
+_MUSIC_VIDEO_TAG_OPENERS = frozenset(t[0] for t in _MUSIC_VIDEO_TAGS)
+_COLLAPSE_WS_RE = re.compile(r"\s{2,}")
+_AUDIO_EXTS = (".mp3", ".flac", ".opus")
+
+
+def _iter_audio_entries(root: str) -> Iterator[os.DirEntry]:
+    """Yield the audio files under root, checking names on the DirEntry
+    before building any Path (like os.walk, symlinked dirs aren't followed)."""
+    stack = [root]
+    while stack:
+        try:
+            # Listed up front since callers may rename files as they go
+            with os.scandir(stack.pop()) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        for e in entries:
+            try:
+                if e.is_dir(follow_symlinks=False):
+                    stack.append(e.path)
+                elif e.name.lower().endswith(_AUDIO_EXTS):
+                    yield e
+            except OSError:
+                continue
+
+
 @dataclass
 class QueueItem:
     url: str
@@ -54,6 +94,8 @@ class DownloadWorker(QObject):
         self._log_buffer: List[Tuple[str, str]] = []
         self._log_timer: Optional[QTimer] = None
         self._log_flush_ms = max(100, int(log_flush_ms))
+        # Raw output not yet ending in a newline (yt-dlp runs with --newline)
+        self._read_buf = bytearray()
 
         # Regexes and tokens
         self._percent_re = re.compile(r"([0-9]{1,3}(?:[.,][0-9]+)?)\s*%")
@@ -298,19 +340,42 @@ class DownloadWorker(QObject):
         if not data:
             return
         try:
-            text = data.decode(errors="ignore")
-
-            # quick error detection
-            is_error = self._error_sub in text.lower()
-            color = AppStyles.ERROR_COLOR if is_error else AppStyles.TEXT_COLOR
-
-            # Append raw chunk to buffer (batching avoids signaling per chunk)
-            self._add_log(text, color)
+            # Only decode complete lines, so a multi-byte character split
+            # across two reads isn't dropped and each line is scanned once.
+            self._read_buf += data
+            cut = self._read_buf.rfind(b"\n")
+            if cut == -1:
+                if len(self._read_buf) < 64 * 1024:
+                    return
+                cut = len(self._read_buf) - 1
+            text = self._read_buf[: cut + 1].decode(errors="ignore")
+            del self._read_buf[: cut + 1]
+            self._on_output_text(text)
+        except Exception:
+            # swallow exceptions to keep worker alive
+            pass
 
-            # attempt progress extraction if possible, keep it cheap
-            tail = text[-300:]  # small window where progress typically lives
-            if (self._download_tag in tail) or ("%" in tail):
-                m = self._percent_re.search(tail)
+    def _on_output_text(self, text: str):
+        try:
+            # Colour line by line, batching consecutive lines of one colour
+            run: List[str] = []
+            run_color = AppStyles.TEXT_COLOR
+            progress_line: Optional[str] = None
+            for line in text.splitlines(keepends=True):
+                color = AppStyles.ERROR_COLOR if self._error_sub in line.lower() else AppStyles.TEXT_COLOR
+                if run and color != run_color:
+                    self._add_log("".join(run), run_color)
+                    run = []
+                run_color = color
+                run.append(line)
+                if line.startswith(self._download_tag) and "%" in line:
+                    progress_line = line
+            if run:
+                self._add_log("".join(run), run_color)
+
+            # Only the newest progress line of the batch matters
+            if progress_line is not None:
+                m = self._percent_re.search(progress_line)
                 pct_text: Optional[str] = None
                 if m:
                     try:
@@ -320,11 +385,10 @@ class DownloadWorker(QObject):
                         pct_text = m.group(1) + "%"
 
                 eta_text: Optional[str] = None
-                up = tail.upper()
-                pos = up.rfind("ETA")
+                pos = progress_line.upper().rfind("ETA")
                 if pos != -1:
-                    after = tail[pos + 3 :].strip()
-                    token = after.split()[0] if after.split() else ""
+                    after = progress_line[pos + 3 :].split()
+                    token = after[0] if after else ""
                     if ":" in token or token.isdigit():
                         eta_text = token
 
@@ -353,6 +417,11 @@ class DownloadWorker(QObject):
         except Exception:
             pass
 
+        if self._read_buf:
+            # last line without a trailing newline
+            self._on_output_text(self._read_buf.decode(errors="ignore"))
+            self._read_buf.clear()
+
         try:
             # final flush
             self._flush_logs()
@@ -822,49 +891,48 @@ class DownloadWorker(QObject):
         downloads_root: Path = Path(self.settings.DOWNLOADS_DIR)
         if not downloads_root.exists():
             return 0
-        audio_exts = {".mp3", ".flac", ".opus"}
-        tag_texts = [
-            "(music video)", "(official video)", "(official visualizer)", "(video oficial)",
-            "[official video]", "(drone)", "(video)", "(visualiser)", "(lyric video)", "(lyrics)",
-            "(audio)", "(official track)", "(original mix)", "(hq)", "(hd)", "(high quality)",
-            "(full song)", "(snippet)", "(reaction)", "(review)", "(trailer)", "(teaser)",
-            "(fan edit)", "(studio version)", "(youtube)", "(vevo)", "(tiktok)",
-            "(drone shot)", "(pov video)", "(official music video)", "(visualizer)",
-            "(official lyric video)",
-        ]
-        escaped = "|".join(re.escape(t) for t in tag_texts)
-        combined = re.compile(r"\s*(?:" + escaped + r")", re.IGNORECASE)
-        renamed = 0
 
-        for root, _dirs, files in os.walk(downloads_root):
-            for fname in files:
-                p = Path(root) / fname
-                if p.suffix.lower() not in audio_exts:
-                    continue
-                if not combined.search(fname):
-                    continue
-                new_stem = combined.sub("", p.stem)
-                new_stem = re.sub(r"\s{2,}", " ", new_stem).strip(" -_.,")
-                if not new_stem:
-                    new_stem = p.stem
-                new_name = f"{new_stem}{p.suffix}"
-                new_path = p.with_name(new_name)
-                if new_path == p:
-                    continue
-                if new_path.exists():
-                    i = 1
-                    while True:
-                        candidate = p.with_name(f"{new_stem} ({i}){p.suffix}")
-                        if not candidate.exists():
-                            new_path = candidate
-                            break
-                        i += 1
+        # Plan every rename first, resolving collisions against one listing
+        # per directory instead of probing the disk for each candidate name.
+        # Names compare casefolded so a case-insensitive filesystem can't
+        # have a rename land on an existing file.
+        plan: List[Tuple[str, str]] = []
+        taken: Dict[str, Set[str]] = {}
+        for entry in _iter_audio_entries(str(downloads_root)):
+            if not any(c in entry.name for c in _MUSIC_VIDEO_TAG_OPENERS):
+                continue
+            stem, ext = os.path.splitext(entry.name)
+            # One pass both detects and strips the tags
+            new_stem, count = _MUSIC_VIDEO_TAG_RE.subn("", stem)
+            if not count:
+                continue
+            new_stem = _COLLAPSE_WS_RE.sub(" ", new_stem).strip(" -_.,")
+            if not new_stem:
+                continue
+            folder = os.path.dirname(entry.path)
+            names = taken.get(folder)
+            if names is None:
                 try:
-                    p.rename(new_path)
-                    renamed += 1
-                    self._add_log(f"🧹 Renamed: {p.name} → {new_path.name}\n", AppStyles.INFO_COLOR)
-                except Exception:
-                    pass
+                    names = {n.casefold() for n in os.listdir(folder)}
+                except OSError:
+                    continue
+                taken[folder] = names
+            new_name = f"{new_stem}{ext}"
+            i = 1
+            while new_name.casefold() in names:
+                new_name = f"{new_stem} ({i}){ext}"
+                i += 1
+            names.add(new_name.casefold())
+            plan.append((entry.path, os.path.join(folder, new_name)))
+
+        renamed = 0
+        for src, dst in plan:
+            try:
+                os.rename(src, dst)
+                renamed += 1
+                self._add_log(f"🧹 Renamed: {os.path.basename(src)} → {os.path.basename(dst)}\n", AppStyles.INFO_COLOR)
+            except OSError:
+                pass
         return renamed
 
     # Minimal, efficient logging helpers
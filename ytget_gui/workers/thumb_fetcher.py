@@ -10,8 +10,6 @@ import re
 import tempfile
 from pathlib import Path
 from typing import Optional, Tuple, Any, List
-import requests
-from requests.exceptions import RequestException
 from urllib.parse import urlparse, parse_qs
 import shutil
 import threading
@@ -513,6 +511,10 @@ class ThumbFetcher(QObject):
             return None
 
     def _download_with_requests(self, thumb_url: str, target: Path) -> Optional[Path]:
+        # Deferred so importing this module at startup doesn't load requests
+        from requests.exceptions import RequestException
+        from ytget_gui.utils.http import get_session
+
         headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/115.0 Safari/537.36",
             "Accept": "image/avif,image/webp,image/apng,image/*,*/*;q=0.8",
@@ -528,7 +530,7 @@ class ThumbFetcher(QObject):
         ssl_utils.maybe_suppress_insecure_warning(requests_verify)
 
         try:
-            with requests.get(thumb_url, headers=headers, stream=True, timeout=self.timeout, proxies=proxies, allow_redirects=True, verify=requests_verify) as r:
+            with get_session().get(thumb_url, headers=headers, stream=True, timeout=self.timeout, proxies=proxies, allow_redirects=True, verify=requests_verify) as r:
                 try:
                     r.raise_for_status()
                 except RequestException as e:
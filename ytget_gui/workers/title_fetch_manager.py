@@ -7,20 +7,48 @@ import re
 import subprocess
 import platform
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Any, Deque, Set, Optional
 from collections import deque
 from pathlib import Path
 
-from PySide6.QtCore import QObject, Signal, Slot
+from PySide6.QtCore import QObject, QTimer, Signal, Slot
 from ytget_gui.settings import AppSettings
 from ytget_gui.workers import cookies as CookieManager
 from ytget_gui.workers import ssl_utils
+from ytget_gui.utils.validators import video_id_from_url
+
+
+# yt-dlp metadata lookups run at once; each is a separate process that mostly
+# waits on the network, so a handful in parallel turns a bulk drop/paste into
+# roughly N/4 round-trips instead of N.
+MAX_CONCURRENT_FETCHES = 4
+
+# Several URLs queued together (a multi-URL drop) are looked up a batch per
+# yt-dlp process instead of one process each; startup dominates a flat lookup.
+MAX_BATCH = 50
+
+# URLs added one at a time (pasting several links in a row) are held this
+# long so they go out together as one batch rather than a process each.
+ENQUEUE_COALESCE_MS = 150
+
+# Seconds allowed for one URL, plus a little for each extra URL in a batch.
+FETCH_TIMEOUT = 120
+BATCH_TIMEOUT_PER_URL = 30
+
+# Titles already resolved for single YouTube videos, keyed by video id and
+# kept across sessions so re-adding a known video skips yt-dlp entirely.
+TITLE_CACHE_FILE = "title_cache.json"
+TITLE_CACHE_MAX = 5000
+
+_SPOTIFY_RE = re.compile(r"https?://(open\.)?spotify\.com/", re.IGNORECASE)
 
 
 class TitleFetchQueue(QObject):
     """
-    Serial queue that fetches titles one-by-one in its own thread.
-    Signals are forwarded to UI.
+    Queue that fetches titles on a small pool of worker threads
+    (MAX_CONCURRENT_FETCHES at a time). Signals are forwarded to UI.
     """
 
     # Forwarded signals
@@ -38,61 +66,169 @@ class TitleFetchQueue(QObject):
         self.settings = settings
         self._queue: Deque[str] = deque()
         self._pending: Set[str] = set()
-        self._running = False
         self._stopping = False
+        self._pool = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_FETCHES, thread_name_prefix="title-fetch")
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._procs: Set[subprocess.Popen] = set()
+        # Cookie refresh exports to one shared file and saves the config, so
+        # concurrent fetches take turns at it.
+        self._cookies_lock = threading.Lock()
+        self._cache_path = Path(settings.BASE_DIR) / TITLE_CACHE_FILE
+        self._title_cache: dict[str, dict[str, str]] = self._load_title_cache()
+        self._cache_dirty = False
+        # Created on first use so it belongs to the thread this queue runs in
+        self._coalesce_timer: Optional[QTimer] = None
 
     @Slot(str)
     def enqueue(self, url: str):
-        if not url or url in self._pending:
+        if not url:
             return
+        # _pending is also cleared from pool threads as jobs finish
+        with self._lock:
+            if url in self._pending:
+                return
+            self._pending.add(url)
         self._queue.append(url)
-        self._pending.add(url)
-        if not self._running:
-            self._process_next()
+        if self._coalesce_timer is None:
+            self._coalesce_timer = QTimer(self)
+            self._coalesce_timer.setSingleShot(True)
+            self._coalesce_timer.setInterval(ENQUEUE_COALESCE_MS)
+            self._coalesce_timer.timeout.connect(self._process_next)
+        self._coalesce_timer.start()
 
     @Slot(list)
     def enqueue_many(self, urls: List[str]):
         added = False
-        for u in urls:
-            if u and u not in self._pending:
-                self._queue.append(u)
-                self._pending.add(u)
-                added = True
-        if added and not self._running:
+        with self._lock:
+            for u in urls:
+                if u and u not in self._pending:
+                    self._queue.append(u)
+                    self._pending.add(u)
+                    added = True
+        if added:
             self._process_next()
 
     @Slot()
     def stop(self):
-        # Soft stop: finish current item and drain nothing else
+        # Drain nothing else and end in-flight lookups, so shutdown doesn't
+        # wait on up to MAX_CONCURRENT_FETCHES yt-dlp processes.
         self._stopping = True
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self._flush_title_cache()
+        with self._lock:
+            procs = list(self._procs)
+        for proc in procs:
+            try:
+                proc.kill()
+            except Exception:
+                pass
 
     def _process_next(self):
-        # Iterative drain loop (not recursive): a recursive version here grows
-        # the call stack by one frame per queued URL and can raise
-        # RecursionError on large batches/playlists.
-        if self._running:
+        # Hand everything queued to the pool; it runs up to
+        # MAX_CONCURRENT_FETCHES jobs at once and holds the rest in order.
+        # URLs queued together are split into at most that many batches
+        # (capped at MAX_BATCH each) so a bulk drop both shares processes
+        # and still uses every worker.
+        if self._stopping:
+            self._queue.clear()
+            with self._lock:
+                self._pending.clear()
             return
-        self._running = True
+        urls = [u for u in self._queue if not self._emit_cached(u)]
+        self._queue.clear()
+        jobs: List[List[str]] = [[u] for u in urls if _SPOTIFY_RE.search(u)]
+        rest = [u for u in urls if not _SPOTIFY_RE.search(u)]
+        if rest:
+            size = min(MAX_BATCH, -(-len(rest) // MAX_CONCURRENT_FETCHES))
+            jobs.extend(rest[i:i + size] for i in range(0, len(rest), size))
+        # Count every job before submitting any, so a fast first job can't
+        # see zero in flight and report idle while the rest are queued.
+        with self._lock:
+            self._in_flight += len(jobs)
+        for job in jobs:
+            self._pool.submit(self._run_job, job)
+        if not jobs:
+            self._emit_idle_if_drained()
+
+    def _run_job(self, urls: List[str]):
         try:
-            while True:
-                if self._stopping:
-                    self._queue.clear()
-                    self._pending.clear()
-                    break
-
-                if not self._queue:
-                    break
-
-                url = self._queue.popleft()
+            if self._stopping:
+                return
+            for url in urls:
                 self.started_one.emit(url)
-                try:
-                    self._fetch_one(url)
-                finally:
-                    self._pending.discard(url)
+            try:
+                if len(urls) == 1:
+                    self._fetch_one(urls[0])
+                else:
+                    self._fetch_batch(urls)
+            finally:
+                with self._lock:
+                    self._pending.difference_update(urls)
+                for url in urls:
                     self.finished_one.emit(url)
         finally:
-            self._running = False
-            self.idle.emit()
+            with self._lock:
+                self._in_flight -= 1
+            self._emit_idle_if_drained()
+
+    def _emit_idle_if_drained(self):
+        with self._lock:
+            if self._in_flight:
+                return
+        self._flush_title_cache()
+        self.idle.emit()
+
+    # ── Title cache ─────────────────────────────────────────────────────────
+
+    def _load_title_cache(self) -> dict[str, dict[str, str]]:
+        try:
+            data = json.loads(self._cache_path.read_text(encoding="utf-8"))
+        except Exception:
+            return {}
+        if not isinstance(data, dict):
+            return {}
+        return {k: v for k, v in data.items() if isinstance(v, dict) and v.get("title")}
+
+    def _flush_title_cache(self):
+        # Written once per drained batch (and on stop) rather than per title.
+        with self._lock:
+            if not self._cache_dirty:
+                return
+            snapshot = dict(self._title_cache)
+            self._cache_dirty = False
+        tmp = self._cache_path.with_suffix(".json.tmp")
+        try:
+            tmp.write_text(json.dumps(snapshot, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp, self._cache_path)
+        except Exception:
+            pass
+
+    def _cache_title(self, url: str, title: str, video_id: str, thumb_url: str):
+        vid = video_id_from_url(url)
+        if not vid or vid != video_id or not title or title == "Unknown Title":
+            return
+        with self._lock:
+            # Re-insert so dict order stays oldest-first for trimming
+            self._title_cache.pop(vid, None)
+            self._title_cache[vid] = {"title": title, "thumbnail": thumb_url}
+            while len(self._title_cache) > TITLE_CACHE_MAX:
+                del self._title_cache[next(iter(self._title_cache))]
+            self._cache_dirty = True
+
+    def _emit_cached(self, url: str) -> bool:
+        vid = video_id_from_url(url)
+        with self._lock:
+            hit = self._title_cache.get(vid) if vid else None
+        if not hit:
+            return False
+        self.started_one.emit(url)
+        self.metadata_fetched.emit(url, hit["title"], vid, hit.get("thumbnail", ""), False)
+        self.title_fetched.emit(url, hit["title"])
+        with self._lock:
+            self._pending.discard(url)
+        self.finished_one.emit(url)
+        return True
 
     def _fetch_one(self, url: str):
         """
@@ -103,7 +239,7 @@ class TitleFetchQueue(QObject):
         # yt-dlp cannot handle open.spotify.com URLs and will be blocked.
         # Emit a placeholder title so the item appears in the queue;
         # SpotDLWorker will handle the actual download.
-        if re.search(r"https?://(open\.)?spotify\.com/", url, re.IGNORECASE):
+        if _SPOTIFY_RE.search(url):
             m = re.search(r"spotify\.com/(?:[a-z-]+/)?([a-z]+)/", url, re.IGNORECASE)
             kind = m.group(1).capitalize() if m else "Link"
             title = f"Spotify {kind}"
@@ -111,6 +247,106 @@ class TitleFetchQueue(QObject):
             self.title_fetched.emit(url, title)
             return
 
+        result = self._run_ytdlp([url], ["--print-json"])
+        if result is None:
+            return
+        returncode, stdout, stderr = result
+
+        if returncode != 0:
+            msg = (stderr or "yt-dlp returned an error").strip()
+            self.error.emit(url, msg)
+            return
+
+        output = stdout.strip()
+        if not output:
+            self.error.emit(url, "No metadata received from yt-dlp")
+            return
+
+        infos: List[dict[str, Any]] = []
+        for line in (l for l in output.splitlines() if l.strip()):
+            try:
+                infos.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+
+        if not infos:
+            self.error.emit(url, "Failed to parse metadata: no valid JSON objects")
+            return
+
+        is_playlist = any(
+            ("entries" in info) or ("playlist_index" in info) or ("playlist_title" in info)
+            for info in infos
+        )
+
+        playlist_title = None
+        for info in infos:
+            pt = info.get("playlist_title")
+            if pt:
+                playlist_title = pt
+                break
+
+        representative = infos[0]
+        video_id = representative.get("id") or ""
+        thumb_url = representative.get("thumbnail") or ""
+        title = playlist_title if (is_playlist and playlist_title) else (representative.get("title") or "Unknown Title")
+
+        if not is_playlist:
+            self._cache_title(url, title, video_id, thumb_url)
+
+        # Emit in the same order your MainWindow expects
+        self.metadata_fetched.emit(url, title, video_id, thumb_url, is_playlist)
+        self.title_fetched.emit(url, title)
+
+    def _fetch_batch(self, urls: List[str]):
+        """
+        Look up several URLs with one yt-dlp process. --dump-single-json
+        prints one line per input URL (a whole flat playlist included), which
+        is matched back to its URL via original_url. URLs that produced no
+        line (failed, or unmatched) are retried alone so they report their
+        own error.
+        """
+        result = self._run_ytdlp(urls, ["--dump-single-json"])
+        if result is None:
+            return
+        _returncode, stdout, _stderr = result
+
+        by_url: dict[str, dict[str, Any]] = {}
+        for line in (l for l in stdout.splitlines() if l.strip()):
+            try:
+                info = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            key = info.get("original_url") or info.get("webpage_url")
+            if key:
+                by_url.setdefault(key, info)
+
+        for url in urls:
+            if self._stopping:
+                return
+            info = by_url.get(url)
+            if info is None:
+                self._fetch_one(url)
+                continue
+            entries = info.get("entries")
+            is_playlist = info.get("_type") == "playlist" or entries is not None
+            # Match _fetch_one: a playlist is shown by its title but keyed to
+            # its first entry's id/thumbnail.
+            representative = (entries[0] if entries else info) if is_playlist else info
+            video_id = representative.get("id") or ""
+            thumb_url = representative.get("thumbnail") or info.get("thumbnail") or ""
+            title = info.get("title") or "Unknown Title"
+            if not is_playlist:
+                self._cache_title(url, title, video_id, thumb_url)
+            self.metadata_fetched.emit(url, title, video_id, thumb_url, is_playlist)
+            self.title_fetched.emit(url, title)
+
+    def _run_ytdlp(self, urls: List[str], print_args: List[str]):
+        """
+        Run one metadata-only yt-dlp process for urls and return
+        (returncode, stdout, stderr), or None after emitting an error for
+        each URL if it could not run to completion.
+        """
+        url = urls[0]
         yt_dlp_path: Path = self.settings.YT_DLP_PATH
         ffmpeg_dir: Path = self.settings.FFMPEG_PATH.parent
         cookies_path: Path = self.settings.COOKIES_PATH
@@ -119,27 +355,28 @@ class TitleFetchQueue(QObject):
         # Attempt to refresh cookies if configured
         try:                                      
             if getattr(self.settings, "COOKIES_AUTO_REFRESH", False) and getattr(self.settings, "COOKIES_FROM_BROWSER", ""):
-                ok, msg = CookieManager.refresh_before_download(self.settings)
-                if ok:
-                    # Ensure cookies_path variable points to exported file; update settings and persist timestamp
-                    try:
-                        exported_path = getattr(self.settings, "COOKIES_PATH", None)
-                        if not exported_path or str(exported_path) == "":
-                            exported_path = Path(getattr(self.settings, "BASE_DIR", Path("."))) / "cookies.txt"
-                        # update runtime settings
-                        self.settings.COOKIES_PATH = Path(exported_path)
-                        from datetime import datetime
-                        ts = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S UTC")
-                        self.settings.COOKIES_LAST_IMPORTED = ts
-                        if hasattr(self.settings, "save_config"):
-                            self.settings.save_config()
-                        # reflect change locally for this function
-                        cookies_path = getattr(self.settings, "COOKIES_PATH", cookies_path)
-                    except Exception:
-                        cookies_path = getattr(self.settings, "COOKIES_PATH", cookies_path)
-                else:
-                    # notify but proceed
-                    self.error.emit(url, f"Cookies refresh: {msg}")                  
+                with self._cookies_lock:
+                    ok, msg = CookieManager.refresh_before_download(self.settings)
+                    if ok:
+                        # Ensure cookies_path variable points to exported file; update settings and persist timestamp
+                        try:
+                            exported_path = getattr(self.settings, "COOKIES_PATH", None)
+                            if not exported_path or str(exported_path) == "":
+                                exported_path = Path(getattr(self.settings, "BASE_DIR", Path("."))) / "cookies.txt"
+                            # update runtime settings
+                            self.settings.COOKIES_PATH = Path(exported_path)
+                            from datetime import datetime
+                            ts = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S UTC")
+                            self.settings.COOKIES_LAST_IMPORTED = ts
+                            if hasattr(self.settings, "save_config"):
+                                self.settings.save_config()
+                            # reflect change locally for this function
+                            cookies_path = getattr(self.settings, "COOKIES_PATH", cookies_path)
+                        except Exception:
+                            cookies_path = getattr(self.settings, "COOKIES_PATH", cookies_path)
+                    else:
+                        # notify but proceed
+                        self.error.emit(url, f"Cookies refresh: {msg}")                  
         except Exception:
             # swallow so metadata fetching still proceeds
             pass
@@ -148,10 +385,9 @@ class TitleFetchQueue(QObject):
             str(yt_dlp_path),
             "--ffmpeg-location", str(ffmpeg_dir),
             "--skip-download",
-            "--print-json",
+            *print_args,
             "--ignore-errors",
             "--flat-playlist",
-            url,
         ]
 
         # Cookies: prefer --cookies-from-browser if configured, else cookie file
@@ -204,66 +440,43 @@ class TitleFetchQueue(QObject):
             except Exception:
                 pass
 
-        # run subprocess and capture raw bytes
+        # run subprocess and capture raw bytes; tracked so stop() can kill it
+        timeout = FETCH_TIMEOUT + BATCH_TIMEOUT_PER_URL * (len(urls) - 1)
         try:
-            proc = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=False,          # read raw bytes
-                check=False,
-                timeout=120,
+            proc = subprocess.Popen(
+                cmd + urls,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
                 startupinfo=startupinfo,
                 env=env,
             )
+        except Exception as e:
+            for u in urls:
+                self.error.emit(u, f"Unexpected error: {e}")
+            return None
+        with self._lock:
+            self._procs.add(proc)
+        try:
+            out, err = proc.communicate(timeout=timeout)
         except subprocess.TimeoutExpired:
-            self.error.emit(url, "Timeout while fetching metadata (120 seconds)")
-            return
+            proc.kill()
+            proc.communicate()
+            for u in urls:
+                self.error.emit(u, f"Timeout while fetching metadata ({timeout} seconds)")
+            return None
         except Exception as e:
-            self.error.emit(url, f"Unexpected error: {e}")
-            return
+            for u in urls:
+                self.error.emit(u, f"Unexpected error: {e}")
+            return None
+        finally:
+            with self._lock:
+                self._procs.discard(proc)
+        if self._stopping:
+            return None
 
         # decode safely with replacement for invalid bytes
-        stdout = (proc.stdout or b"").decode("utf-8", errors="replace")
-        stderr = (proc.stderr or b"").decode("utf-8", errors="replace")
-
-        if proc.returncode != 0:
-            msg = (stderr or "yt-dlp returned an error").strip()
-            self.error.emit(url, msg)
-            return
-
-        output = stdout.strip()
-        if not output:
-            self.error.emit(url, "No metadata received from yt-dlp")
-            return
-
-        infos: List[dict[str, Any]] = []
-        for line in (l for l in output.splitlines() if l.strip()):
-            try:
-                infos.append(json.loads(line))
-            except json.JSONDecodeError:
-                continue
-
-        if not infos:
-            self.error.emit(url, "Failed to parse metadata: no valid JSON objects")
-            return
-
-        is_playlist = any(
-            ("entries" in info) or ("playlist_index" in info) or ("playlist_title" in info)
-            for info in infos
+        return (
+            proc.returncode,
+            (out or b"").decode("utf-8", errors="replace"),
+            (err or b"").decode("utf-8", errors="replace"),
         )
-
-        playlist_title = None
-        for info in infos:
-            pt = info.get("playlist_title")
-            if pt:
-                playlist_title = pt
-                break
-
-        representative = infos[0]
-        video_id = representative.get("id") or ""
-        thumb_url = representative.get("thumbnail") or ""
-        title = playlist_title if (is_playlist and playlist_title) else (representative.get("title") or "Unknown Title")
-
-        # Emit in the same order your MainWindow expects
-        self.metadata_fetched.emit(url, title, video_id, thumb_url, is_playlist)
-        self.title_fetched.emit(url, title)